@@ -1,10 +1,12 @@
 # Klasse für erleichterte Handhabung der Informationen für den Datenbankzugriff (Engine, Tabellenname, Datentypinformationen, Primärschlüssel, Attribute)
 import copy
+from flask.json.provider import DefaultJSONProvider
 from sqlalchemy import Engine
+from model.ResultClasses import ColumnarResult
 
 
 class TableMetaData:
-    def __init__(self, engine:Engine, table_name:str, primary_keys:list[str], data_type_info:dict[str:dict[str:str]], row_count:int):
+    def __init__(self, engine:Engine, table_name:str, primary_keys:list[str], data_type_info:dict[str:dict[str:str]], row_count:int, row_count_is_exact:bool = True):
         self.engine = engine
         self.table_name = table_name
         self.primary_keys = primary_keys
@@ -14,6 +16,9 @@ class TableMetaData:
         for key in data_type_info.keys():
             self.data_types.append(data_type_info[key]['data_type'])
         self.total_row_count = row_count
+        # Angabe, ob total_row_count exakt gezählt oder aus den Servertabellen geschätzt wurde; für Letzteres ggf. laufende Zählung im Hintergrund
+        self.row_count_is_exact = row_count_is_exact
+        self.exact_row_count_future = None
 
     def __copy__(self):
         """Erstellen einer Kopie des TableMetaData-Objektes"""
@@ -43,4 +48,12 @@ class TableMetaData:
             return self.data_type_info[column_name]['character_max_length']
         else:
             return None
-            
\ No newline at end of file
+
+
+class ColumnarJSONProvider(DefaultJSONProvider):
+    """JSON-Provider der Flask-Anwendung, der zusätzlich ColumnarResults (z. B. für den Jinja-Filter tojson und jsonify) umwandeln kann"""
+    @staticmethod
+    def default(o):
+        if isinstance(o, ColumnarResult):
+            return o.tolist()
+        return DefaultJSONProvider.default(o)
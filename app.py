@@ -1,14 +1,18 @@
-from flask import Flask, render_template, request, flash, redirect, session, url_for
+from argparse import ArgumentError
+from flask import Flask, jsonify, render_template, request, flash, redirect, session, url_for
 import os
 import re
+import threading
 from waitress import serve
-from ControllerClasses import TableMetaData
-from controllerFunctions import check_validity_of_input_and_searched_value, show_both_tables_separately, update_TableMetaData_entries
-from model.SQLDatabaseError import DatabaseError, DialectError
+from ControllerClasses import ColumnarJSONProvider, TableMetaData
+from controllerFunctions import build_export_response, build_merge_preview, check_validity_of_input_and_searched_value, execute_replacement, export_mimetypes, get_pagination_arguments, show_both_tables_separately, show_job_page, update_TableMetaData_entries
+from model.SQLDatabaseError import DatabaseError, DialectError, QueryError
+from model.jobModel import cancel_job, finished_job_states, get_job, submit_job
 from model.loginModel import register_new_user, login_user 
-from model.databaseModel import get_data_type_meta_data, connect_to_db, convert_result_to_list_of_lists, get_primary_key_from_engine, get_row_count_from_engine, list_all_tables_in_db_with_preview, get_full_table_ordered_by_primary_key
-from model.oneTableModel import get_replacement_information, get_row_number_of_affected_entries, get_unique_values_for_attribute, replace_all_string_occurrences, replace_some_string_occurrences, search_string, update_to_unify_entries
-from model.twoTablesModel import check_basic_data_type_compatibility, execute_merge_and_add_constraints, join_tables_of_different_dialects_dbs_or_servers, join_tables_of_same_dialect_on_same_server, simulate_merge_and_build_query
+from model.metricsModel import get_query_metrics, reset_query_metrics
+from model.databaseModel import connect_to_db, dispose_registered_engine, dispose_registered_engines, convert_result_to_list_of_lists, ensure_exact_row_count, get_cached_result, get_estimated_row_count, get_schema_meta_data, list_all_tables_in_db_with_preview, get_full_table_ordered_by_primary_key, get_table_page, start_exact_row_count
+from model.oneTableModel import get_live_search_result, get_replace_checkpoint, get_replacement_information, get_row_number_of_affected_entries, get_search_match_count, get_search_result_page, get_unique_values_for_attribute, search_match_modes, search_multiple_strings, start_search_match_count, stream_replacement_preview, stream_unify_preview, update_to_unify_entries
+from model.twoTablesModel import check_basic_data_type_compatibility, execute_merge_and_add_constraints, join_tables_of_different_dialects_dbs_or_servers, join_tables_of_same_dialect_on_same_server
 
 # globale Variablen für den Datenbankzugriff
 global engine_1
@@ -26,6 +30,11 @@ tables_in_use = 0 # 0: keine Tabelle ausgewählt, 1: eine Tabelle ausgewählt, 3
 global replacement_occurrence_dict
 global replacement_data_dict
 
+# Ergebnisse der jeweils letzten Suche während der Eingabe je Anwendungsbenutzer und Tabelle, die bei Erweiterung des Suchstrings im Speicher 
+# gefiltert werden; der Zugriff aus den Request-Threads erfolgt unter live_search_lock.
+live_search_results = {}
+live_search_lock = threading.Lock()
+
 # globales Dictionary für die Kompatibilitätsprüfung zur Anzeige der Operationen auf zwei Tabellen
 global compatibility_by_code
 compatibility_by_code = None
@@ -40,8 +49,15 @@ target_attribute = None
 query_parameters = None
 merge_query = None
 
+# maximale Anzahl der Tupel, die bei der serverseitigen Paginierung der Tabellenanzeige je Seite ausgegeben werden
+max_page_size = 1000
+# maximale Anzahl der Strings, die mit einer Anfrage an /batch-search gesucht werden können
+max_batch_search_terms = 100
+
 # Erstellen der Flask-Anwendung, die in __main__ gestartet wird; Festlegung der Ordner für die HTML-Dateien (template_folder) sowie JavaScript und CSS (static_folder)
 app = Flask(__name__, template_folder = 'view/templates', static_folder = 'view/static')
+# JSON-Provider, mit dem auch spaltenorientierte Abfrageergebnisse (ColumnarResult) an die Templates übergeben werden können
+app.json = ColumnarJSONProvider(app)
 
 ### Routen für das Setup der App ###
 
@@ -200,7 +216,7 @@ def select_tables_for_engine(engine_no:int):
             engine = engine_2
         # Beziehen der Tabellennamen und ihrer Attribute, der Tabellenvorschau und einer Liste der Tabellen ohne Primärschlüssel (Letztere können
         # in der App nicht sinnvoll verwendet werden).
-        tables, previews, tables_without_keys = list_all_tables_in_db_with_preview(engine)
+        tables, previews, tables_without_keys = list_all_tables_in_db_with_preview(engine, columnar = True)
         db_name = engine.url.database
         # Anzeige der Erfolgsmeldung für den Datenbankaufbau.
         flash(f'Verbindung zur Datenbank {db_name} aufgebaut.')
@@ -230,18 +246,19 @@ def select_tables():
     elif engine_no == 2:
         engine = engine_2
     # Für alle ausgewählten Tabellen werden eine Liste der Primärschlüsselattribute, die Datentypinformationen (Datentyp(gruppe), max. Zeichenanzahl etc.)
-    # und die Gesamttupelanzahl bezogen.
+    # - bei erneuter Auswahl aus dem Metadaten-Cache - und die Gesamttupelanzahl (bei großen Tabellen zunächst geschätzt) bezogen.
     for table_name in table_names:
-        primary_keys = get_primary_key_from_engine(engine, table_name)
-        data_type_info = get_data_type_meta_data(engine, table_name)
-        total_row_count = get_row_count_from_engine(engine, table_name)
+        primary_keys, data_type_info = get_schema_meta_data(engine, table_name)
+        total_row_count, row_count_is_exact = get_estimated_row_count(engine, table_name)
         # Anschließend wird das entsprechende TableMetaData-Objekt für den erleichterten Zugriff auf die Tabelle angelegt.
         # Bei tables_in_use = 0 liegt noch kein TableMetaData-Objekt vor.
         if tables_in_use == 0:
             # Daher wird der Zähler um 1 erhöht ...
             tables_in_use += 1
             # ... und das TableMetaData-Objekt für die erste Tabelle mit den zuvor bezogenen Metadaten angelegt.
-            meta_data_table_1 = TableMetaData(engine, table_name, primary_keys, data_type_info, total_row_count)
+            meta_data_table_1 = TableMetaData(engine, table_name, primary_keys, data_type_info, total_row_count, row_count_is_exact)
+            # Eine geschätzte Tupelanzahl wird im Hintergrund durch die exakte ersetzt.
+            start_exact_row_count(meta_data_table_1)
             # Aus diesem werden die Attributnamen bezogen, die für die Anzeige der Seite mit der Suchfunktion benötigt werden, falls nur eine Tabelle
             # ausgewählt wurde.
             columns = meta_data_table_1.columns
@@ -249,7 +266,8 @@ def select_tables():
         elif tables_in_use == 1:
             # Der Unterschied besteht darin, dass der Zähler um 2 erhöht wird.
             tables_in_use += 2
-            meta_data_table_2 = TableMetaData(engine, table_name, primary_keys, data_type_info, total_row_count)
+            meta_data_table_2 = TableMetaData(engine, table_name, primary_keys, data_type_info, total_row_count, row_count_is_exact)
+            start_exact_row_count(meta_data_table_2)
             columns = meta_data_table_2.columns
         # Steht der Zähler auf einem anderen Wert als 0 oder 1 (d. h. 3), wurden schon zwei Tabellen ausgewählt.
         else:
@@ -269,17 +287,189 @@ def select_tables():
             return redirect(url_for('show_db_login_page', engine_no = 2))
         # Wurde die Checkbox nicht angewählt, soll nur mit einer Tabelle gearbeitet werden.
         else:
-            # Daher werden der Datenbankname und alle Einträge dieser Tabelle bezogen ...
+            # Daher werden der Datenbankname bezogen und die Einträge dieser Tabelle seitenweise ...
             db_name = meta_data_table_1.engine.url.database
-            data = get_full_table_ordered_by_primary_key(meta_data_table_1)
-            # ... und auf der Seite der Suchfunktion angezeigt.
-            return render_template('search.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = columns, data = data, searched_string = '')  
+            data_url = url_for('get_table_data', table_no = 1)
+            # ... auf der Seite der Suchfunktion angezeigt.
+            return render_template('search.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = columns, data_url = data_url, searched_string = '')  
     # Wenn der Tabellenzähler auf 3 steht, wurden zwei Tabellen ausgewählt.
     elif tables_in_use == 3:
         # Daher erfolgt eine Weiterleitung zur Startseite der Vergleichsfunktion.
         return redirect(url_for('compare_two_tables'))
         
 
+# Route für die seitenweise Ausgabe der Tupel einer ausgewählten Tabelle als JSON, die von Grid.js im Server-Modus abgefragt wird. table_no (1 oder 2)
+# bezeichnet das zu verwendende TableMetaData-Objekt.
+@app.route('/table-data/<int:table_no>', methods = ['GET'])
+def get_table_data(table_no:int):
+    # Ohne Login keine Ausgabe von Tabellendaten
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    # Bestimmung des TableMetaData-Objekts der angefragten Tabelle, sofern diese bereits ausgewählt wurde
+    if table_no == 1 and tables_in_use in (1, 3):
+        table_meta_data = meta_data_table_1
+    elif table_no == 2 and tables_in_use == 3:
+        table_meta_data = meta_data_table_2
+    else:
+        return jsonify({'error': 'Die angefragte Tabelle wurde nicht ausgewählt.'}), 404
+    try:
+        # Beziehen der Paginierungs- und Sortierangaben aus den URL-Parametern
+        limit, last_key, sort_column, descending, offset = get_pagination_arguments(request.args, table_meta_data, max_page_size)
+        rows, next_key = get_table_page(table_meta_data, limit, last_key, sort_column, descending, offset)
+    except (ValueError, IndexError, QueryError) as error:
+        return jsonify({'error': str(error)}), 400
+    # Ausgabe der Tupel, der Gesamttupelanzahl für die Seitenanzeige und des Schlüssels für die nächste Seite
+    return jsonify({'rows': rows, 'total': ensure_exact_row_count(table_meta_data, wait = False), 'last_key': next_key})
+
+# Route für die seitenweise Ausgabe der Treffer einer Suche in der ausgewählten Tabelle als JSON (für die serverseitige Paginierung in Grid.js)
+@app.route('/search-data', methods = ['GET'])
+def get_search_data():
+    # Ohne Login keine Ausgabe von Tabellendaten
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    if tables_in_use not in (1, 3):
+        return jsonify({'error': 'Es wurde keine Tabelle ausgewählt.'}), 404
+    table_meta_data = meta_data_table_1
+    # Suchstring, zu durchsuchendes Attribut ('all' für alle Attribute) und Nutzung von Suchindizes aus den URL-Parametern
+    string_to_search = request.args.get('search', '')
+    column_name = request.args.get('column', 'all')
+    use_search_index = request.args.get('index') == '1'
+    # Suchmodus ('contains', 'prefix' oder 'exact') und Beachtung der Groß- und Kleinschreibung
+    match_mode = request.args.get('mode', 'contains')
+    case_sensitive = request.args.get('case') == '1'
+    if match_mode not in search_match_modes:
+        return jsonify({'error': f'Der Suchmodus {match_mode} wird nicht unterstützt.'}), 400
+    if column_name == 'all':
+        column_names = table_meta_data.columns
+    elif column_name in table_meta_data.columns:
+        column_names = [column_name]
+    else:
+        return jsonify({'error': f'Das Attribut {column_name} existiert nicht in der Tabelle {table_meta_data.table_name}.'}), 400
+    try:
+        limit, last_key, sort_column, descending, offset = get_pagination_arguments(request.args, table_meta_data, max_page_size)
+        # Eine exakte Trefferanzahl wird bei der Suche einmalig ermittelt und in der URL mitgegeben, damit sie nicht für jede Seite erneut gezählt wird.
+        total = request.args.get('total')
+        if total is not None:
+            total = int(total)
+        # Anderenfalls wird die exakte Anzahl im Hintergrund gezählt (bzw. die bei der Suche gestartete Zählung aus dem Ergebnis-Cache bezogen).
+        else:
+            count_future = get_cached_result(table_meta_data, 'search_count_future', (tuple(column_names), string_to_search, use_search_index, match_mode, case_sensitive), 
+                                             lambda: start_search_match_count(table_meta_data, string_to_search, column_names, use_search_index, match_mode, case_sensitive))
+            if count_future.done() and count_future.exception() is None:
+                total = count_future.result()
+        # Bis die Zählung abgeschlossen ist, wird ein Tupel mehr abgefragt, sodass die Paginierung nur bis zur jeweils nächsten Seite reicht, statt 
+        # einer (ggf. stark abweichenden) Schätzung zu folgen.
+        look_ahead = total is None
+        # Wiederholt abgerufene Seiten werden bis zur nächsten Änderung der Tabelle durch das Tool aus dem Ergebnis-Cache bezogen.
+        page_arguments = (tuple(column_names), string_to_search, limit, request.args.get('last'), sort_column, descending, offset, use_search_index, match_mode, case_sensitive, look_ahead)
+        page = get_cached_result(table_meta_data, 'search_page', page_arguments, lambda: get_search_result_page(table_meta_data, string_to_search, column_names, limit, last_key, sort_column, descending, offset, use_search_index, match_mode, case_sensitive, look_ahead))
+        if look_ahead:
+            rows, next_key, has_more = page
+            # Die Seite beginnt bei offset (die Paginierung übergibt diesen auch beim Blättern per Keyset); folgen weitere Treffer, wird die 
+            # Gesamtzahl so gewählt, dass genau eine weitere Seite angeboten wird.
+            total = (offset or 0) + len(rows) + (1 if has_more else 0)
+        else:
+            rows, next_key = page
+    except (ValueError, IndexError, QueryError) as error:
+        return jsonify({'error': str(error)}), 400
+    return jsonify({'rows': rows, 'total': total, 'last_key': next_key})
+
+# Route für die Suche während der Eingabe des Suchstrings; gibt höchstens live_search_limit Treffer als JSON aus
+@app.route('/live-search', methods = ['GET'])
+def search_while_typing():
+    # Ohne Login keine Ausgabe von Tabellendaten
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    if tables_in_use not in (1, 3):
+        return jsonify({'error': 'Es wurde keine Tabelle ausgewählt.'}), 404
+    table_meta_data = meta_data_table_1
+    # Suchstring und zu durchsuchendes Attribut ('all' für alle Attribute) aus den URL-Parametern
+    string_to_search = request.args.get('search', '')
+    column_name = request.args.get('column', 'all')
+    if column_name == 'all':
+        column_names = table_meta_data.columns
+    elif column_name in table_meta_data.columns:
+        column_names = [column_name]
+    else:
+        return jsonify({'error': f'Das Attribut {column_name} existiert nicht in der Tabelle {table_meta_data.table_name}.'}), 400
+    # Das vorige Ergebnis stammt aus der letzten Suche desselben Benutzers in derselben Tabelle.
+    result_key = (session['username'], table_meta_data.table_name)
+    with live_search_lock:
+        previous_result = live_search_results.get(result_key)
+    try:
+        # Erweitert der Suchstring den vorigen, werden dessen Treffer im Speicher gefiltert, sofern sie vollständig sind.
+        live_search_result = get_live_search_result(table_meta_data, string_to_search, column_names, previous_result)
+    except (DialectError, QueryError) as error:
+        return jsonify({'error': str(error)}), 400
+    with live_search_lock:
+        live_search_results[result_key] = live_search_result
+    return jsonify({'rows': live_search_result['rows'], 'complete': live_search_result['complete'], 'from_memory': live_search_result['from_memory']})
+
+# Route für die Suche nach mehreren Strings (URL-Parameter term, mehrfach angegeben) in einem Durchlauf; gibt die Treffer und je Treffer die 
+# gefundenen Strings mit den Attributen, in denen sie vorkommen, als JSON aus
+@app.route('/batch-search', methods = ['GET'])
+def search_multiple_entries():
+    # Ohne Login keine Ausgabe von Tabellendaten
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    if tables_in_use not in (1, 3):
+        return jsonify({'error': 'Es wurde keine Tabelle ausgewählt.'}), 404
+    table_meta_data = meta_data_table_1
+    strings_to_search = [string for string in request.args.getlist('term') if string != '']
+    column_name = request.args.get('column', 'all')
+    if len(strings_to_search) == 0:
+        return jsonify({'error': 'Bitte geben Sie mindestens einen Suchbegriff an.'}), 400
+    elif len(strings_to_search) > max_batch_search_terms:
+        return jsonify({'error': f'Es können höchstens {max_batch_search_terms} Suchbegriffe gleichzeitig gesucht werden.'}), 400
+    if column_name == 'all':
+        column_names = table_meta_data.columns
+    elif column_name in table_meta_data.columns:
+        column_names = [column_name]
+    else:
+        return jsonify({'error': f'Das Attribut {column_name} existiert nicht in der Tabelle {table_meta_data.table_name}.'}), 400
+    try:
+        # Wiederholte Anfragen werden bis zur nächsten Änderung der Tabelle durch das Tool aus dem Ergebnis-Cache beantwortet.
+        rows, matches = get_cached_result(table_meta_data, 'batch_search', (tuple(column_names), tuple(strings_to_search)), 
+                                          lambda: search_multiple_strings(table_meta_data, strings_to_search, column_names))
+    # Nur ungültige Angaben werden als fehlerhafte Anfrage beantwortet; Datenbank- und Verbindungsfehler werden nicht abgefangen.
+    except (ArgumentError, DialectError, QueryError) as error:
+        return jsonify({'error': str(error)}), 400
+    return jsonify({'columns': table_meta_data.columns, 'rows': rows, 'matches': matches})
+
+# Route für die Ausgabe der Kennzahlen zu den an die Datenbanken gesendeten Anweisungen (Anzahl, Laufzeitperzentile, Tupelanzahl) als JSON
+@app.route('/metrics', methods = ['GET'])
+def show_query_metrics():
+    # Ohne Login keine Ausgabe der Kennzahlen
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    metrics = get_query_metrics()
+    # Mit dem URL-Parameter reset=1 werden die Kennzahlen nach der Ausgabe zurückgesetzt, z. B. für die Messung einzelner Operationen.
+    if request.args.get('reset') == '1':
+        reset_query_metrics()
+    return jsonify({'queries': metrics})
+
+# Route für die Abfrage des Zustands eines Hintergrundauftrags (Ersetzen, Vereinheitlichen, Attributübertragung) als JSON
+@app.route('/jobs/<job_id>', methods = ['GET'])
+def get_job_state(job_id:str):
+    # Ohne Login keine Ausgabe
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    # Es werden nur Aufträge des angemeldeten Anwendungsbenutzers ausgegeben.
+    job = get_job(job_id, session['username'])
+    if job is None:
+        return jsonify({'error': 'Der Auftrag existiert nicht.'}), 404
+    return jsonify({'id': job['id'], 'name': job['name'], 'state': job['state'], 'progress': job['progress'], 'total': job['total'], 
+                    'cancellable': job['cancellable'], 'error': job['error']})
+
+# Route für die Anforderung des Abbruchs eines Hintergrundauftrags
+@app.route('/jobs/<job_id>/cancel', methods = ['POST'])
+def cancel_background_job(job_id:str):
+    # Ohne Login kein Abbruch
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    return jsonify({'cancel_requested': cancel_job(job_id, session['username'])})
+
+
 ##### Routen für die Operationen auf einer Tabelle #####
  
 # Route für die Suche von Strings in Tabellen
@@ -302,34 +492,59 @@ def search_entries():
     table_columns = meta_data_table_1.columns
     # Anlegen des Suchstrings
     searched_string = ''
-    # Beziehen aller Einträge der aktuellen Tabelle
-    full_table = get_full_table_ordered_by_primary_key(meta_data_table_1)
-    data = []
+    # URL für die seitenweise Anzeige aller Einträge der aktuellen Tabelle
+    full_table_url = url_for('get_table_data', table_no = 1)
+    data_url = None
+    use_search_index = False
+    # Suchmodus und Beachtung der Groß- und Kleinschreibung
+    match_mode = 'contains'
+    case_sensitive = False
+    # Anzahl der Treffer und Angabe, ob es sich um eine Schätzung handelt
+    match_count = None
+    match_count_is_exact = True
     # Bei einem Aufruf per GET-Request werden alle Einträge der aktuellen Tabelle angezeigt.
     if request.method == 'GET':
-        data = full_table
+        data_url = full_table_url
     # Bei einem Aufruf per POST-Request ...
     elif request.method == 'POST':
-        # ... wird der Name des zu durchsuchenden Attributs aus dem Request bezogen.
+        # ... wird bezogen, ob die Suche über vorhandene Suchindizes erfolgen soll, ...
+        use_search_index = request.form.get('use-search-index') == 'on'
+        # ... in welchem Modus und ob unter Beachtung der Groß- und Kleinschreibung gesucht werden soll ...
+        match_mode = request.form.get('match-mode', 'contains')
+        if match_mode not in search_match_modes:
+            match_mode = 'contains'
+        case_sensitive = request.form.get('case-sensitive') == 'on'
+        # ... und der Name des zu durchsuchenden Attributs aus dem Request bezogen.
         column_name = request.form['column-to-search']
         # Lautet dieser 'all', sollen alle Spalten nach dem eingegebenen String durchsucht werden.
         if column_name == 'all':
             # Daher entsprechen die bei der SQL-Abfrage berücksichtigten Attribute der Attributliste des TableMetaData-Objekts der aktuellen Tabelle.
             column_names = meta_data_table_1.columns
         else:
-            # Anderenfalls wird der aus dem Request bezogene Attributname in eine Liste mit nur einem Eintrag erwartet, da search_string eine Liste 
-            # als Parameter erfordert.
+            # Anderenfalls wird der aus dem Request bezogene Attributname in eine Liste mit nur einem Eintrag erwartet, da die Suchfunktionen eine Liste 
+            # als Parameter erfordern.
             column_names = [column_name]
         # Beziehen des zu suchenden Strings aus dem Request
         string_to_search = request.form['search-string']
         # Ist dieser leer, wird die volle Tabelle angezeigt.
         if string_to_search == '':
-            data = full_table
+            data_url = full_table_url
         else:
-            # Anderenfalls wird die Suche nach dem String per SQL-Abfrage in der Datenbank ausgeführt.
-            data = search_string(meta_data_table_1, string_to_search, column_names)
+            # Anderenfalls wird zunächst die (bei großen Trefferzahlen geschätzte) Anzahl der Treffer ermittelt. Die Treffer selbst werden 
+            # anschließend seitenweise über /search-data abgefragt, sodass die erste Seite sofort angezeigt werden kann.
+            # Bei wiederholten Suchen wird sie bis zur nächsten Änderung der Tabelle durch das Tool aus dem Ergebnis-Cache bezogen.
+            match_count, match_count_is_exact = get_cached_result(meta_data_table_1, 'search_count_estimate', (tuple(column_names), string_to_search, use_search_index, match_mode, case_sensitive), 
+                                                                  lambda: get_search_match_count(meta_data_table_1, string_to_search, column_names, estimate = True, use_search_index = use_search_index, match_mode = match_mode, case_sensitive = case_sensitive))
+            # Nur eine exakte Anzahl wird für die Paginierung übernommen; eine Schätzung dient nur der Anzeige, während die exakte Anzahl bereits 
+            # im Hintergrund gezählt wird (siehe /search-data).
+            if match_count_is_exact:
+                data_url = url_for('get_search_data', search = string_to_search, column = column_name, index = int(use_search_index), mode = match_mode, case = int(case_sensitive), total = match_count)
+            else:
+                get_cached_result(meta_data_table_1, 'search_count_future', (tuple(column_names), string_to_search, use_search_index, match_mode, case_sensitive), 
+                                  lambda: start_search_match_count(meta_data_table_1, string_to_search, column_names, use_search_index, match_mode, case_sensitive))
+                data_url = url_for('get_search_data', search = string_to_search, column = column_name, index = int(use_search_index), mode = match_mode, case = int(case_sensitive))
     # Anzeige der Seite mit der Suchfunktion
-    return render_template('search.html', user_name = user_name, db_name = db_name, table_name = table_name, string_to_search = searched_string, table_columns = table_columns, data = data)
+    return render_template('search.html', user_name = user_name, db_name = db_name, table_name = table_name, string_to_search = searched_string, table_columns = table_columns, data_url = data_url, use_search_index = use_search_index, match_mode = match_mode, case_sensitive = case_sensitive, match_count = match_count, match_count_is_exact = match_count_is_exact, full_table_url = full_table_url)
 
 ### Routen für die Funktion 'Suchen und Ersetzen' ###
 
@@ -345,10 +560,27 @@ def search_and_replace_entries():
     db_name = engine_1.url.database
     table_name = meta_data_table_1.table_name
     table_columns = meta_data_table_1.columns
-    # Bei einem GET-Request wird die volle Tabelle nach Primärschlüsseln geordnet aus der Datenbank bezogen und angezeigt.
+    # Bei einem GET-Request wird die volle Tabelle nach Primärschlüsseln geordnet seitenweise aus der Datenbank bezogen und angezeigt.
     if request.method == 'GET':
-        data = get_full_table_ordered_by_primary_key(meta_data_table_1)
-        return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data = data)
+        data = None
+        data_url = url_for('get_table_data', table_no = 1)
+        # Nach dem Ende eines Ersetzungsauftrags wird dessen Ergebnis angezeigt.
+        if 'job' in request.args:
+            job = get_job(request.args['job'], user_name)
+            if job is not None:
+                # Noch laufende Aufträge werden weiter abgefragt.
+                if job['state'] not in finished_job_states:
+                    return show_job_page(job['id'], 'Ersetzen', url_for('search_and_replace_entries', job = job['id']), user_name)
+                # Bei Erfolg wird die Meldung des Auftrags und ggf. die aktualisierte Tabelle angezeigt, ...
+                if job['state'] == 'done':
+                    flash(job['result']['message'])
+                    data = job['result']['data']
+                    if data is not None:
+                        data_url = None
+                # ... anderenfalls die Fehlermeldung mit der vollen Tabelle.
+                else:
+                    flash(job['error'])
+        return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data = data, data_url = data_url)
     # Bei einem POST-Request wird der zuvor über die Vorschau bestätigte Ersetzungsvorgang ausgeführt.
     elif request.method == 'POST':
         # Bereitstellung des globalen Dictionarys zur Identifizierung der zu ersetzenden Vorkommen
@@ -362,6 +594,10 @@ def search_and_replace_entries():
         column_names = request.form['affected-attributes'].removeprefix('[').removesuffix(']').replace('\'', '').split(', ')
         # Beziehen der Nummern der Vorkommen des Suchstrings, die verändert werden sollen
         affected_occurrences = request.form.getlist('selection')
+        # Eine unterbrochene abschnittsweise Ersetzung wird nur fortgesetzt, wenn dies in der Vorschau ausdrücklich gewählt wurde.
+        resume = 'resume-replacement' in request.form
+        data = None
+        data_url = None
         # Anzahl aller Vorkommen zur Anzeige in der Statistik unter der Tabelle
         total_occurrences = len(replacement_occurrence_dict)
         # Erstellen einer Kopie des Dictionarys mit den Vorkommen des gesuchten Wertes, damit die nicht ausgewählten Werte hieraus entfernt werden können
@@ -370,36 +606,27 @@ def search_and_replace_entries():
         for key in replacement_occurrence_dict.keys():
             if str(key) not in affected_occurrences:
                 occurrences_to_change.pop(key)
-        # Wenn die Anzahl der ausgewählten Vorkommen der Anzahl aller Vorkommen des Strings entspricht, ...
-        if len(occurrences_to_change.keys()) == total_occurrences:
-            try:
-                # ... sollen alle Vorkommen ersetzt werden.
-                data = replace_all_string_occurrences(meta_data_table_1, column_names, string_to_replace, replacement_string, commit=True)
-            # Die Meldungen zu hierbei auftretenden Fehlern werden gespeichert.
-            except Exception as error:
-                message = str(error)
-            # Funktioniert der Vorgang, wird eine Erfolgsmeldung erstellt.
-            else:
-                message = f'Alle {total_occurrences} Ersetzungen wurden erfolgreich vorgenommen.'
         # Wenn keine Vorkommen ausgewählt wurden, wird wieder die volle Tabelle angezeigt, mit einem Hinweis, dass keine Ersetzungen vorgenommen wurden.
-        elif len(occurrences_to_change.keys()) == 0:
-            data = get_full_table_ordered_by_primary_key(meta_data_table_1)
+        if len(occurrences_to_change.keys()) == 0:
+            replacement_occurrence_dict = None
+            data_url = url_for('get_table_data', table_no = 1)
             message = 'Es wurden keine Einträge ausgewählt, daher wurde nichts verändert.'
-        # Anderenfalls sollen nur einige ausgewählte Vorkommen des Suchstrings ersetzt werden.
         else:
-            # Einfügen der Primärschlüsselattribute in das Dictionary der einzufügenden Werte, damit diese an die Funktion replace_some_string_occurrences
-            # übergeben werden können. Der Zähler für die Vorkommen des gesuchten Wertes beginnt bei 1.
-            occurrences_to_change[0] = {'primary_keys': meta_data_table_1.primary_keys}
-            # Ausführen der Ersetzung und Übernahme der dabei ausgegebenen Meldung
-            message = replace_some_string_occurrences(meta_data_table_1, occurrences_to_change, string_to_replace, replacement_string, commit=True)
-            # Anschließend wird die volle aktualisiert Tabelle bezogen.
-            data = get_full_table_ordered_by_primary_key(meta_data_table_1)
-        ### Zurücksetzen des Dictionarys mit den zu ersetzenden Vorkommen ###
-        replacement_occurrence_dict = None
+            # Wenn die Anzahl der ausgewählten Vorkommen der Anzahl aller Vorkommen des Strings entspricht, sollen alle Vorkommen ersetzt werden.
+            replace_all = len(occurrences_to_change.keys()) == total_occurrences
+            # Anderenfalls werden die Primärschlüsselattribute in das Dictionary der einzufügenden Werte eingefügt, damit diese an die Funktion 
+            # replace_some_string_occurrences übergeben werden können. Der Zähler für die Vorkommen des gesuchten Wertes beginnt bei 1.
+            if not replace_all:
+                occurrences_to_change[0] = {'primary_keys': meta_data_table_1.primary_keys}
+            # Die Ersetzung wird als Hintergrundauftrag ausgeführt, dessen Ergebnis nach seinem Ende per GET-Request angezeigt wird.
+            job_id = submit_job('replace', execute_replacement, (meta_data_table_1, column_names, string_to_replace, replacement_string, occurrences_to_change, replace_all, resume and replace_all), owner = user_name)
+            ### Zurücksetzen des Dictionarys mit den zu ersetzenden Vorkommen ###
+            replacement_occurrence_dict = None
+            return show_job_page(job_id, 'Ersetzen', url_for('search_and_replace_entries', job = job_id), user_name)
         # Ausgabe der Meldung
         flash(message)
         # Anzeige der Startseite der Ersetzungsfunktion
-        return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data = data)
+        return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data = data, data_url = data_url)
 
 # Route für die Anzeige der Vorschau für das Ersetzen von (Teil-)Strings
 @app.route('/replace-preview', methods = ['GET', 'POST'])
@@ -414,8 +641,7 @@ def select_entries_to_update():
     table_columns = meta_data_table_1.columns
     # /replace-preview kann nicht über GET-Requests aufgerufen werden
     if request.method == 'GET':
-        data = get_full_table_ordered_by_primary_key(meta_data_table_1, convert = False)
-        return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data = data)
+        return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data_url = url_for('get_table_data', table_no = 1))
     elif request.method == 'POST':
         # neu einzusetzender String
         input = request.form['replacement']
@@ -468,15 +694,15 @@ def select_entries_to_update():
                     affected_attributes.remove(attribute_to_ignore)
                     # ... und die Fehlermeldung zur späteren Ausgabe gespeichert.
                     message += validity
-        # Volle Tabelle vor der Änderung
-        unchanged_data = get_full_table_ordered_by_primary_key(meta_data_table_1)
+        # URL für die seitenweise Anzeige der vollen Tabelle vor der Änderung
+        unchanged_data_url = url_for('get_table_data', table_no = 1)
         # Wenn nach dem Durchlaufen dieser Schleife nur Nullen in dieser Liste stehen, ist der eingegebene Wert mit keinem der zu durchsuchenden
         # Attribute kompatibel oder in den kompatiblen Spalten wurden keine passenden Einträge gefunden, ...
         if sum(attribute_list) == 0:
             # ... daher wird dies als Fehlermeldung ausgegeben ...
             flash(f'Der eingegebene Wert \'{input}\' ist nicht mit allen Datentypen und/oder Constraints der ausgewählten Spalten kompatibel und in den verbleibenden Spalten wurden keine passenden Einträge gefunden. Bitte versuchen Sie es erneut.')
             # ... und der Nutzer wird zur Startseite der Suchen-und-Ersetzen-Funktion weitergeleitet.
-            return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data = unchanged_data)
+            return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data_url = unchanged_data_url)
         # Steht noch mindestens eine Eins in attribute_list, ist der eingegebene Wert mit mindestens einem durchsuchten Attribut kompatibel, jedoch
         # wurden manche Attribute aus der Suche ausgeschlossen. Hier wird ermittelt, welche Nachricht/Fehlermeldung hierzu ausgegeben werden soll.
         elif sum(attribute_list) < len(attribute_list):
@@ -491,26 +717,52 @@ def select_entries_to_update():
         global replacement_occurrence_dict
         # Versuche, die Änderungsdaten je Tabellenzeile (Zeilennummer, die alten Werte, die Änderungspositionen und die neuen Werte in 
         # replacement_data_dict) sowie je betroffener Tabellenzelle (Zeilennumer, Primärschlüssel, Spaltenname in replacement_occurrence_dict)
-        # aus der Datenbank zu beziehen.
+        # aus der Datenbank bzw. (bei wiederholter Vorschau ohne zwischenzeitliche Änderung der Tabelle durch das Tool) aus dem Ergebnis-Cache zu beziehen.
         try:
-            replacement_data_dict, replacement_occurrence_dict = get_replacement_information(meta_data_table_1, attributes_and_positions, string_to_search, input) 
+            replacement_data_dict, replacement_occurrence_dict = get_cached_result(meta_data_table_1, 'replacement_information', (tuple(attributes_and_positions), string_to_search, input), 
+                                                                                   lambda: get_replacement_information(meta_data_table_1, attributes_and_positions, string_to_search, input))
         # Falls dabei Fehler auftreten, ...
         except Exception as error:
             flash(str(error))
             # ... und der Nutzer zur Startseite der Suchen-und-Ersetzen-Funktion weitergeleitet.
-            return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data = unchanged_data)
+            return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data_url = unchanged_data_url)
         # Falls keine Fehler auftreten, ...
         else:
             # ... das Ergebnis jedoch leer ist, ...
             if len(replacement_data_dict.values()) == 0:
                 # ... wird dies auf der Webseite angezeigt.
                 flash('Keine passenden Einträge gefunden.')
-                return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data = unchanged_data)
+                return render_template('replace.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, data_url = unchanged_data_url)
             else:
+                # Besteht eine unterbrochene abschnittsweise Ersetzung mit denselben Werten, kann sie in der Vorschau fortgesetzt werden.
+                can_resume = get_replace_checkpoint(meta_data_table_1, affected_attributes, string_to_search, input) is not None
                 # Anderenfalls werden die Meldungen für den Ausschluss von Attributen angezeigt ...
                 flash(message)
                 # ... und mithilfe der gewonnenen Daten wird unter localhost:8000/replace-preview die Vorschau erstellt.
-                return render_template('replace-preview.html', user_name = user_name, db_name = db_name, table_name = table_name, occurrence_dict = replacement_occurrence_dict, table_columns = table_columns, string_to_replace = string_to_search, replacement_string = input, replacement_data_dict = replacement_data_dict, affected_attributes = affected_attributes)
+                return render_template('replace-preview.html', user_name = user_name, db_name = db_name, table_name = table_name, occurrence_dict = replacement_occurrence_dict, table_columns = table_columns, string_to_replace = string_to_search, replacement_string = input, replacement_data_dict = replacement_data_dict, affected_attributes = affected_attributes, can_resume = can_resume)
+
+# Route für den Export der Ersetzungsvorschau als CSV- oder NDJSON-Datei; die betroffenen Tupel werden nach Primärschlüsseln geordnet blockweise 
+# aus der Datenbank bezogen und sofort an den Browser gesendet, ohne dass die Vorschau vollständig im Speicher aufgebaut wird.
+@app.route('/replace-preview/export', methods = ['GET'])
+def export_replacement_preview():
+    # Ohne Login kein Export
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    if tables_in_use not in (1, 3):
+        return jsonify({'error': 'Es wurde keine Tabelle ausgewählt.'}), 404
+    export_format = request.args.get('format', 'csv')
+    if export_format not in export_mimetypes.keys():
+        return jsonify({'error': f'Das Exportformat {export_format} wird nicht unterstützt.'}), 400
+    # Die betroffenen Attribute werden wie in der Vorschau als wiederholter URL-Parameter übergeben.
+    affected_attributes = request.args.getlist('attribute')
+    for attribute in affected_attributes:
+        if attribute not in meta_data_table_1.columns:
+            return jsonify({'error': f'Das Attribut {attribute} existiert nicht in der Tabelle {meta_data_table_1.table_name}.'}), 400
+    try:
+        column_names, batches = stream_replacement_preview(meta_data_table_1, affected_attributes, request.args.get('searchstring', ''), request.args.get('replacement', ''))
+    except Exception as error:
+        return jsonify({'error': str(error)}), 400
+    return build_export_response(column_names, batches, export_format, f'{meta_data_table_1.table_name}_Ersetzungsvorschau')
 
 
 ### Routen für das Vereinheitlichen von Datenbankeinträgen ###
@@ -527,12 +779,17 @@ def unify_db_entries():
     table_name = meta_data_table_1.table_name
     table_columns = meta_data_table_1.columns
     primary_keys = meta_data_table_1.primary_keys
-    if request.method == 'GET':
-        data = get_full_table_ordered_by_primary_key(meta_data_table_1)
+    # Die volle Tabelle wird sowohl bei GET- als auch bei POST-Requests seitenweise angezeigt.
+    data_url = url_for('get_table_data', table_no = 1)
+    # Nach dem Ende eines Vereinheitlichungsauftrags wird dessen Fehler- oder Erfolgsmeldung ausgegeben.
+    if request.method == 'GET' and 'job' in request.args:
+        job = get_job(request.args['job'], user_name)
+        if job is not None:
+            # Noch laufende Aufträge werden weiter abgefragt.
+            if job['state'] not in finished_job_states:
+                return show_job_page(job['id'], 'Vereinheitlichen', url_for('unify_db_entries', job = job['id']), user_name)
+            flash('Änderungen erfolgreich durchgeführt.' if job['state'] == 'done' else job['error'])
     elif request.method == 'POST':
-        
-        # Anlegen der Nachricht, die auf der als Nächstes geladenen Seite der App ausgegeben wird
-        message = ''
         # Beziehen des für die Vereinheitlichung ausgewählten Attributs aus dem Request
         attribute_to_change = request.form['column-to-unify']
         # Beziehen der zu vereinheitlichenden Werte aus dem Request
@@ -540,21 +797,11 @@ def unify_db_entries():
         old_values = request.form['old-values'].replace('[', '').replace(']', '').replace('\'', '').replace('\\\\', '\\').split(', ')
         # Beziehen des einzusetzenden, vereinheitlichten Wertes aus dem Request
         new_value = request.form['new-value']
-        # Durchführung der Datenbankaktualisierung
-        try:
-            update_to_unify_entries(meta_data_table_1, attribute_to_change, old_values, new_value, True)
-        # Hierbei auftretende Fehler werden als Meldung übernommen.
-        except Exception as error:
-            message = str(error)
-        # Anderenfalls wird eine Erfolgsmeldung festgelegt.
-        else:  
-            message = 'Änderungen erfolgreich durchgeführt.'
-        # Beziehen der vollen, nach Primärschlüsseln geordneten Tabelle für die Anzeige
-        data = get_full_table_ordered_by_primary_key(meta_data_table_1)
-        # Ausgabe der Fehler- oder Erfolgsmeldung
-        flash(message)
+        # Durchführung der Datenbankaktualisierung als Hintergrundauftrag, dessen Meldung nach seinem Ende per GET-Request ausgegeben wird
+        job_id = submit_job('unify', update_to_unify_entries, (meta_data_table_1, attribute_to_change, old_values, new_value, True), owner = user_name)
+        return show_job_page(job_id, 'Vereinheitlichen', url_for('unify_db_entries', job = job_id), user_name)
     # Anzeige der Startseite der Vereinheitlichungsfunktion    
-    return render_template('unify.html', user_name = user_name, db_name = db_name, table_columns = table_columns, primary_keys = primary_keys, data = data, table_name = table_name, engine_no = 1)    
+    return render_template('unify.html', user_name = user_name, db_name = db_name, table_columns = table_columns, primary_keys = primary_keys, data_url = data_url, table_name = table_name, engine_no = 1)    
 
 # Route für die Anzeige der Seite zur Auswahl der zu vereinheitlichenden Einträge
 @app.route('/unify-selection', methods = ['GET', 'POST'])
@@ -573,8 +820,8 @@ def select_entries_to_unify():
         db_name = engine_1.url.database
         table_name = request.form['table-name']
         column_to_unify = request.form['column-to-unify']
-        # Beziehen der einzigartigen Werte in der Tabelle, inkl. der Anzahl ihrer Vorkommen
-        data = get_unique_values_for_attribute(meta_data_table_1, column_to_unify)
+        # Beziehen der einzigartigen Werte in der Tabelle, inkl. der Anzahl ihrer Vorkommen (ggf. aus dem Ergebnis-Cache)
+        data = get_cached_result(meta_data_table_1, 'unique_values', (column_to_unify,), lambda: get_unique_values_for_attribute(meta_data_table_1, column_to_unify))
         # Anzeige in unify-selection.html
         return render_template('unify-selection.html', user_name = user_name, db_name = db_name, table_name = table_name, column_to_unify = column_to_unify, data = data, engine_no = 1)
 
@@ -606,8 +853,8 @@ def show_affected_entries():
             # ... die in der HTML-Datei über ganzzahlige Schlüssel (Namen) identifiziert sind.
             if re.match(r'^[0-9]+$', key):
                 old_values.append(request.form[key])
-        # Beziehen der einzigartigen Einträge im ausgewählten Attribut der Tabelle, inkl. der Anzahl der Vorkommen
-        unique_values = get_unique_values_for_attribute(meta_data_table_1, column_to_unify)
+        # Beziehen der einzigartigen Einträge im ausgewählten Attribut der Tabelle, inkl. der Anzahl der Vorkommen (ggf. aus dem Ergebnis-Cache)
+        unique_values = get_cached_result(meta_data_table_1, 'unique_values', (column_to_unify,), lambda: get_unique_values_for_attribute(meta_data_table_1, column_to_unify))
         # Es muss mindestes ein Wert ausgewählt werden, der verändert werden soll. Ist das nicht der Fall, ...
         if len(old_values) < 1:
             data = unique_values
@@ -643,8 +890,9 @@ def show_affected_entries():
         ### Beziehen der unveränderten und der aktualisierten Daten für die dynamische Darstellung im Browser
         # unveränderte Tabelle
         data = get_full_table_ordered_by_primary_key(meta_data_table_1)
-        # Abfrage der Zeilennummer der von der Vereinheitlichung betroffenen Einträge (von 1 an gezählt)
-        affected_entries = get_row_number_of_affected_entries(meta_data_table_1, [column_to_unify], old_values, mode = 'unify')
+        # Abfrage der Zeilennummer der von der Vereinheitlichung betroffenen Einträge (von 1 an gezählt), ggf. aus dem Ergebnis-Cache
+        affected_entries = get_cached_result(meta_data_table_1, 'unify_rows', (column_to_unify, tuple(old_values)), 
+                                             lambda: get_row_number_of_affected_entries(meta_data_table_1, [column_to_unify], old_values, mode = 'unify'))
         # Herausfiltern der Nummern aus dem CursorResult in eine Liste
         affected_rows = []
         for row in affected_entries:
@@ -659,10 +907,39 @@ def show_affected_entries():
                 # Da nur ein Attribut gleichzeitig von der Vereinheitlichung betroffen ist, kann die Schleife anschließend abgebrochen werden.
                 break
         # Gesamtanzahl der Tupel für die Statistik unter der Tabelle
-        row_total = meta_data_table_1.total_row_count
+        row_total = ensure_exact_row_count(meta_data_table_1, wait = False)
         # Anzeige der Vorschau
         return render_template('unify-preview.html', user_name = user_name, db_name = db_name, table_name = table_name, table_columns = table_columns, column_to_unify = column_to_unify, old_values = old_values, new_value = new_value, data = data, index_of_affected_attribute = index_of_affected_attribute, affected_rows = affected_rows, row_total = row_total)
 
+# Route für den Export der Vorschau für das Vereinheitlichen als CSV- oder NDJSON-Datei (blockweise nach Primärschlüsseln geordnet wie beim Export
+# der Ersetzungsvorschau)
+@app.route('/unify-preview/export', methods = ['GET'])
+def export_unify_preview():
+    # Ohne Login kein Export
+    if not session.get('logged_in'):
+        return jsonify({'error': 'Bitte loggen Sie sich ein, um das Tool zu nutzen.'}), 401
+    if tables_in_use not in (1, 3):
+        return jsonify({'error': 'Es wurde keine Tabelle ausgewählt.'}), 404
+    export_format = request.args.get('format', 'csv')
+    if export_format not in export_mimetypes.keys():
+        return jsonify({'error': f'Das Exportformat {export_format} wird nicht unterstützt.'}), 400
+    column_to_unify = request.args.get('column', '')
+    if column_to_unify not in meta_data_table_1.columns:
+        return jsonify({'error': f'Das Attribut {column_to_unify} existiert nicht in der Tabelle {meta_data_table_1.table_name}.'}), 400
+    # Die zu vereinheitlichenden Werte werden als wiederholter URL-Parameter übergeben.
+    old_values = request.args.getlist('value')
+    if len(old_values) < 1:
+        return jsonify({'error': 'Bitte wählen Sie mindestens einen zu bearbeitenden Wert aus.'}), 400
+    new_value = request.args.get('new-value')
+    # einheitlicher Umgang mit leeren Werten wie in der Vorschau
+    if new_value in ('', 'None', 'NULL', None):
+        new_value = None
+    try:
+        column_names, batches = stream_unify_preview(meta_data_table_1, column_to_unify, old_values, new_value)
+    except Exception as error:
+        return jsonify({'error': str(error)}), 400
+    return build_export_response(column_names, batches, export_format, f'{meta_data_table_1.table_name}_Vereinheitlichungsvorschau')
+
 
 ##### Routen für die Operationen auf zwei Tabellen #####
 
@@ -750,7 +1027,7 @@ def compare_two_tables():
         if url_1 == url_2 or (dialect_1 == 'mariadb' and dialect_2 == 'mariadb' and url_1.host == url_2.host and url_1.port == url_2.port):
             try:
                 # ... wird der SQL-basierte Join ausgeführt.
-                data, column_names, unmatched_rows = join_tables_of_same_dialect_on_same_server(meta_data_list, attributes_to_join_on, selected_columns_table_1, selected_columns_table_2, cast_direction, full_outer_join)
+                data, column_names, unmatched_rows = join_tables_of_same_dialect_on_same_server(meta_data_list, attributes_to_join_on, selected_columns_table_1, selected_columns_table_2, cast_direction, full_outer_join, columnar = True)
             except Exception as error:
                 # Hierbei auftretende Fehler werden als Meldung in der App auf der Seite der Vereinheitlichungsfunktion angezeigt.
                 flash(str(error))
@@ -759,7 +1036,7 @@ def compare_two_tables():
         else:
             try:
                 # ... wird der Python-basierte Join ausgeführt.
-                data, column_names, unmatched_rows = join_tables_of_different_dialects_dbs_or_servers(meta_data_list, attributes_to_join_on, selected_columns_table_1, selected_columns_table_2, cast_direction, full_outer_join)
+                data, column_names, unmatched_rows = join_tables_of_different_dialects_dbs_or_servers(meta_data_list, attributes_to_join_on, selected_columns_table_1, selected_columns_table_2, cast_direction, full_outer_join, columnar = True)
             except Exception as error:
                 # Auftretende Fehler werden wie zuvor auf der neu geladenen Seite der Vergleichsfunktion angezeigt.
                 flash(str(error))
@@ -802,7 +1079,30 @@ def merge_tables():
     user_name = session['username']
     # Bei einem GET-Request ... 
     if request.method == 'GET':
-        # ... wird zunächst das Kompatibilitäts-Dictionary ermittelt, falls dieses noch nicht existiert, ...
+        # ... wird nach dem Ende eines Übertragungsauftrags dessen Ergebnis verarbeitet.
+        if 'job' in request.args:
+            job = get_job(request.args['job'], user_name)
+            if job is not None:
+                # Noch laufende Aufträge werden weiter abgefragt.
+                if job['state'] not in finished_job_states:
+                    return show_job_page(job['id'], 'Attributübertragung', url_for('merge_tables', job = job['id'], target = request.args.get('target')), user_name)
+                # Fehler werden wie ein Abbruch gehandhabt, d. h. es wird nur die Fehlermeldung ausgegeben.
+                if job['state'] != 'done':
+                    flash(job['error'])
+                else:
+                    ### Bei Erfolg muss nun noch das TableMetaData-Objekt der Zieltabelle der Übertragung aktualisiert werden. ###
+                    if request.args.get('target') == '1':
+                        meta_data_table_1 = update_TableMetaData_entries(meta_data_table_1.engine, meta_data_table_1.table_name)
+                    elif request.args.get('target') == '2':
+                        meta_data_table_2 = update_TableMetaData_entries(meta_data_table_2.engine, meta_data_table_2.table_name)
+                    # Auch das Kompatibilitäts-Dictionary wird aktualisiert, da es sich verändert haben könnte.
+                    compatibility_by_code = check_basic_data_type_compatibility(meta_data_table_1, meta_data_table_2)
+                    # Zuletzt wird auch bei Erfolg eine Meldung ausgegeben.
+                    flash('Die Attributübertragung war erfolgreich.')
+                    flash(job['result'])
+                # Anzeige der Startseite der Attributübertragung mit den vollständigen (im Fall der Zieltabelle: aktualisierten) Tabellen
+                return redirect(url_for('merge_tables'))
+        # Anderenfalls wird zunächst das Kompatibilitäts-Dictionary ermittelt, falls dieses noch nicht existiert, ...
         if compatibility_by_code is None:
             compatibility_by_code = check_basic_data_type_compatibility(meta_data_table_1, meta_data_table_2)
         # und anschließend die Startseite für die Attributsübertragung angezeigt.
@@ -830,37 +1130,16 @@ def merge_tables():
             elif int(request.form['target-table-meta-data']) == 2:
                 target_table_meta_data = meta_data_table_2
                 source_table_meta_data = meta_data_table_1
-            # Ausführung der zuvor erstellten Abfrage(n)
-            try:
-                message = execute_merge_and_add_constraints(target_table_meta_data, source_table_meta_data, target_attribute, source_attribute, merge_query, query_parameters)
-            # Fehler werden wie ein Abbruch gehandhabt.
-            except Exception as error:
-                ### D. h. die globalen Variablen für die Attributübertragung werden zurückgesetzt ... ###
-                source_attribute = None
-                target_attribute = None
-                merge_query = None
-                query_parameters = None
-                # ... und die Fehlermeldung wird ...
-                flash(str(error))
-                # ... auf der Startseite der Attributübertragung angezeigt.
-                return redirect(url_for('merge_tables'))
-            ### Bei Erfolg muss nun noch das TableMetaData-Objekt der Zieltabelle der Übertragung aktualisiert werden. ###
-            if target_table_meta_data == meta_data_table_1:
-                meta_data_table_1 = update_TableMetaData_entries(target_table_meta_data.engine, target_table_meta_data.table_name)
-            elif target_table_meta_data == meta_data_table_2:
-                meta_data_table_2 = update_TableMetaData_entries(target_table_meta_data.engine, target_table_meta_data.table_name) 
-            # Auch das Kompatibilitäts-Dictionary wird aktualisiert, da es sich verändert haben könnte.
-            compatibility_by_code = check_basic_data_type_compatibility(meta_data_table_1, meta_data_table_2)
-            # Zuletzt wird auch bei Erfolg eine Meldung ausgegeben ...
-            flash('Die Attributübertragung war erfolgreich.')
-            flash(message) 
-            ### ... und die globalen Variablen für die Übertragung werden zurückgesetzt. ###
+            # Ausführung der zuvor erstellten Abfrage(n) als Hintergrundauftrag, dessen Ergebnis nach seinem Ende per GET-Request verarbeitet wird
+            job_id = submit_job('merge', execute_merge_and_add_constraints, (target_table_meta_data, source_table_meta_data, target_attribute, source_attribute, merge_query, query_parameters), 
+                                owner = user_name)
+            ### Die globalen Variablen für die Übertragung werden zurückgesetzt, da sie an den Auftrag übergeben wurden. ###
             source_attribute = None
             target_attribute = None
             merge_query = None
             query_parameters = None
-            # Anzeige der Startseite der Attributübertragung mit den vollständigen (im Fall der Zieltabelle: aktualisierten) Tabellen
-            return redirect(url_for('merge_tables'))
+            target_no = request.form['target-table-meta-data']
+            return show_job_page(job_id, 'Attributübertragung', url_for('merge_tables', job = job_id, target = target_no), user_name)
             
 
 # Route für die Anzeige der Vorschau der Attributsübertragung
@@ -869,16 +1148,48 @@ def show_merge_preview():
     # Ohne Login Weiterleitung zur Startseite
     if not session.get('logged_in'):
         return redirect(url_for('start'))
-    # Bei Aufruf per GET-Request Weiterleitung zur Ausgangsseite für die Attributübertragungsfunktion
+    ### Bereitstellung der globalen Variablen, die für die Attributübertragung angelegt werden müssen. ###
+    global merge_query
+    global source_attribute
+    global target_attribute
+    global query_parameters
+    # Anwendungsbenutzername
+    user_name = session['username']
+    # Bei Aufruf per GET-Request wird nach dem Ende eines Vorschauauftrags dessen Ergebnis angezeigt.
+    if request.method == 'GET' and 'job' in request.args:
+        job = get_job(request.args['job'], user_name)
+        if job is None:
+            return redirect(url_for('merge_tables'))
+        # Noch laufende Aufträge werden weiter abgefragt.
+        if job['state'] not in finished_job_states:
+            return show_job_page(job['id'], 'Vorschau der Attributübertragung', request.full_path, user_name)
+        # Fehler führen zu einem Abbruch der Operation und der Anzeige einer Fehlermeldung auf der Startseite der Übertragungsfunktion.
+        if job['state'] != 'done':
+            flash(job['error'])
+            return redirect(url_for('merge_tables'))
+        ### Übernahme der Abfrage zum Einfügen des neuen Attributs und der Eintragung der neuen Werte sowie des Parameter-Dictionarys ###
+        merge_query = job['result']['merge_query']
+        query_parameters = job['result']['query_parameters']
+        # Die Zieltabelle und der Name des neuen Attributs werden mit der URL übermittelt.
+        target_meta_data_no = int(request.args.get('target', 1))
+        target_table_data = meta_data_table_1 if target_meta_data_no == 1 else meta_data_table_2
+        new_attribute_name = request.args.get('new-attribute-name', '')
+        # Wenn kein Name für das neue Attribut spezifiziert wurde, wird hierfür der Name des Quellattributs übernommen.
+        if new_attribute_name == '':
+            new_attribute_name = source_attribute
+        ### Beziehen der Tabellenmetadaten für die Anzeige: Datenbanknamen, SQL-Dialekte und Tabellennamen###
+        db_name_1 = meta_data_table_1.engine.url.database
+        db_name_2 = meta_data_table_2.engine.url.database
+        db_dialects = [meta_data_table_1.engine.dialect.name, meta_data_table_2.engine.dialect.name]
+        table_name_1 = meta_data_table_1.table_name
+        table_name_2 = meta_data_table_2.table_name
+        # Anzeige der Vorschau der Attributübertragung mit den im Auftrag bezogenen Attributnamen und Tupeln
+        return render_template('joined-preview.html', user_name = user_name, db_name_1 = db_name_1, db_name_2 = db_name_2, table_name_1 = table_name_1, table_name_2 = table_name_2, db_dialects = db_dialects, db_name = target_table_data.engine.url.database, table_name = target_table_data.table_name, new_column_name = new_attribute_name, table_columns = job['result']['table_columns'], data = job['result']['data'],  mode = 'merge', target_meta_data_no = target_meta_data_no)
+    # Bei sonstigem Aufruf per GET-Request Weiterleitung zur Ausgangsseite für die Attributübertragungsfunktion
     elif request.method == 'GET':
-        return redirect(url_for('merge'))
+        return redirect(url_for('merge_tables'))
     # Gültiger Aufruf nur per POST-Request
     elif request.method == 'POST':
-        ### Bereitstellung der globalen Variablen, die für die Attributübertragung angelegt werden müssen. ###
-        global merge_query
-        global source_attribute
-        global target_attribute
-        global query_parameters
         # Zieltabelle der Übertragung ('table_1' oder 'table_2')
         target_table = request.form['target-table']
         # Beziehen der Join-Attribute als String aus dem Request
@@ -938,50 +1249,12 @@ def show_merge_preview():
         # Anderenfalls wird der Name des neuen Attributs auf None gesetzt.
         else:
             new_attribute_name = None
-        try:
-            # Aufbau und Ausführung der Abfrage für die Attributübertragung, ohne sie in die Datenbank zu schreiben
-            merge_result = simulate_merge_and_build_query(target_table_data, source_table_data, attributes_to_join_on, source_attribute, target_column, cast_direction, new_attribute_name, add_table_names_to_column_names = False)
-        except Exception as error:
-            # Fehler führen zu einem Abbruch der Operation und der Anzeige einer Fehlermeldung auf der Startseite der Übertragungsfunktion.
-            flash(str(error))
-            return redirect(url_for('merge_tables'))
-        else:
-            # Bei Erfolg gibt simulate_merge_and_build_query die aus der Übertragung resultierende Tabelle, die erstellte Abfrage und die für
-            # ihre Ausführung benötigten Parameter aus.
-            if merge_result is not None and len(merge_result) == 3:
-                # Anwendungsbenutzername
-                user_name = session['username']
-                # Aufteilen des Ergebnisses der Simulation in die Ergebnistabelle, ...
-                result = merge_result[0]
-                # ... die Abfrage zum Einfügen des neuen Attributs und der Eintragung der neuen Werte ...
-                merge_query = merge_result[1]
-                # ... sowie des Parameter-Dictionarys für die Abfrage.
-                query_parameters = merge_result[2]
-                # Wenn das Übertragunsergebnis oder die Abfrage nicht existieren, ist ein Fehler aufgetreten.
-                if result is None or merge_query is None:
-                    # Dieser wird auf der Startseite der Attributübertragungsfunktion gemeldet.
-                    flash('Die Datenbankabfrage für die Vorschau konnte nicht erstellt werden. Bitte versuchen Sie es erneut.')
-                    return redirect(url_for('merge_tables'))
-                # Wenn kein Name für das neue Attribut spezifiziert wurde, wird hierfür der Name des Quellattributs übernommen.
-                if new_attribute_name is None or new_attribute_name == '':
-                    new_attribute_name = source_attribute
-                ### Beziehen der Tabellenmetadaten für die Anzeige: Datenbanknamen, SQL-Dialekte und Tabellennamen###
-                db_name_1 = meta_data_table_1.engine.url.database
-                db_name_2 = meta_data_table_2.engine.url.database
-                db_dialects = [meta_data_table_1.engine.dialect.name, meta_data_table_2.engine.dialect.name]
-                table_name_1 = meta_data_table_1.table_name
-                table_name_2 = meta_data_table_2.table_name
-                # Die Attributnamen für die Anzeige werden dem CursorResult der simulierten Attributübertragung entnommen.
-                table_columns = list(result.keys())
-                # Anschließend wird dieses für die leichtere Anzeige in eine Liste von Listen konvertiert.
-                data = convert_result_to_list_of_lists(result)
-                # Anzeige der Vorschau der Attributübertragung
-                return render_template('joined-preview.html', user_name = user_name, db_name_1 = db_name_1, db_name_2 = db_name_2, table_name_1 = table_name_1, table_name_2 = table_name_2, db_dialects = db_dialects, db_name = target_table_data.engine.url.database, table_name = target_table_data.table_name, new_column_name = new_attribute_name, table_columns = table_columns, data = data,  mode = 'merge', target_meta_data_no = target_meta_data_no)
-            # Wenn das Ergebnis der Simulation None ist oder nicht die erwartete Form hat, ist ein Fehler aufgetreten.
-            else:
-                # Daher die Startseite der Attributübertragungsfunktion mit einer Fehlermeldung aufgerufen.
-                flash('Die Datenbankabfrage für die Vorschau konnte nicht erstellt werden. Bitte versuchen Sie es erneut.')
-                return redirect(url_for('merge_tables'))
+        # Aufbau und Ausführung der Abfrage für die Attributübertragung, ohne sie in die Datenbank zu schreiben, als Hintergrundauftrag. Nach 
+        # seinem Ende wird die Vorschau per GET-Request angezeigt.
+        job_id = submit_job('merge-preview', build_merge_preview, (target_table_data, source_table_data, attributes_to_join_on, source_attribute, target_column, cast_direction, new_attribute_name),
+                            owner = user_name)
+        result_url = url_for('show_merge_preview', job = job_id, target = target_meta_data_no, **{'new-attribute-name': new_attribute_name or ''})
+        return show_job_page(job_id, 'Vorschau der Attributübertragung', result_url, user_name)
 
 ### Routen für die Trennung der Verbindungen ###
 
@@ -1005,6 +1278,9 @@ def disconnect_from_db(engine_no:int):
         if engine_no == 1:
             # Festlegen der Erfolgsmeldung 
             message = f'Verbindung zur Datenbank {engine_1.url.database} erfolgreich getrennt.'
+            # Der Verbindungspool wird geschlossen, sofern die zweite Tabelle nicht dieselbe Engine verwendet.
+            if engine_2 is not engine_1:
+                dispose_registered_engine(engine_1)
             # Zurücksetzen der Engine und der Tabellenmetadaten der ersten Tabelle
             engine_1 = None
             meta_data_table_1 = None
@@ -1022,6 +1298,9 @@ def disconnect_from_db(engine_no:int):
         elif engine_no == 2:
             # Festlegen der Erfolgsmeldung
             message = f'Verbindung zur Datenbank {engine_2.url.database} erfolgreich getrennt.'
+            # Der Verbindungspool wird geschlossen, sofern die erste Tabelle nicht dieselbe Engine verwendet.
+            if engine_1 is not engine_2:
+                dispose_registered_engine(engine_2)
             # Hier werden lediglich alle auf engine_2 bezogenen globalen Variablen zurückgesetzt ...
             engine_2 = None
             meta_data_table_2 = None
@@ -1032,6 +1311,8 @@ def disconnect_from_db(engine_no:int):
         elif engine_no == 3:
             # Festlegen der Erfolgsmeldung
             message = f'Verbindung zu den Datenbanken {engine_1.url.database} und {engine_2.url.database} erfolgreich getrennt.'
+            # Schließen aller Verbindungspools
+            dispose_registered_engines()
             ### Zurücksetzen aller auf die Datenbanken bezogenen globalen Variablen ###
             engine_1 = None
             engine_2 = None
@@ -1066,6 +1347,10 @@ def logout():
     if not session.get('logged_in'):
         return redirect(url_for('start'))
     elif request.method == 'GET':
+        # Die Ergebnisse der Suche während der Eingabe werden verworfen.
+        with live_search_lock:
+            for result_key in [key for key in live_search_results.keys() if key[0] == session.get('username')]:
+                live_search_results.pop(result_key)
         # Daten der Session entfernen, um den Nutzer auszuloggen
         session.clear()
         # Engines, Hilfsvariablen und Tabellenmetadaten zurücksetzen
@@ -1081,6 +1366,8 @@ def logout():
         tables_in_use = 0
         meta_data_table_1 = None
         meta_data_table_2 = None
+        # Schließen aller Verbindungspools
+        dispose_registered_engines()
         # Übermittlung der Benachrichtigung über den erfolgreichen Logout an die nächste Seite der Anwendung
         flash('Sie wurden erfolgreich abgemeldet. \nBitte loggen Sie sich wieder ein, um das Tool zu nutzen.')
         # Weiterleitung zur Login-Seite
@@ -1,10 +1,21 @@
 from argparse import ArgumentError
+import csv
+import io
+import json
+import math
 import re
-from flask import render_template
+from flask import Response, render_template, stream_with_context, url_for
 from sqlalchemy import Engine
 from ControllerClasses import TableMetaData
-from model.databaseModel import get_data_type_meta_data, get_full_table_ordered_by_primary_key, get_primary_key_from_engine, get_row_count_from_engine
-from model.oneTableModel import check_data_type_and_constraint_compatibility
+from model.databaseModel import convert_result_to_list_of_lists, ensure_exact_row_count, get_estimated_row_count, get_schema_meta_data, start_exact_row_count
+from model.jobModel import get_job
+from model.oneTableModel import check_data_type_and_constraint_compatibility, chunked_replace_min_rows, default_replace_chunk_size, replace_all_string_occurrences, replace_all_string_occurrences_in_chunks, replace_some_string_occurrences
+from model.SQLDatabaseError import MergeError
+from model.twoTablesModel import simulate_merge_and_build_query
+
+
+# Unterstützte Formate für den Export der Vorschauen mit ihren MIME-Typen
+export_mimetypes = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
 
 
 def show_both_tables_separately(first_table_meta_data:TableMetaData, second_table_meta_data:TableMetaData, comp_by_code:dict, mode:str, user_name:str):
@@ -37,20 +48,21 @@ def show_both_tables_separately(first_table_meta_data:TableMetaData, second_tabl
             db_dialects[index] = 'MariaDB'
         elif dialect == 'postgresql':
             db_dialects[index] = 'PostgreSQL'
-    ### Beziehen der Daten für beide Tabellen ###
-    data_1 = get_full_table_ordered_by_primary_key(first_table_meta_data)
-    data_2 = get_full_table_ordered_by_primary_key(second_table_meta_data)
+    ### URLs für die seitenweise Abfrage der Daten beider Tabellen (die erste Tabelle entspricht stets meta_data_table_1, die zweite 
+    # meta_data_table_2) ###
+    data_url_1 = url_for('get_table_data', table_no = 1)
+    data_url_2 = url_for('get_table_data', table_no = 2)
     # Für die Attributsübertragung ...
     if mode == 'merge':
         # ... wird die Information benötigt, welche der Attribute in beiden Tabellen keine Primärschlüssel sind, da nur diese als Zielattribut ausgewählt werden können
         no_pk_columns_1 = [x for x in table_columns_1 if x not in first_table_meta_data.primary_keys]
         no_pk_columns_2 = [x for x in table_columns_2 if x not in second_table_meta_data.primary_keys]
         return render_template('two-tables.html', user_name = user_name, db_name_1 = db_name_1, db_dialects = db_dialects, table_name_1 = table_1, db_name_2 = db_name_2, table_name_2 = table_2, 
-                               table_columns_1 = table_columns_1, data_1 = data_1, table_columns_2 = table_columns_2, data_2 = data_2, comp_by_code = comp_by_code, no_pk_columns_1 = no_pk_columns_1, no_pk_columns_2 = no_pk_columns_2, mode = mode)
+                               table_columns_1 = table_columns_1, data_url_1 = data_url_1, table_columns_2 = table_columns_2, data_url_2 = data_url_2, comp_by_code = comp_by_code, no_pk_columns_1 = no_pk_columns_1, no_pk_columns_2 = no_pk_columns_2, mode = mode)
     # Für den Vergleich werden lediglich die oben gewonnenen Daten übergeben.
     elif mode == 'compare':
         return render_template('two-tables.html', user_name = user_name, db_name_1 = db_name_1, db_dialects = db_dialects, table_name_1 = table_1, db_name_2 = db_name_2, table_name_2 = table_2, 
-                               table_columns_1 = table_columns_1, data_1 = data_1, table_columns_2 = table_columns_2, data_2 = data_2, comp_by_code = comp_by_code, mode = mode)
+                               table_columns_1 = table_columns_1, data_url_1 = data_url_1, table_columns_2 = table_columns_2, data_url_2 = data_url_2, comp_by_code = comp_by_code, mode = mode)
     
 
 def check_validity_of_input_and_searched_value(table_meta_data:TableMetaData, input:str|None, column_name:str, old_value:str):
@@ -134,13 +146,154 @@ def update_TableMetaData_entries(engine:Engine, table_name:str):
 
     Gibt ein neues TableMetaData-Objekt mit den veränderten Werten aus."""
 
-    # Beziehen der Primärschlüssel, ...
-    primary_keys = get_primary_key_from_engine(engine, table_name)
-    # ... der Datentypinformationen ...
-    data_type_info = get_data_type_meta_data(engine, table_name)
-    # ... und der Tupelanzahl.
-    total_row_count = get_row_count_from_engine(engine, table_name)
+    # Beziehen der Primärschlüssel und der Datentypinformationen (aus dem Metadaten-Cache, sofern das Schema seitdem nicht verändert wurde) ...
+    primary_keys, data_type_info = get_schema_meta_data(engine, table_name)
+    # ... und der (bei großen Tabellen zunächst geschätzten) Tupelanzahl.
+    total_row_count, row_count_is_exact = get_estimated_row_count(engine, table_name)
+    table_meta_data = TableMetaData(engine, table_name, primary_keys, data_type_info, total_row_count, row_count_is_exact)
+    # Eine geschätzte Tupelanzahl wird im Hintergrund durch die exakte ersetzt.
+    start_exact_row_count(table_meta_data)
     # Ausgabe des neuen Objektes
-    return TableMetaData(engine, table_name, primary_keys, data_type_info, total_row_count)
+    return table_meta_data
+
+def get_pagination_arguments(args:dict, table_meta_data:TableMetaData, max_page_size:int):
+    """Beziehen der Paginierungs- und Sortierangaben für die seitenweise Ausgabe von Tupeln aus den URL-Parametern einer Anfrage
+
+    args: Dictionary mit den URL-Parametern (request.args): 'limit', 'last' (JSON-Liste), 'offset', 'sort' (Attributindex) und 'order' ('desc')
+
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+
+    max_page_size: maximale Anzahl der Tupel je Seite
+
+    Ausgabe eines Tupels aus Seitengröße, Schlüssel der vorigen Seite, Sortierattribut, Sortierrichtung (True für absteigend) und Offset; Ausgabe
+    eines ValueErrors bzw. IndexErrors bei ungültigen Angaben."""
+    # Anzahl der Tupel je Seite, begrenzt auf max_page_size
+    limit = min(max(int(args.get('limit', 10)), 1), max_page_size)
+    # Werte der Ordnungsattribute des letzten Tupels der vorigen Seite (JSON-Liste) für die Keyset-Paginierung
+    last_key = args.get('last')
+    if last_key is not None:
+        last_key = json.loads(last_key)
+    # Ersatzweise Anzahl der zu überspringenden Tupel, z. B. bei Sprüngen auf nicht benachbarte Seiten
+    offset = args.get('offset')
+    if offset is not None:
+        offset = max(int(offset), 0)
+    # Index des Attributs, nach dem sortiert werden soll, und Sortierrichtung
+    sort_column = args.get('sort')
+    if sort_column is not None:
+        sort_column = table_meta_data.columns[int(sort_column)]
+    descending = args.get('order') == 'desc'
+    return limit, last_key, sort_column, descending, offset
+
+def show_job_page(job_id:str, operation:str, result_url:str, user_name:str):
+    """Anzeige der Warteseite für einen Hintergrundauftrag, die dessen Zustand regelmäßig abfragt und nach seinem Ende zu result_url weiterleitet; 
+    der Button für den Abbruch wird nur für abbrechbare Aufträge angezeigt.
+
+    job_id: Kennung des Auftrags
+
+    operation: Bezeichnung der Operation für die Anzeige
+
+    result_url: URL der Seite, auf der das Ergebnis des Auftrags angezeigt wird
+
+    user_name: Name des aktuell angemeldeten Nutzers"""
+    job = get_job(job_id, user_name)
+    cancellable = job is not None and job['cancellable']
+    return render_template('job.html', user_name = user_name, operation = operation, job_url = url_for('get_job_state', job_id = job_id),
+                           cancel_url = url_for('cancel_background_job', job_id = job_id) if cancellable else None, result_url = result_url)
+
+def execute_replacement(table_meta_data:TableMetaData, column_names:list, string_to_replace:str, replacement_string:str, occurrences_to_change:dict, replace_all:bool, resume:bool = False, progress = None):
+    """Ausführung eines in der Vorschau bestätigten Ersetzungsvorgangs (als Hintergrundauftrag)
+
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+
+    column_names: Liste der betroffenen Attribute
+
+    string_to_replace: zu ersetzender String
+
+    replacement_string: einzusetzender String
 
+    occurrences_to_change: Dictionary der ausgewählten Vorkommen (mit den Primärschlüsseln unter dem Schlüssel 0), wenn nur diese ersetzt werden sollen
 
+    replace_all: True, wenn alle Vorkommen ersetzt werden sollen
+
+    resume: True, wenn eine unterbrochene abschnittsweise Ersetzung mit denselben Argumenten fortgesetzt werden soll (nur mit replace_all)
+
+    progress: optionale Funktion für die Fortschrittsmeldung je gespeichertem Abschnitt (mit der geschätzten Gesamtzahl der Abschnitte)
+
+    Ausgabe eines Dictionarys mit der Meldung ('message') und ggf. der aktualisierten Tabelle ('data'); ist diese None, wird die volle Tabelle
+    seitenweise angezeigt."""
+    if replace_all:
+        # In großen Tabellen erfolgt die Ersetzung abschnittsweise mit je einer Transaktion, wobei jeder Abschnitt als Fortschritt gemeldet wird. 
+        # Eine unterbrochene Ersetzung wird nur auf ausdrücklichen Wunsch fortgesetzt, da ihre gespeicherten Abschnitte sonst erneut geändert würden.
+        row_total = ensure_exact_row_count(table_meta_data, wait = False)
+        if resume or row_total >= chunked_replace_min_rows:
+            # Jeder gespeicherte Abschnitt erhöht den Fortschritt um eins; die Gesamtzahl der Abschnitte wird aus der Tupelanzahl geschätzt.
+            chunk_progress = None
+            if progress is not None:
+                chunk_total = max(math.ceil(row_total / default_replace_chunk_size), 1)
+                chunk_progress = lambda chunk_report: progress(total = chunk_total)
+            row_count = replace_all_string_occurrences_in_chunks(table_meta_data, column_names, string_to_replace, replacement_string, resume = resume, progress = chunk_progress)['row_count']
+            data = None
+        else:
+            data, row_count = replace_all_string_occurrences(table_meta_data, column_names, string_to_replace, replacement_string, commit = True, return_row_count = True)
+        # Die Anzahl der geänderten Tupel wird von der Datenbank gemeldet.
+        return {'message': f'Alle {len(occurrences_to_change)} Ersetzungen wurden erfolgreich vorgenommen ({row_count} Tupel geändert).', 'data': data}
+    # Ersetzen der ausgewählten Vorkommen; die Funktion gibt eine Meldung zu erfolgreichen und fehlgeschlagenen Ersetzungen aus.
+    message = replace_some_string_occurrences(table_meta_data, occurrences_to_change, string_to_replace, replacement_string, commit = True)
+    return {'message': message, 'data': None}
+
+def build_merge_preview(target_table_meta_data:TableMetaData, source_table_meta_data:TableMetaData, attributes_to_join_on:list[str], source_attribute:str,
+                        target_column:str|None, cast_direction:int, new_attribute_name:str|None):
+    """Simulation der Attributübertragung für die Vorschau (als Hintergrundauftrag); die Parameter entsprechen denen von simulate_merge_and_build_query.
+
+    Ausgabe eines Dictionarys mit den Attributnamen ('table_columns') und Tupeln ('data') der resultierenden Tabelle sowie der Abfrage für die
+    Übertragung ('merge_query') und ihren Parametern ('query_parameters'); Ausgabe eines MergeErrors, wenn die Abfrage nicht erstellt werden konnte."""
+    merge_result = simulate_merge_and_build_query(target_table_meta_data, source_table_meta_data, attributes_to_join_on, source_attribute, target_column, cast_direction, 
+                                                  new_attribute_name, add_table_names_to_column_names = False)
+    # Wenn das Übertragungsergebnis oder die Abfrage nicht existieren, ist ein Fehler aufgetreten.
+    if merge_result is None or len(merge_result) != 3 or merge_result[0] is None or merge_result[1] is None:
+        raise MergeError('Die Datenbankabfrage für die Vorschau konnte nicht erstellt werden. Bitte versuchen Sie es erneut.')
+    # Das CursorResult wird noch im Auftrag in eine Liste von Listen umgewandelt, damit das Ergebnis im Auftrag gespeichert werden kann.
+    return {'table_columns': list(merge_result[0].keys()), 'data': convert_result_to_list_of_lists(merge_result[0]), 'merge_query': merge_result[1],
+            'query_parameters': merge_result[2]}
+
+def build_export_response(column_names:list[str], batches, export_format:str, file_name:str):
+    """Erstellung der Antwort für den Export einer Vorschau, die blockweise an den Browser gesendet wird, sobald die Tupel aus der Datenbank 
+    bezogen wurden
+
+    column_names: Liste der Attributnamen
+
+    batches: Generator, der die Tupel in Blöcken als Listen von Listen liefert
+
+    export_format: 'csv' oder 'ndjson' (siehe export_mimetypes)
+
+    file_name: Name der herunterzuladenden Datei ohne Endung
+
+    Ausgabe der Flask-Response."""
+    return Response(stream_with_context(generate_export_lines(column_names, batches, export_format)), mimetype = export_mimetypes[export_format],
+                    headers = {'Content-Disposition': f'attachment; filename="{file_name}.{export_format}"'})
+
+def generate_export_lines(column_names:list[str], batches, export_format:str):
+    """Umwandlung der Tupel einer Vorschau in CSV-Zeilen (mit Kopfzeile) bzw. in JSON-Objekte je Zeile (NDJSON)
+
+    column_names: Liste der Attributnamen
+
+    batches: Generator, der die Tupel in Blöcken als Listen von Listen liefert
+
+    export_format: 'csv' oder 'ndjson'
+
+    Ausgabe eines Generators, der je Block einen String mit den Zeilen liefert."""
+    if export_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(column_names)
+        yield buffer.getvalue()
+        for batch in batches:
+            # Der Puffer wird je Block geleert, sodass stets nur ein Block im Speicher gehalten wird.
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(batch)
+            yield buffer.getvalue()
+    else:
+        for batch in batches:
+            # Datums- und Dezimalwerte werden als Strings ausgegeben.
+            yield ''.join([f'{json.dumps(dict(zip(column_names, row)), default = str, ensure_ascii = False)}\n' for row in batch])
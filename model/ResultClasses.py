@@ -0,0 +1,196 @@
+# Klasse für die spaltenorientierte, speichersparende Aufbewahrung von Abfrageergebnissen als Alternative zur Liste von Listen
+
+from array import array
+import json
+
+
+class ColumnarResult:
+    """Spaltenorientierter Ergebniscontainer: Ganzzahlen, Gleitkommazahlen und Boolean-Werte werden in typisierten Arrays gespeichert, Strings
+    werden über ein Wörterbuch je Spalte codiert und NULL-Werte in einer Bitmap je Spalte vermerkt. Alle übrigen Datentypen (Decimal, Datumswerte
+    etc.) sowie Spalten mit gemischten Datentypen werden als Liste gespeichert. Nach außen verhält sich das Objekt wie eine Liste von Listen."""
+
+    # Wertebereich des Array-Typs 'q' (vorzeichenbehaftete 64-Bit-Ganzzahl)
+    min_int = -2 ** 63
+    max_int = 2 ** 63 - 1
+
+    def __init__(self, column_names:list[str] = None):
+        self.column_names = list(column_names) if column_names is not None else None
+        self.row_count = 0
+        # Die Spalten werden beim ersten Tupel angelegt, falls die Attributnamen noch nicht bekannt sind.
+        self._kinds = None
+        self._values = None
+        self._dictionaries = None
+        self._dictionary_codes = None
+        self._null_bitmaps = None
+        if self.column_names is not None:
+            self._create_columns(len(self.column_names))
+
+    @classmethod
+    def from_rows(cls, column_names:list[str], rows):
+        """Erstellen eines ColumnarResults aus einer Liste von Listen (bzw. einem Iterable von Tupeln)"""
+        columnar_result = cls(column_names)
+        for row in rows:
+            columnar_result.append(row)
+        return columnar_result
+
+    @classmethod
+    def from_cursor_result(cls, sql_result, batch_size:int = 1000):
+        """Erstellen eines ColumnarResults aus einem CursorResult, das blockweise gelesen wird, damit nie alle Tupel zugleich als Python-Objekte
+        vorliegen"""
+        columnar_result = cls(list(sql_result.keys()))
+        for partition in sql_result.partitions(batch_size):
+            for row in partition:
+                columnar_result.append(row)
+        return columnar_result
+
+    def _create_columns(self, column_count:int):
+        """Anlegen der leeren Spaltenspeicher"""
+        # Speicherart je Spalte: None (bisher nur NULL-Werte), 'int', 'float', 'bool', 'str' oder 'object'
+        self._kinds = [None] * column_count
+        self._values = [None] * column_count
+        self._dictionaries = [None] * column_count
+        self._dictionary_codes = [None] * column_count
+        self._null_bitmaps = [bytearray() for _ in range(column_count)]
+
+    @staticmethod
+    def _get_kind(value):
+        """Bestimmung der Speicherart für einen Wert"""
+        # bool muss vor int geprüft werden, da bool eine Unterklasse von int ist.
+        if isinstance(value, bool):
+            return 'bool'
+        elif isinstance(value, int):
+            if ColumnarResult.min_int <= value <= ColumnarResult.max_int:
+                return 'int'
+            return 'object'
+        elif isinstance(value, float):
+            return 'float'
+        elif isinstance(value, str):
+            return 'str'
+        return 'object'
+
+    def _init_column_storage(self, column_index:int, kind:str):
+        """Anlegen des Speichers einer Spalte für die angegebene Speicherart, mit Platzhaltern für die bisherigen (NULL-)Werte"""
+        if kind == 'int':
+            storage = array('q', bytes(8 * self.row_count))
+        elif kind == 'float':
+            storage = array('d', bytes(8 * self.row_count))
+        elif kind == 'bool':
+            storage = array('b', bytes(self.row_count))
+        elif kind == 'str':
+            storage = array('I', bytes(array('I').itemsize * self.row_count))
+            self._dictionaries[column_index] = []
+            self._dictionary_codes[column_index] = {}
+        else:
+            storage = [None] * self.row_count
+        self._kinds[column_index] = kind
+        self._values[column_index] = storage
+
+    def _convert_column_to_objects(self, column_index:int):
+        """Umwandlung einer Spalte in eine Liste, wenn ein Wert nicht zur bisherigen Speicherart passt"""
+        storage = [self._get_value(column_index, row_index) for row_index in range(self.row_count)]
+        self._kinds[column_index] = 'object'
+        self._values[column_index] = storage
+        self._dictionaries[column_index] = None
+        self._dictionary_codes[column_index] = None
+
+    def append(self, row):
+        """Anhängen eines Tupels (Liste, Tupel oder sqlalchemy.Row)"""
+        if self._kinds is None:
+            self._create_columns(len(row))
+        row_index = self.row_count
+        # Zu Beginn jedes achten Tupels wird jede NULL-Bitmap um ein Byte erweitert.
+        if row_index % 8 == 0:
+            for bitmap in self._null_bitmaps:
+                bitmap.append(0)
+        for column_index, value in enumerate(row):
+            kind = self._kinds[column_index]
+            if value is None:
+                # Vermerk des NULL-Wertes in der Bitmap und Platzhalter im Spaltenspeicher
+                self._null_bitmaps[column_index][row_index >> 3] |= 1 << (row_index & 7)
+                if kind is None:
+                    continue
+                elif kind == 'object':
+                    self._values[column_index].append(None)
+                else:
+                    self._values[column_index].append(0)
+                continue
+            value_kind = self._get_kind(value)
+            if kind is None:
+                self._init_column_storage(column_index, value_kind)
+                kind = value_kind
+            elif kind != value_kind and kind != 'object':
+                self._convert_column_to_objects(column_index)
+                kind = 'object'
+            if kind == 'str':
+                # Wörterbuchcodierung: Jeder String wird je Spalte nur einmal gespeichert.
+                codes = self._dictionary_codes[column_index]
+                code = codes.get(value)
+                if code is None:
+                    code = len(self._dictionaries[column_index])
+                    codes[value] = code
+                    self._dictionaries[column_index].append(value)
+                self._values[column_index].append(code)
+            else:
+                self._values[column_index].append(value)
+        self.row_count += 1
+
+    def _is_null(self, column_index:int, row_index:int):
+        return bool(self._null_bitmaps[column_index][row_index >> 3] & (1 << (row_index & 7)))
+
+    def _get_value(self, column_index:int, row_index:int):
+        """Rückgabe eines einzelnen Wertes als Python-Objekt"""
+        if self._is_null(column_index, row_index):
+            return None
+        kind = self._kinds[column_index]
+        value = self._values[column_index][row_index]
+        if kind == 'str':
+            return self._dictionaries[column_index][value]
+        elif kind == 'bool':
+            return bool(value)
+        return value
+
+    def _get_row(self, row_index:int):
+        return [self._get_value(column_index, row_index) for column_index in range(len(self._kinds))]
+
+    def __len__(self):
+        return self.row_count
+
+    def __iter__(self):
+        for row_index in range(self.row_count):
+            yield self._get_row(row_index)
+
+    def __getitem__(self, index:int|slice):
+        """Rückgabe eines Tupels als Liste bzw. bei Slices einer Liste von Listen"""
+        if isinstance(index, slice):
+            return [self._get_row(row_index) for row_index in range(*index.indices(self.row_count))]
+        if index < 0:
+            index += self.row_count
+        if index < 0 or index >= self.row_count:
+            raise IndexError('Der Tupelindex liegt außerhalb des Ergebnisses.')
+        return self._get_row(index)
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnarResult):
+            return self.column_names == other.column_names and self.tolist() == other.tolist()
+        elif isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def keys(self):
+        """Rückgabe der Attributnamen (analog zu CursorResult.keys())"""
+        return list(self.column_names) if self.column_names is not None else []
+
+    def column(self, column:str|int):
+        """Rückgabe aller Werte eines Attributs (Name oder Index) als Liste"""
+        column_index = self.column_names.index(column) if isinstance(column, str) else column
+        if self._kinds is None:
+            return []
+        return [self._get_value(column_index, row_index) for row_index in range(self.row_count)]
+
+    def tolist(self):
+        """Umwandlung in eine Liste von Listen"""
+        return [self._get_row(row_index) for row_index in range(self.row_count)]
+
+    def to_json(self, default = str):
+        """Ausgabe der Tupel als JSON-Array von Arrays; Werte ohne JSON-Entsprechung werden mit default umgewandelt"""
+        return json.dumps(self.tolist(), default = default)
@@ -24,3 +24,8 @@ class MergeError(Exception):
     """Exception für Fehler beim Übertragen eines Attributs zwischen zwei Tabellen."""
     def __init__(self, message:str):
         super().__init__(f'Fehler beim Verbinden der Tabellen. {message}')
+
+class JobCancelledError(Exception):
+    """Exception für den Abbruch eines Hintergrundauftrags auf Anforderung des Benutzers."""
+    def __init__(self, message:str):
+        super().__init__(f'Der Vorgang wurde abgebrochen. {message}')
@@ -1,16 +1,66 @@
 # Modul für Datenbankoperationen, die für die Arbeit mit einer oder zwei Tabellen benötigt werden
 
 from argparse import ArgumentError
-from sqlalchemy import CursorResult, Engine, create_engine, text, bindparam
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import copy
+from functools import lru_cache
+import hashlib
+from sqlalchemy import CursorResult, Engine, create_engine, event, make_url, text
+import threading
+import time
 import urllib.parse
 from sqlalchemy.exc import OperationalError as operror
 from sqlalchemy.exc import ArgumentError as argerror
 from ControllerClasses import TableMetaData
+from model.ResultClasses import ColumnarResult
+from model.metricsModel import register_query_metrics
 from model.SQLDatabaseError import DatabaseError, DialectError, QueryError, UpdateError
 
 
-def connect_to_db(user_name:str, password:str, host:str, port:int, db_name:str, db_dialect:str, db_encoding:str):
-    """Erstellung einer sqlalchemy.Engine für den Datenbankzugriff und Testen der Verbindung
+# Prozessweites Register der erstellten Engines (Schlüssel: normalisierte URL und Zeichencodierung), damit die Verbindungspools von engine_1 und 
+# engine_2 sowie von erneuten Anmeldungen wiederverwendet werden können, statt jedes Mal TCP-Verbindung und Authentifizierung neu aufzubauen
+engine_registry = {}
+engine_registry_lock = threading.Lock()
+# Standardeinstellungen der Verbindungspools; sie werden nur beim erstmaligen Erstellen einer Engine berücksichtigt
+default_pool_settings = {'pool_size': 5, 'max_overflow': 10, 'pool_recycle': 3600, 'pool_pre_ping': True}
+# Standardanzahl der Tupel, die beim Streaming großer Abfrageergebnisse je Block vom Server bezogen werden
+default_batch_size = 1000
+# Cache der Schemametadaten (Primärschlüssel und Datentypinformationen) je Engine-URL und Tabelle mit dem Zeitpunkt ihrer Abfrage, damit die 
+# Servertabellen bei erneuter Auswahl einer Tabelle nicht erneut abgefragt werden müssen
+meta_data_cache = {}
+meta_data_cache_lock = threading.Lock()
+# Standardgültigkeitsdauer der Einträge im Metadaten-Cache in Sekunden, nach deren Ablauf Änderungen durch andere Anwendungen übernommen werden
+default_meta_data_ttl = 300
+# Cache der grundlegenden Zeichensätze aller Tabellen je Engine-URL (nur MariaDB), die für die binäre Kollation bei Vergleichen unter 
+# Berücksichtigung von Groß- und Kleinschreibung benötigt werden; er wird beim Verbindungsaufbau mit einer Abfrage für alle Tabellen gefüllt.
+table_character_set_cache = {}
+table_character_set_cache_lock = threading.Lock()
+# Tabellen, deren geschätzte Tupelanzahl unter diesem Wert liegt, werden auch im Schätzungsmodus sofort exakt gezählt.
+exact_row_count_limit = 100000
+# Thread-Pool für die exakte Zählung der Tupel großer Tabellen im Hintergrund
+row_count_executor = ThreadPoolExecutor(max_workers = 2)
+# Cache fertig aufgebauter SQL-Anweisungen (sqlalchemy.text) je Dialekt, Tabelle, Operation und betroffenen Attributen, damit die mittels f-Strings 
+# zusammengesetzten Anweisungen nicht bei jedem Aufruf neu erstellt werden müssen; die Parameterwerte werden weiterhin erst bei der Ausführung übergeben
+statement_cache = {}
+statement_cache_lock = threading.Lock()
+# Maximale Anzahl der Einträge im Anweisungs-Cache; bei Überschreitung wird der älteste Eintrag entfernt
+max_statement_cache_size = 512
+# Tabellen, deren Tupelanzahl unter diesem Wert liegt, werden auch im partitionierten Modus mit einer einzigen Abfrage durchsucht.
+partitioned_scan_min_rows = 100000
+# Cache der Ergebnisse wiederholter Such- und Vorschauabfragen je Engine, Tabelle, Operation und Argumenten mit Verdrängung des am längsten nicht 
+# genutzten Eintrags (LRU)
+result_cache = {}
+result_cache_lock = threading.Lock()
+max_result_cache_size = 64
+# Versionszähler je Engine und Tabelle, die bei jedem Schreibvorgang des Tools erhöht werden, sodass ältere Ergebnisse nicht mehr verwendet werden
+table_versions = {}
+# Wenn True, wird zusätzlich ein Änderungssignal des Servers abgefragt, damit auch Änderungen durch andere Anwendungen erkannt werden
+# (siehe get_server_change_signal).
+use_server_change_signal = False
+
+def connect_to_db(user_name:str, password:str, host:str, port:int, db_name:str, db_dialect:str, db_encoding:str, pool_settings:dict = None):
+    """Erstellung bzw. Wiederverwendung einer sqlalchemy.Engine für den Datenbankzugriff und Testen der Verbindung
     
     user_name: Datenbankbenutzername als String
 
@@ -26,29 +76,25 @@ def connect_to_db(user_name:str, password:str, host:str, port:int, db_name:str,
 
     db_encoding: Zeichencodierung der Datenbank (aktuell 'utf8' oder 'latin-1' erlaubt)
 
+    pool_settings: optionales Dictionary mit abweichenden Einstellungen für den Verbindungspool ('pool_size', 'max_overflow', 'pool_recycle', 
+    'pool_pre_ping'); nicht angegebene Werte werden aus default_pool_settings übernommen
+
     Ausgabe der erstellten Engine, None, wenn keine Verbindung aufgebaut werden konnte; DialectError bei nicht unterstütztem SQL-Dialekt
     """
     # Aufbau der URL für die Engine
     db_url = f'{user_name}:{urllib.parse.quote_plus(password)}@{host}:{str(port)}/{urllib.parse.quote_plus(db_name)}'
-    engine_url = str()
     engine = None
-    # Für MariaDB muss dem Dialekt für die Vervollständigung des Treibernamens noch '+pymysql' angehängt werden, die Zeichencodierung wird als 
-    # Parameter hinter einem Fragezeichen an die URL angehängt.
-    if(db_dialect == 'mariadb'):
-        engine_url = f'{db_dialect}+pymysql://{db_url}?charset={db_encoding.lower()}'
-    # Für PostgreSQL werden der Dialektname und die URL nur zusammengefügt.
-    elif(db_dialect == 'postgresql'):
-        engine_url = f'{db_dialect}://{db_url}'
-    else:
-        # Bei nicht unterstützten Dialekten wird eine Fehlermeldung ausgegeben.
+    # Bei nicht unterstützten Dialekten wird eine Fehlermeldung ausgegeben.
+    if db_dialect not in ('mariadb', 'postgresql'):
         raise DialectError('Dieser SQL-Dialekt wird von diesem Tool nicht unterstützt.')
-        
-    # Für MariaDB erfolgt die Erstellung der Engine mithilfe der URL
-    if db_dialect == 'mariadb':
-        test_engine = create_engine(engine_url)
-    # Für PostgreSQL muss die Zeichencodierung in Form eines Dictionarys als Parameter übergeben werden.
-    elif db_dialect == 'postgresql': 
-        test_engine = create_engine(engine_url, connect_args = {'client_encoding': {db_encoding}})
+    # Suche nach einer bereits registrierten Engine für diese URL und Zeichencodierung
+    registry_key = build_engine_registry_key(build_engine_url(db_url, db_dialect, db_encoding), db_encoding)
+    with engine_registry_lock:
+        test_engine = engine_registry.get(registry_key)
+    is_registered = test_engine is not None
+    # Ist keine vorhanden, wird eine neue Engine (noch ohne Registrierung) erstellt.
+    if not is_registered:
+        test_engine = create_engine_with_pool(db_url, db_dialect, db_encoding, pool_settings)
 
     # Testen der Verbindung zur Sicherstellung, dass die erstellte Engine gültig ist
     # mögliche Fehler:
@@ -71,26 +117,144 @@ def connect_to_db(user_name:str, password:str, host:str, port:int, db_name:str,
         engine = test_engine
     finally:
         try:
-            # ... anschließend wird die Verbindung geschlossen.
+            # ... anschließend wird die Verbindung geschlossen (bzw. an den Pool zurückgegeben).
             connection.close()
         except UnboundLocalError:
-            # Wenn keine Verbindung aufgebaut werden konnte, muss auch keine geschlossen werden.
-            pass
+            # Wenn keine Verbindung aufgebaut werden konnte, muss auch keine geschlossen werden, ...
+            # ... jedoch wird der Pool einer nicht registrierten, ungültigen Engine aufgelöst.
+            if not is_registered:
+                test_engine.dispose()
     # Zuletzt wird überprüft, ob die angegebene Zeichencodierung mit der tatsächlichen Zeichencodierung der Datenbank übereinstimmt
     encoding = check_database_encoding(engine)
-    # Ist dies nicht der Fall, wird die Engine nochmal mit der tatsächlichen Codierung erstellt
+    # Ist dies nicht der Fall, wird die Engine mit der tatsächlichen Codierung aus dem Register bezogen bzw. neu erstellt, ...
     if encoding.lower() != db_encoding.lower():
-        if(db_dialect == 'mariadb'):
-            engine = create_engine(f'{db_dialect}+pymysql://{db_url}?charset={encoding.lower()}')
-        elif(db_dialect == 'postgresql'):
-            engine = create_engine(f'{db_dialect}://{db_url}', connect_args = {'client_encoding': {encoding}})
+        if not is_registered:
+            # ... wobei die Engine mit der falschen Codierung nicht weiterverwendet wird.
+            engine.dispose()
+        engine = get_or_register_engine(db_url, db_dialect, encoding, pool_settings)
+    # Anderenfalls wird die getestete Engine registriert, sofern dies nicht inzwischen (durch eine parallele Anmeldung) geschehen ist.
+    elif not is_registered:
+        with engine_registry_lock:
+            registered_engine = engine_registry.setdefault(registry_key, engine)
+        if registered_engine is not engine:
+            engine.dispose()
+            engine = registered_engine
+    # In MariaDB werden die Zeichensätze aller Tabellen der Datenbank vorab abgefragt, damit Ersetzungs- und Vereinheitlichungsvorschauen 
+    # hierfür keine weitere Abfrage benötigen.
+    if engine.dialect.name == 'mariadb':
+        load_table_character_sets(engine)
     # Ausgabe der erstellten Engine
     return engine
 
-def list_all_tables_in_db_with_preview(engine:Engine):
+def build_engine_url(db_url:str, db_dialect:str, db_encoding:str):
+    """Vervollständigung der Engine-URL um Dialekt, Treiber und ggf. Zeichencodierung
+    
+    db_url: URL-Teil mit Benutzername, Passwort, Server, Port und Datenbankname als String
+    
+    db_dialect: SQL-Dialekt der Datenbank als String ('mariadb' oder 'postgresql')
+    
+    db_encoding: Zeichencodierung der Datenbank als String
+    
+    Ausgabe der URL als String; DialectError bei nicht unterstützten SQL-Dialekten."""
+    # Für MariaDB muss dem Dialekt für die Vervollständigung des Treibernamens noch '+pymysql' angehängt werden, die Zeichencodierung wird als 
+    # Parameter hinter einem Fragezeichen an die URL angehängt.
+    if db_dialect == 'mariadb':
+        return f'{db_dialect}+pymysql://{db_url}?charset={db_encoding.lower()}'
+    # Für PostgreSQL werden der Dialektname und die URL nur zusammengefügt.
+    elif db_dialect == 'postgresql':
+        return f'{db_dialect}://{db_url}'
+    else:
+        raise DialectError('Dieser SQL-Dialekt wird von diesem Tool nicht unterstützt.')
+
+def build_engine_registry_key(engine_url:str, db_encoding:str):
+    """Erstellung des Schlüssels für das Engine-Register aus der normalisierten URL und der Zeichencodierung
+    
+    engine_url: vollständige URL der Engine als String
+    
+    db_encoding: Zeichencodierung der Datenbank als String
+    
+    Ausgabe eines Tupels aus normalisierter URL (ohne Passwort), Hashwert der Anmeldedaten und Zeichencodierung (alle als String)."""
+    url = make_url(engine_url)
+    # Servernamen unterscheiden nicht zwischen Groß- und Kleinschreibung, ...
+    if url.host is not None:
+        url = url.set(host = url.host.lower())
+    # Das Passwort wird nicht im Klartext im langlebigen Register gespeichert, sondern nur als Hashwert der Anmeldedaten, damit Anmeldungen 
+    # mit unterschiedlichen Passwörtern dennoch unterschiedliche Engines erhalten.
+    credentials_hash = hashlib.sha256(f'{url.username}\0{url.password}'.encode()).hexdigest()
+    # ... ebenso wenig die Namen der Zeichencodierungen.
+    return (url.render_as_string(hide_password = True), credentials_hash, db_encoding.lower())
+
+def create_engine_with_pool(db_url:str, db_dialect:str, db_encoding:str, pool_settings:dict = None):
+    """Erstellung einer sqlalchemy.Engine mit konfiguriertem Verbindungspool (ohne Registrierung und ohne Verbindungstest)
+    
+    db_url: URL-Teil mit Benutzername, Passwort, Server, Port und Datenbankname als String
+    
+    db_dialect: SQL-Dialekt der Datenbank als String ('mariadb' oder 'postgresql')
+    
+    db_encoding: Zeichencodierung der Datenbank als String
+    
+    pool_settings: optionales Dictionary mit abweichenden Pool-Einstellungen
+    
+    Ausgabe der erstellten Engine; DialectError bei nicht unterstützten SQL-Dialekten."""
+    # Zusammenführen der Standard- und der übergebenen Pool-Einstellungen
+    settings = dict(default_pool_settings)
+    if pool_settings is not None:
+        settings.update(pool_settings)
+    engine_url = build_engine_url(db_url, db_dialect, db_encoding)
+    # Für MariaDB erfolgt die Erstellung der Engine mithilfe der URL
+    if db_dialect == 'mariadb':
+        engine = create_engine(engine_url, **settings)
+    # Für PostgreSQL muss die Zeichencodierung in Form eines Dictionarys als Parameter übergeben werden.
+    else: 
+        engine = create_engine(engine_url, connect_args = {'client_encoding': db_encoding}, **settings)
+    # Die dialektspezifische Sitzungseinrichtung erfolgt einmalig für jede neu aufgebaute Verbindung des Pools.
+    register_session_setup(engine)
+    # Laufzeit, Tupelanzahl und aufrufende Modellfunktion jeder Anweisung werden für die Auswertung unter /metrics erfasst.
+    register_query_metrics(engine)
+    return engine
+
+def get_or_register_engine(db_url:str, db_dialect:str, db_encoding:str, pool_settings:dict = None):
+    """Beziehen einer registrierten Engine oder Erstellung und Registrierung einer neuen Engine
+    
+    db_url: URL-Teil mit Benutzername, Passwort, Server, Port und Datenbankname als String
+    
+    db_dialect: SQL-Dialekt der Datenbank als String ('mariadb' oder 'postgresql')
+    
+    db_encoding: Zeichencodierung der Datenbank als String
+    
+    pool_settings: optionales Dictionary mit abweichenden Pool-Einstellungen (nur bei Neuerstellung berücksichtigt)
+    
+    Ausgabe der registrierten Engine."""
+    registry_key = build_engine_registry_key(build_engine_url(db_url, db_dialect, db_encoding), db_encoding)
+    with engine_registry_lock:
+        engine = engine_registry.get(registry_key)
+        if engine is None:
+            engine = create_engine_with_pool(db_url, db_dialect, db_encoding, pool_settings)
+            engine_registry[registry_key] = engine
+    return engine
+
+def dispose_registered_engine(engine:Engine):
+    """Schließen des Verbindungspools einer Engine und Entfernen der Engine aus dem Engine-Register (beim Trennen der Datenbankverbindung)
+    
+    engine: sqlalchemy.Engine, deren Verbindungspool geschlossen wird"""
+    with engine_registry_lock:
+        for registry_key in [key for key, registered_engine in engine_registry.items() if registered_engine is engine]:
+            del engine_registry[registry_key]
+    engine.dispose()
+
+def dispose_registered_engines():
+    """Schließen aller Verbindungspools und Leeren des Engine-Registers (beim Trennen beider Datenbankverbindungen und beim Logout)"""
+    with engine_registry_lock:
+        for engine in engine_registry.values():
+            engine.dispose()
+        engine_registry.clear()
+
+def list_all_tables_in_db_with_preview(engine:Engine, columnar:bool = False):
     """Beziehen der Daten für die Erstellung einer Vorschau aller Tabellen in der Datenbank einer Engine
     
     engine: sqlalchemy.Engine, über die der Datenbankzugriff erfolgt
+
+    columnar: Boolean-Wert; wenn True, werden die Vorschauen als ColumnarResult statt als Liste von Listen ausgegeben
     
     Gibt ein Dictionary mit den Tabellennamen als Schlüsseln und einer Liste der Attributnamen als Wert, ein Dictionary mit den Tabellennamen 
     als Schlüsseln und den ersten 20 Einträgen der Tabelle als Wert sowie eine Liste der Tabellen ohne Primärschlüssel aus.
@@ -99,48 +263,85 @@ def list_all_tables_in_db_with_preview(engine:Engine):
     # Anlegen der Rückgabevariablen
     table_names_and_columns = {}
     table_previews = {}
-    query = ''
-    # Die Abfragen für die existierenden Tabellen beruhen in PostgreSQL und MariaDB auf unterschiedlichen Servertabellen
+    # Beziehen aller Tabellen mitsamt ihrer Primärschlüsselattribute in einer einzigen Katalogabfrage
+    primary_keys_by_table = get_primary_keys_of_all_tables(engine)
+    # Tabellen, für die die Liste der Primärschlüsselattribute leer ist, werden in die Liste der Tabellen ohne Primärschlüssel eingetragen.
+    tables_without_keys = [table for table, primary_keys in primary_keys_by_table.items() if len(primary_keys) == 0]
+    if len(primary_keys_by_table) == 0:
+        return table_names_and_columns, table_previews, tables_without_keys
+    # Die Vorschauen (jeweils die ersten 20 Tupel) werden nebenläufig über höchstens so viele Verbindungen abgefragt, wie der Pool der Engine
+    # standardmäßig bereithält.
+    max_workers = min(len(primary_keys_by_table), default_pool_settings['pool_size'])
+    with ThreadPoolExecutor(max_workers = max_workers) as executor:
+        previews = executor.map(lambda table: get_table_preview(engine, table, columnar), primary_keys_by_table.keys())
+        # Die Ergebnisse werden in der Reihenfolge der Tabellennamen übernommen.
+        for current_table, (column_names, preview_list) in zip(primary_keys_by_table.keys(), previews):
+            # Einfügen der Attributnamen in das entsprechende Ausgabe-Dictionary
+            table_names_and_columns[current_table] = column_names
+            # Einfügen der Vorschau in das entsprechende Ausgabe-Dictionary
+            table_previews[current_table] = preview_list
+    return table_names_and_columns, table_previews, tables_without_keys
+
+def get_primary_keys_of_all_tables(engine:Engine):
+    """Beziehen aller Tabellen der Datenbank einer Engine mitsamt ihrer Primärschlüsselattribute in einer einzigen Abfrage der Servertabellen
+    
+    engine: sqlalchemy.Engine, über die der Datenbankzugriff erfolgt
+    
+    Ausgabe eines Dictionarys mit den Tabellennamen als Schlüsseln und der (ggf. leeren) Liste ihrer Primärschlüsselattribute in Schlüsselreihenfolge
+    als Wert; Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    # Die Abfragen beruhen in PostgreSQL und MariaDB auf unterschiedlichen Servertabellen. Über den LEFT JOIN werden auch Tabellen ohne 
+    # Primärschlüssel (mit NULL als Attributnamen) ausgegeben.
     if engine.dialect.name == 'postgresql':
-        query = text("SELECT tablename FROM pg_catalog.pg_tables WHERE schemaname != 'pg_catalog' AND schemaname != 'information_schema'")
+        query = text("SELECT t.tablename, a.attname FROM pg_catalog.pg_tables t LEFT JOIN pg_catalog.pg_index i ON i.indrelid = format('%I.%I', t.schemaname, t.tablename)::regclass AND i.indisprimary LEFT JOIN pg_catalog.pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey) WHERE t.schemaname != 'pg_catalog' AND t.schemaname != 'information_schema' ORDER BY t.tablename, array_position(i.indkey::smallint[], a.attnum)")
     elif engine.dialect.name == 'mariadb':
-        query = text("SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_TYPE LIKE 'BASE_TABLE' AND TABLE_SCHEMA = DATABASE()")
+        query = text("SELECT t.TABLE_NAME, k.COLUMN_NAME FROM information_schema.TABLES t LEFT JOIN information_schema.KEY_COLUMN_USAGE k ON k.TABLE_SCHEMA = t.TABLE_SCHEMA AND k.TABLE_NAME = t.TABLE_NAME AND k.CONSTRAINT_NAME = 'PRIMARY' WHERE t.TABLE_TYPE LIKE 'BASE_TABLE' AND t.TABLE_SCHEMA = DATABASE() ORDER BY t.TABLE_NAME, k.ORDINAL_POSITION")
     else:
         raise DialectError(f'Der SQL-Dialekt {engine.dialect.name} wird nicht unterstützt.')
-    # Ausführen der Abfrage
     result = execute_sql_query(engine, query)
-    # Anlegen einer leeren Liste für die Tabellen ohne Primärschlüssel
-    tables_without_keys = []
-    for row in result:
-        # Die Abfrage liefert nur den Tabellennamen, jedoch muss dieser zur Weiterverarbeitung noch in einen einfachen String umgewandelt werden.
-        current_table = ''.join(tuple(row))
-        # Beziehen der Primärschlüsselattributnamen der aktuellen Tabelle
-        primary_keys = get_primary_key_from_engine(engine, current_table)
-        # Wenn die dabei erhaltene Liste leer ist, hat die aktuelle Tabelle keine Primärschlüsselattribute, ...
-        if len(primary_keys) == 0:
-            # ... daher wird sie in die entsprechende Liste eingetragen.
-            tables_without_keys.append(current_table)
-        # Anschließend werden die ersten 20 Tupel der aktuellen Tabelle abgefragt.
-        query = f'SELECT * FROM {convert_string_if_contains_capitals_or_spaces(current_table, engine.dialect.name)} LIMIT 20'
-        preview_result = execute_sql_query(engine, text(query))
-        # Beziehen der Attributnamen aus den Schlüsseln des CursorResults
-        column_names = list(preview_result.keys())
-        # Umwandlung des Vorschauergebnisses in eine Liste von Listen
-        preview_list = convert_result_to_list_of_lists(preview_result)
-        # Einfügen der Attributnamen in das entsprechende Ausgabe-Dictionary
-        table_names_and_columns[current_table] = column_names
-        # Einfügen der Vorschau in das entsprechende Ausgabe-Dictionary
-        table_previews[current_table] = preview_list
-    return table_names_and_columns, table_previews, tables_without_keys
+    primary_keys_by_table = {}
+    for table_name, column_name in result:
+        # Jede Tabelle wird beim ersten Auftreten mit einer leeren Liste angelegt, ...
+        if table_name not in primary_keys_by_table.keys():
+            primary_keys_by_table[table_name] = []
+        # ... in die anschließend ihre Primärschlüsselattribute eingetragen werden.
+        if column_name is not None:
+            primary_keys_by_table[table_name].append(column_name)
+    return primary_keys_by_table
+
+def get_table_preview(engine:Engine, table_name:str, columnar:bool = False):
+    """Beziehen der ersten 20 Tupel einer Tabelle für die Tabellenvorschau
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die Tabelle
+    
+    table_name: Name der Tabelle als String
+
+    columnar: Boolean-Wert; wenn True, wird die Vorschau als ColumnarResult statt als Liste von Listen ausgegeben
+    
+    Ausgabe eines Tupels aus der Liste der Attributnamen und der Liste von Listen (bzw. dem ColumnarResult) mit den Tupeln der Vorschau."""
+    query = f'SELECT * FROM {convert_string_if_contains_capitals_or_spaces(table_name, engine.dialect.name)} LIMIT 20'
+    preview_result = execute_sql_query(engine, text(query))
+    # Beziehen der Attributnamen aus den Schlüsseln des CursorResults
+    column_names = list(preview_result.keys())
+    # Umwandlung des Vorschauergebnisses in ein ColumnarResult ...
+    if columnar:
+        return column_names, convert_result_to_columnar(preview_result)
+    # ... oder in eine Liste von Listen
+    return column_names, convert_result_to_list_of_lists(preview_result)
  
-def get_full_table_ordered_by_primary_key(table_meta_data:TableMetaData, convert:bool = True):
+def get_full_table_ordered_by_primary_key(table_meta_data:TableMetaData, convert:bool = True, stream:bool = False, batch_size:int = None):
     """Beziehen einer vollständigen Tabelle, nach den Primärschlüsselattributen geordnet.
     
     table_meta_data: TableMetaData-Objekt der Tabelle
     
     convert: Boolean-Wert; wenn True, wird das Abfrageergebnis als Liste von Listen ausgegeben, sonst als CursorResult.
+
+    stream: Boolean-Wert; wenn True, wird die Tabelle über einen serverseitigen Cursor blockweise als Generator von Listen von Listen ausgegeben,
+    ohne sie vollständig in den Speicher zu laden (convert wird dann ignoriert).
+
+    batch_size: optionale Anzahl der Tupel je Block beim Streaming; standardmäßig default_batch_size
     
-    Ausgabe der Tabelle als CursorResult oder als Liste von Listen; Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    Ausgabe der Tabelle als CursorResult, als Liste von Listen oder als Generator von Blöcken; Ausgabe eines DialectErrors bei nicht unterstützten 
+    SQL-Dialekten."""
     # Beziehen der benötigten Variablen aus dem TableMetaData-Objekt der Tabelle
     engine = table_meta_data.engine
     db_dialect = engine.dialect.name
@@ -155,19 +356,158 @@ def get_full_table_ordered_by_primary_key(table_meta_data:TableMetaData, convert
     # Erstellen der Abfrage
     query = text(f'SELECT * FROM {table_name} ORDER BY {keys_for_ordering}')
     # Ausführung der Abfrage, ...
-    # ... entweder mit ...
-    if convert:
+    # ... entweder blockweise über einen serverseitigen Cursor, ...
+    if stream:
+        return stream_sql_query(engine, query, batch_size = batch_size)
+    # ... mit ...
+    elif convert:
         return convert_result_to_list_of_lists(execute_sql_query(engine, query))
     # ... oder ohne Umwandlung in eine Liste von Listen.
     else:
         return execute_sql_query(engine, query)
 
+def get_table_page(table_meta_data:TableMetaData, limit:int, last_key:list = None, sort_column:str = None, descending:bool = False, offset:int = None, filter_condition:str = None, filter_params:dict = None, look_ahead:bool = False):
+    """Beziehen einer einzelnen Seite einer Tabelle für die serverseitige Paginierung per Keyset (WHERE (Sortierattribut, Primärschlüssel) > 
+    (letzter Schlüssel) ORDER BY ... LIMIT n), sodass weder die vollständige Tabelle übertragen noch bei späten Seiten über alle vorigen Tupel 
+    hinweggezählt werden muss.
+    
+    table_meta_data: TableMetaData-Objekt der Tabelle
+    
+    limit: maximale Anzahl der auszugebenden Tupel
+
+    last_key: optionale Liste der Werte der Ordnungsattribute (ggf. Sortierattribut, dann Primärschlüsselattribute) des letzten Tupels der 
+    vorigen Seite; ohne diese Angabe beginnt die Seite am Tabellenanfang bzw. bei offset
+
+    sort_column: optionaler Name des Attributs, nach dem vor den Primärschlüsselattributen sortiert werden soll
+
+    descending: Boolean-Wert; wenn True, wird absteigend sortiert
+
+    offset: optionale Anzahl zu überspringender Tupel, die nur verwendet wird, wenn kein last_key angegeben ist (z. B. bei Sprüngen auf entfernte 
+    Seiten oder bei Sortierung nach Attributen, die NULL-Werte zulassen)
+
+    filter_condition: optionale SQL-Bedingung (ohne WHERE), auf deren Tupel die Seite beschränkt wird, z. B. die Bedingung einer Suche
+
+    filter_params: optionales Dictionary mit den Parametern der Filterbedingung
+
+    look_ahead: Boolean-Wert; wenn True, wird ein Tupel mehr abgefragt, um ohne Zählung festzustellen, ob eine weitere Seite existiert
+    
+    Ausgabe eines Tupels aus der Liste von Listen mit den Tupeln der Seite und dem Schlüssel für die nächste Seite (None, falls kein Keyset 
+    möglich ist), bei look_ahead = True ergänzt um einen Boolean-Wert, ob weitere Tupel folgen; Ausgabe eines DialectErrors bei nicht 
+    unterstützten SQL-Dialekten und eines QueryErrors bei ungültigen Angaben."""
+    engine = table_meta_data.engine
+    db_dialect = engine.dialect.name
+    if db_dialect not in ('mariadb', 'postgresql'):
+        raise DialectError(f'Der SQL-Dialekt {db_dialect} wird nicht unterstützt.')
+    # Die Ordnungsattribute bestehen aus dem ggf. angegebenen Sortierattribut und den Primärschlüsselattributen, die die Eindeutigkeit sicherstellen.
+    order_columns = list(table_meta_data.primary_keys)
+    if sort_column is not None:
+        if sort_column not in table_meta_data.columns:
+            raise QueryError(f'Das Attribut {sort_column} existiert nicht in der Tabelle {table_meta_data.table_name}.')
+        if sort_column not in order_columns:
+            order_columns.insert(0, sort_column)
+    # Ein Keyset über Attribute, die NULL-Werte zulassen, ist nicht eindeutig vergleichbar, sodass in diesem Fall nur OFFSET verwendet werden kann.
+    keyset_possible = not any([table_meta_data.data_type_info[column].get('is_nullable', True) for column in order_columns if column not in table_meta_data.primary_keys])
+    if last_key is not None and len(last_key) != len(order_columns):
+        raise QueryError('Der angegebene Schlüssel passt nicht zur Sortierung der Tabelle.')
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+    escaped_columns = [convert_string_if_contains_capitals_or_spaces(column, db_dialect) for column in order_columns]
+    direction = 'DESC' if descending else 'ASC'
+    order_clause = ', '.join([f'{column} {direction}' for column in escaped_columns])
+    params = {'limit': limit + 1 if look_ahead else limit}
+    conditions = []
+    # Die Filterbedingung wird geklammert, damit darin enthaltene OR-Verknüpfungen nicht die Keyset-Bedingung aufheben.
+    if filter_condition is not None:
+        conditions.append(f'({filter_condition})')
+        if filter_params is not None:
+            params.update(filter_params)
+    # Keyset-Bedingung als Zeilenwertvergleich, den beide Dialekte unterstützen
+    use_keyset = last_key is not None and keyset_possible
+    if use_keyset:
+        key_params = []
+        for index, value in enumerate(last_key):
+            params[f'key_{index}'] = value
+            key_params.append(f':key_{index}')
+        operator = '<' if descending else '>'
+        conditions.append(f'({", ".join(escaped_columns)}) {operator} ({", ".join(key_params)})')
+    condition = f' WHERE {" AND ".join(conditions)}' if len(conditions) > 0 else ''
+    query_string = f'SELECT * FROM {table_name}{condition} ORDER BY {order_clause} LIMIT :limit'
+    # Ohne Schlüssel wird für Seiten außerhalb des Tabellenanfangs auf OFFSET zurückgegriffen.
+    if not use_keyset and offset is not None and offset > 0:
+        query_string += ' OFFSET :offset'
+        params['offset'] = offset
+    # Datenbankfehler, z. B. bei Schlüsselwerten, die nicht zum Datentyp der Ordnungsattribute passen, werden als QueryError ausgegeben.
+    try:
+        result = execute_sql_query(engine, text(query_string), params, raise_exceptions = True)
+    except Exception as error:
+        raise QueryError(f'Die Seite der Tabelle {table_meta_data.table_name} konnte nicht abgefragt werden: {str(error)}')
+    column_names = list(result.keys())
+    rows = convert_result_to_list_of_lists(result)
+    # Das zusätzlich abgefragte Tupel zeigt nur an, dass eine weitere Seite existiert, und gehört nicht zur Seite.
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_key = None
+    # Schlüssel für die nächste Seite aus den Ordnungsattributen des letzten Tupels; Werte ohne JSON-Entsprechung (Datum, Decimal etc.) werden als
+    # String übergeben, den die Datenbank beim Vergleich wieder in den Datentyp des Attributs umwandelt.
+    if keyset_possible and len(rows) > 0:
+        last_row = rows[-1]
+        next_key = []
+        for column in order_columns:
+            value = last_row[column_names.index(column)]
+            if isinstance(value, (bytes, bytearray, memoryview)):
+                next_key = None
+                break
+            elif value is not None and not isinstance(value, (bool, int, float, str)):
+                value = str(value)
+            next_key.append(value)
+    if look_ahead:
+        return rows, next_key, has_more
+    return rows, next_key
+
+def stream_sql_query(engine:Engine, query:text, params:dict = None, batch_size:int = None, with_column_names:bool = False):
+    """Blockweise Ausführung einer Abfrage über einen serverseitigen Cursor (stream_results/yield_per), sodass das Ergebnis nie vollständig im 
+    Speicher gehalten werden muss
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die gewünschte Datenbank
+    
+    query: SQL-Abfrage als sqlalchemy.text
+    
+    params: optionales Dictionary mit den Namen und Werten der bei der Abfrage zu berücksichtigenden Parameter
+    
+    batch_size: optionale Anzahl der Tupel je Block; standardmäßig default_batch_size
+
+    with_column_names: Boolean-Wert; wenn True, wird vor dem ersten Block die Liste der Attributnamen des Ergebnisses ausgegeben
+    
+    Ausgabe eines Generators, der die Tupel in Blöcken als Listen von Listen liefert. Die Verbindung bleibt bis zum vollständigen Durchlaufen oder
+    Schließen des Generators geöffnet; Fehler bei der Ausführung werden weitergegeben."""
+    if batch_size is None:
+        batch_size = default_batch_size
+    # Läuft eine Arbeitseinheit für diese Engine, wird deren Verbindung genutzt, ...
+    active = get_active_unit_of_work(engine)
+    if active is not None:
+        connection = active[0]
+    # ... anderenfalls wird eine eigene Verbindung aus dem Pool bezogen.
+    else:
+        connection = open_connection(engine)
+    try:
+        # yield_per aktiviert den serverseitigen Cursor und legt die Blockgröße fest.
+        result = connection.execution_options(yield_per = batch_size).execute(query, params)
+        if with_column_names:
+            yield list(result.keys())
+        for partition in result.partitions(batch_size):
+            yield [list(row) for row in partition]
+        result.close()
+    finally:
+        # Eine eigene Verbindung wird ohne Speichern (nur lesender Zugriff) wieder an den Pool zurückgegeben.
+        if active is None:
+            connection.rollback()
+            connection.close()
+
 def get_row_count_from_engine(engine:Engine, table_name:str):
     """Ermittlung der Gesamtanzahl von Tupeln in einer Tabelle.
     
     engine: sqlalchemy.Engine mit Zugriff auf die entsprechende Datenbank
 
-    table_name: Name der abzufragenden Tabelle als String.
+    table_name: Name der abzufragenden Tabelle als String
 
     Ausgabe der Gesamttupelanzahl als Integer; Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten.
     """
@@ -183,6 +523,191 @@ def get_row_count_from_engine(engine:Engine, table_name:str):
     # Ausgabe des Wertes 
     return res.fetchone()[0] 
 
+def get_estimated_row_count(engine:Engine, table_name:str):
+    """Ermittlung der Gesamtanzahl von Tupeln in einer Tabelle, die für große Tabellen der von den Servertabellen geführten Schätzung 
+    (pg_class.reltuples bzw. information_schema.TABLES.TABLE_ROWS) entnommen wird, statt die Tabelle vollständig zu durchlaufen. Liegt keine 
+    Schätzung vor oder liegt diese unter exact_row_count_limit, wird exakt gezählt.
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die entsprechende Datenbank
+
+    table_name: Name der abzufragenden Tabelle als String
+
+    Ausgabe eines Tupels aus der Tupelanzahl (Integer) und einem Boolean-Wert, der angibt, ob diese exakt ist; Ausgabe eines DialectErrors bei 
+    nicht unterstützten SQL-Dialekten."""
+    estimated_row_count = get_catalog_row_count_estimate(engine, table_name)
+    # Nur große Tabellen mit vorhandener Schätzung werden nicht exakt gezählt.
+    if estimated_row_count is not None and estimated_row_count >= exact_row_count_limit:
+        return estimated_row_count, False
+    return get_row_count_from_engine(engine, table_name), True
+
+def get_catalog_row_count_estimate(engine:Engine, table_name:str):
+    """Beziehen der geschätzten Tupelanzahl einer Tabelle aus den Servertabellen, ohne die Tabelle zu durchlaufen
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die entsprechende Datenbank
+
+    table_name: Name der abzufragenden Tabelle als String
+
+    Ausgabe der geschätzten Tupelanzahl als Integer oder None, wenn (z. B. vor der ersten Analyse der Tabelle in PostgreSQL) keine Schätzung 
+    vorliegt; Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    if engine.dialect.name == 'postgresql':
+        # reltuples beträgt -1 (ab PostgreSQL 14) bzw. 0, wenn die Tabelle noch nicht analysiert wurde.
+        query = text(f"SELECT reltuples::bigint FROM pg_class WHERE oid = '{convert_string_if_contains_capitals_or_spaces(table_name, 'postgresql')}'::regclass")
+        params = None
+    elif engine.dialect.name == 'mariadb':
+        query = text('SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name')
+        params = {'table_name': table_name}
+    else:
+        raise DialectError(f'Der SQL-Dialekt {engine.dialect.name} wird nicht unterstützt.')
+    result = execute_sql_query(engine, query, params)
+    if result is None:
+        return None
+    row = result.fetchone()
+    # Fehlende oder nicht positive Schätzungen werden nicht verwendet.
+    if row is None or row[0] is None or row[0] <= 0:
+        return None
+    return int(row[0])
+
+def start_exact_row_count(table_meta_data:TableMetaData):
+    """Start der exakten Zählung der Tupel einer Tabelle im Hintergrund, wenn deren TableMetaData-Objekt bisher nur eine geschätzte Tupelanzahl 
+    enthält. Das Ergebnis wird nicht vom Hintergrund-Thread in das Objekt geschrieben, sondern von ensure_exact_row_count aus dem Future bezogen.
+    
+    table_meta_data: TableMetaData-Objekt der Tabelle"""
+    if table_meta_data.row_count_is_exact or table_meta_data.exact_row_count_future is not None:
+        return
+    table_meta_data.exact_row_count_future = row_count_executor.submit(get_row_count_from_engine, table_meta_data.engine, table_meta_data.table_name)
+
+def ensure_exact_row_count(table_meta_data:TableMetaData, wait:bool = True):
+    """Übernahme der exakten Tupelanzahl in das TableMetaData-Objekt einer Tabelle, z. B. für die Eindeutigkeitsprüfung bei der 
+    Attributübertragung. Läuft bereits eine Zählung im Hintergrund, wird auf deren Ergebnis gewartet.
+    
+    table_meta_data: TableMetaData-Objekt der Tabelle
+
+    wait: Boolean-Wert; wenn False, wird nur das Ergebnis einer bereits abgeschlossenen Zählung übernommen und anderenfalls die bisherige 
+    (ggf. geschätzte) Tupelanzahl ausgegeben, etwa für Anzeigen, die nicht auf die Zählung warten sollen
+    
+    Ausgabe der (bei wait = True exakten) Tupelanzahl als Integer."""
+    if not table_meta_data.row_count_is_exact:
+        future = table_meta_data.exact_row_count_future
+        # Ohne Warten wird eine noch laufende Zählung nicht abgewartet.
+        if not wait and (future is None or not future.done()):
+            return table_meta_data.total_row_count
+        if future is not None and future.exception() is None:
+            row_count = future.result()
+        # Ist die Zählung im Hintergrund fehlgeschlagen, wird (nur beim Warten) erneut gezählt, sonst bleibt die Schätzung erhalten.
+        elif wait:
+            row_count = get_row_count_from_engine(table_meta_data.engine, table_meta_data.table_name)
+        else:
+            return table_meta_data.total_row_count
+        table_meta_data.total_row_count = row_count
+        table_meta_data.row_count_is_exact = True
+        table_meta_data.exact_row_count_future = None
+    return table_meta_data.total_row_count
+
+def get_primary_key_ranges(table_meta_data:TableMetaData, partition_count:int = None):
+    """Aufteilung einer Tabelle in Bereiche ihres Primärschlüssels für die nebenläufige Ausführung von Abfragen (siehe execute_partitioned_query). 
+    Die Grenzen werden in PostgreSQL den Histogrammgrenzen der Statistik (pg_stats) entnommen, damit die Bereiche auch bei ungleich verteilten 
+    Schlüsselwerten etwa gleich viele Tupel enthalten; ohne Statistik und in MariaDB wird der Bereich zwischen Minimum und Maximum gleichmäßig geteilt.
+    
+    table_meta_data: TableMetaData-Objekt der Tabelle
+    
+    partition_count: gewünschte Anzahl der Bereiche, standardmäßig die Größe des Verbindungspools
+    
+    Ausgabe einer aufsteigend geordneten Liste von Tupeln aus unterer (einschließlich) und oberer Grenze (ausschließlich); der erste und der
+    letzte Bereich sind mit None nach unten bzw. oben offen, damit auch Werte außerhalb einer veralteten Statistik erfasst werden. Ausgabe von 
+    None, wenn die Tabelle nicht aufgeteilt werden kann oder soll: bei zusammengesetzten oder nicht ganzzahligen Primärschlüsseln, weniger 
+    als partitioned_scan_min_rows Tupeln, zu wenigen unterschiedlichen Schlüsselwerten oder einer im aktuellen Thread laufenden Arbeitseinheit,
+    deren nicht gespeicherte Änderungen über andere Verbindungen nicht sichtbar wären."""
+    if partition_count is None:
+        partition_count = default_pool_settings['pool_size']
+    engine = table_meta_data.engine
+    primary_keys = table_meta_data.primary_keys
+    if (partition_count < 2 or len(primary_keys) != 1 or table_meta_data.get_data_type_group(primary_keys[0]) != 'integer' 
+        or table_meta_data.total_row_count < partitioned_scan_min_rows or get_active_unit_of_work(engine) is not None):
+        return None
+    dialect = engine.dialect.name
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, dialect)
+    key = convert_string_if_contains_capitals_or_spaces(primary_keys[0], dialect)
+    bounds = []
+    ### Grenzen aus dem Histogramm der Statistik (nur PostgreSQL) ###
+    if dialect == 'postgresql':
+        result = execute_sql_query(engine, text('SELECT CAST(histogram_bounds AS TEXT) FROM pg_stats WHERE schemaname = current_schema() AND tablename = :table_name AND attname = :column_name'), 
+                                   {'table_name': table_meta_data.table_name, 'column_name': primary_keys[0]})
+        row = result.fetchone() if result is not None else None
+        if row is not None and row[0] is not None:
+            histogram = [int(value) for value in row[0].strip('{}').split(',')]
+            # Aus den Histogrammgrenzen werden gleichmäßig verteilte Werte als Bereichsgrenzen übernommen.
+            if len(histogram) > partition_count:
+                bounds = [histogram[round(index * (len(histogram) - 1) / partition_count)] for index in range(1, partition_count)]
+    ### Gleichmäßige Teilung zwischen Minimum und Maximum ###
+    if len(bounds) == 0:
+        result = execute_sql_query(engine, text(f'SELECT MIN({key}), MAX({key}) FROM {table_name}'))
+        row = result.fetchone() if result is not None else None
+        if row is None or row[0] is None:
+            return None
+        minimum, maximum = row
+        step = (maximum - minimum) / partition_count
+        bounds = [minimum + round(step * index) for index in range(1, partition_count)]
+    # Bei wenigen unterschiedlichen Schlüsselwerten können Grenzen mehrfach vorkommen.
+    bounds = sorted(set(bounds))
+    if len(bounds) == 0:
+        return None
+    limits = [None] + bounds + [None]
+    return [(limits[index], limits[index + 1]) for index in range(len(limits) - 1)]
+
+def build_primary_key_range_condition(table_meta_data:TableMetaData, has_lower_bound:bool, has_upper_bound:bool, prefix:str = ''):
+    """Aufbau der Bedingung (ohne WHERE) für einen Primärschlüsselbereich mit den Platzhaltern :partition_lower und :partition_upper
+    
+    table_meta_data: TableMetaData-Objekt der Tabelle mit genau einem Primärschlüsselattribut
+    
+    has_lower_bound: Boolean-Wert; wenn True, wird die untere Grenze (einschließlich) geprüft
+    
+    has_upper_bound: Boolean-Wert; wenn True, wird die obere Grenze (ausschließlich) geprüft
+    
+    prefix: optionales Präfix des Attributnamens (z. B. 'sub.')
+    
+    Ausgabe der Bedingung als String."""
+    key = prefix + convert_string_if_contains_capitals_or_spaces(table_meta_data.primary_keys[0], table_meta_data.engine.dialect.name)
+    conditions = []
+    if has_lower_bound:
+        conditions.append(f'{key} >= :partition_lower')
+    if has_upper_bound:
+        conditions.append(f'{key} < :partition_upper')
+    if len(conditions) == 0:
+        return '1 = 1'
+    return ' AND '.join(conditions)
+
+def execute_partitioned_query(table_meta_data:TableMetaData, ranges:list[tuple], build_query, params:dict = None):
+    """Nebenläufige Ausführung einer Abfrage je Primärschlüsselbereich über getrennte Verbindungen aus dem Pool der Engine. Da die Bereiche 
+    in eigenen Transaktionen abgefragt werden, beruhen sie nicht auf einem gemeinsamen Datenbankzustand.
+    
+    table_meta_data: TableMetaData-Objekt der Tabelle
+    
+    ranges: Liste der Primärschlüsselbereiche (siehe get_primary_key_ranges)
+    
+    build_query: Funktion, die für die Angaben, ob der Bereich eine untere und eine obere Grenze hat, die Abfrage (sqlalchemy.text) ausgibt; 
+    die Grenzen werden als :partition_lower und :partition_upper übergeben (siehe build_primary_key_range_condition)
+    
+    params: optionales Dictionary mit den weiteren Parametern der Abfrage
+    
+    Ausgabe eines Tupels aus der Liste der Attributnamen des Ergebnisses und einer Liste der Ergebnisse (als Liste von Listen) je Bereich in 
+    der Reihenfolge der Bereiche; Fehler bei der Ausführung werden weitergegeben."""
+    engine = table_meta_data.engine
+    def execute_partition(bounds:tuple):
+        lower, upper = bounds
+        partition_params = dict(params) if params is not None else {}
+        if lower is not None:
+            partition_params['partition_lower'] = lower
+        if upper is not None:
+            partition_params['partition_upper'] = upper
+        result = execute_sql_query(engine, build_query(lower is not None, upper is not None), partition_params, raise_exceptions = True)
+        return list(result.keys()), convert_result_to_list_of_lists(result)
+    # Es werden höchstens so viele Bereiche gleichzeitig abgefragt, wie der Pool der Engine standardmäßig Verbindungen bereithält.
+    with ThreadPoolExecutor(max_workers = min(len(ranges), default_pool_settings['pool_size'])) as executor:
+        partitions = list(executor.map(execute_partition, ranges))
+    column_names = partitions[0][0] if len(partitions) > 0 else []
+    return column_names, [rows for _, rows in partitions]
+
+@lru_cache(maxsize = 1024)
 def build_sql_condition(column_names:tuple, db_dialect:str, operator:str = None):
     """Aufbau einer SQL-Abfragen-Bedingung
     
@@ -193,7 +718,8 @@ def build_sql_condition(column_names:tuple, db_dialect:str, operator:str = None)
     operator: gewünschter Operator als String ('AND' oder 'OR' erlaubt).
 
     Ausgabe der SQL-Bedingung als String; Ausgabe eines QueryErrors, wenn ungültige Operatoren oder zu wenige Attribute angegeben sind oder 
-    bei mehr als einem Attribut der Operator fehlt.
+    bei mehr als einem Attribut der Operator fehlt. Da die Bedingung nur von den Argumenten abhängt, wird sie je Argumentkombination 
+    zwischengespeichert.
     """
     # Überprüfung, ob die Argumente geeignet sind
     if (operator and operator.upper() not in ('AND', 'OR')):
@@ -214,6 +740,125 @@ def build_sql_condition(column_names:tuple, db_dialect:str, operator:str = None)
         condition = f'{condition} {convert_string_if_contains_capitals_or_spaces(item, db_dialect)} = :{item}'
     return condition
 
+def get_cached_statement(cache_key:tuple, build_query):
+    """Beziehen einer SQL-Anweisung aus dem Anweisungs-Cache bzw. Erstellen und Speichern der Anweisung, wenn sie dort noch nicht vorliegt
+    
+    cache_key: Tupel, das die Anweisung eindeutig beschreibt; es beginnt mit dem SQL-Dialekt und dem Tabellennamen, gefolgt von der Operation 
+    und allen weiteren Angaben (Attribute, Datentypgruppen etc.), von denen der Text der Anweisung abhängt
+    
+    build_query: Funktion ohne Argumente, die den Text der Anweisung als String ausgibt; sie wird nur aufgerufen, wenn die Anweisung noch nicht
+    im Cache liegt
+    
+    Ausgabe der Anweisung als sqlalchemy.text"""
+    with statement_cache_lock:
+        statement = statement_cache.get(cache_key)
+    if statement is not None:
+        return statement
+    # Der Aufbau erfolgt außerhalb der Sperre, damit andere Threads nicht warten müssen; bei gleichzeitigem Aufbau wird der zuerst 
+    # gespeicherte Eintrag verwendet.
+    statement = text(build_query())
+    with statement_cache_lock:
+        if cache_key not in statement_cache and len(statement_cache) >= max_statement_cache_size:
+            # Dictionarys behalten die Einfügereihenfolge bei, sodass der erste Schlüssel der älteste ist.
+            statement_cache.pop(next(iter(statement_cache)))
+        return statement_cache.setdefault(cache_key, statement)
+
+def invalidate_statement_cache(table_name:str = None):
+    """Entfernen von Einträgen aus dem Anweisungs-Cache, z. B. nachdem sich das Schema einer Tabelle geändert hat
+    
+    table_name: optionaler Name der Tabelle, deren Anweisungen entfernt werden sollen; ohne Angabe wird der gesamte Cache geleert"""
+    with statement_cache_lock:
+        if table_name is None:
+            statement_cache.clear()
+        else:
+            for key in [key for key in statement_cache.keys() if key[1] == table_name]:
+                statement_cache.pop(key)
+
+def get_cached_result(table_meta_data:TableMetaData, operation:str, arguments:tuple, compute):
+    """Beziehen des Ergebnisses einer Such- oder Vorschauabfrage aus dem Ergebnis-Cache bzw. Berechnung und Speicherung bei fehlendem oder 
+    veraltetem Eintrag. Die Einträge gelten bis zum nächsten Schreibvorgang des Tools auf der Tabelle (siehe invalidate_result_cache) und, wenn 
+    use_server_change_signal gesetzt ist, bis zur nächsten vom Server gemeldeten Änderung. Ausgegebene Ergebnisse werden von mehreren Aufrufen 
+    gemeinsam genutzt und dürfen daher nicht verändert werden.
+    
+    table_meta_data: TableMetaData-Objekt der abgefragten Tabelle
+    
+    operation: Name der Operation als String (z. B. 'search_page')
+    
+    arguments: Tupel der übrigen Argumente (z. B. Attribute und Suchstring), die das Ergebnis bestimmen; muss hashbar sein
+    
+    compute: Funktion ohne Parameter, die das Ergebnis berechnet
+    
+    Ausgabe des Ergebnisses; Fehler bei der Berechnung werden weitergegeben und nicht gespeichert."""
+    engine = table_meta_data.engine
+    table_key = build_meta_data_cache_key(engine, table_meta_data.table_name)
+    with result_cache_lock:
+        version = table_versions.setdefault(table_key, 0)
+    server_signal = get_server_change_signal(engine, table_meta_data.table_name) if use_server_change_signal else None
+    cache_key = table_key + (operation, arguments, version, server_signal)
+    with result_cache_lock:
+        if cache_key in result_cache:
+            # Erneutes Einfügen, damit der Eintrag als zuletzt genutzt am Ende der Einfügereihenfolge steht
+            result = result_cache.pop(cache_key)
+            result_cache[cache_key] = result
+            return result
+    result = compute()
+    with result_cache_lock:
+        # Ergebnisse, während deren Berechnung die Tabelle verändert wurde, werden nicht gespeichert.
+        if table_versions.get(table_key) == version:
+            result_cache[cache_key] = result
+            while len(result_cache) > max_result_cache_size:
+                result_cache.pop(next(iter(result_cache)))
+    return result
+
+def get_table_version(table_meta_data:TableMetaData):
+    """Beziehen des Versionszählers einer Tabelle, der bei jedem Schreibvorgang des Tools erhöht wird (siehe invalidate_result_cache)
+    
+    table_meta_data: TableMetaData-Objekt der Tabelle
+    
+    Ausgabe des Zählers als Integer."""
+    with result_cache_lock:
+        return table_versions.get(build_meta_data_cache_key(table_meta_data.engine, table_meta_data.table_name), 0)
+
+def get_server_change_signal(engine:Engine, table_name:str):
+    """Abfrage eines günstig zu ermittelnden Wertes, der sich bei Änderungen der Tabelle durch beliebige Anwendungen ändert: in PostgreSQL die 
+    Summe der eingefügten, aktualisierten und gelöschten Tupel aus pg_stat_user_tables (mit kurzer Verzögerung durch die Statistikerfassung),
+    in MariaDB der Zeitpunkt der letzten Änderung (UPDATE_TIME) aus information_schema.TABLES
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die Tabelle
+    
+    table_name: Name der Tabelle als String
+    
+    Ausgabe des Wertes bzw. None, wenn er nicht ermittelt werden kann."""
+    if engine.dialect.name == 'postgresql':
+        query = text('SELECT n_tup_ins + n_tup_upd + n_tup_del FROM pg_stat_user_tables WHERE schemaname = current_schema() AND relname = :table_name')
+    elif engine.dialect.name == 'mariadb':
+        query = text('SELECT UPDATE_TIME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name')
+    else:
+        return None
+    result = execute_sql_query(engine, query, {'table_name': table_name})
+    row = result.fetchone() if result is not None else None
+    return row[0] if row is not None else None
+
+def invalidate_result_cache(engine:Engine = None, table_name:str = None):
+    """Entfernen von Einträgen aus dem Ergebnis-Cache, nachdem das Tool eine Tabelle verändert hat (Ersetzen, Vereinheitlichen, Zusammenführen)
+    
+    engine: optionale sqlalchemy.Engine, deren Einträge entfernt werden sollen; ohne Angabe wird der gesamte Cache geleert
+    
+    table_name: optionaler Name der Tabelle, deren Einträge entfernt werden sollen; ohne Angabe werden alle Einträge der Engine entfernt"""
+    with result_cache_lock:
+        if engine is None:
+            table_keys = list(table_versions.keys())
+        elif table_name is not None:
+            table_keys = [build_meta_data_cache_key(engine, table_name)]
+        else:
+            url = engine.url.render_as_string(hide_password = True)
+            table_keys = [key for key in table_versions.keys() if key[0] == url]
+        # Die Erhöhung der Versionszähler verhindert auch das Speichern von Ergebnissen, die gerade noch berechnet werden.
+        for table_key in table_keys:
+            table_versions[table_key] = table_versions.get(table_key, 0) + 1
+        for key in [key for key in result_cache.keys() if key[:2] in table_keys]:
+            result_cache.pop(key)
+
 def check_database_encoding(engine:Engine):
     """Beziehen der Datenbank-Zeichencodierung aus den Servertabellen
     
@@ -234,35 +879,132 @@ def check_database_encoding(engine:Engine):
         raise DialectError(f'Der SQL-Dialekt {engine.dialect.name} wird nicht unterstützt.')
     return encoding
 
+# Threadlokale Ablage der Verbindungen, die aktuell von einer Arbeitseinheit (unit_of_work) genutzt werden, je Engine
+active_units_of_work = threading.local()
+
+def initialize_session(dbapi_connection, connection_record):
+    """Dialektspezifische Einrichtung einer neu aufgebauten Datenbankverbindung; wird als Listener für das Pool-Ereignis 'connect' registriert.
+    
+    dbapi_connection: Verbindungsobjekt des Datenbanktreibers
+    
+    connection_record: Eintrag des Verbindungspools für diese Verbindung"""
+    # Für MariaDB: Setzen der Trennzeichen auf doppelte Anführungszeichen, damit einfache Abfragen in beiden Dialekten gleich gehandhabt werden 
+    # können. Da sql_mode eine Sitzungsvariable ist, genügt dies einmal pro physischer Verbindung.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("SET sql_mode='ANSI_QUOTES'")
+    cursor.close()
+    dbapi_connection.commit()
+    # Vermerk im Pool-Eintrag, damit die Einrichtung bei der Ausgabe der Verbindung nicht wiederholt wird
+    connection_record.info['session_initialized'] = True
+
+def register_session_setup(engine:Engine):
+    """Registrierung der Sitzungseinrichtung für alle künftig aufgebauten Verbindungen einer Engine (nur für MariaDB erforderlich)
+    
+    engine: sqlalchemy.Engine, für die die Einrichtung registriert werden soll"""
+    if engine.dialect.name == 'mariadb' and not event.contains(engine, 'connect', initialize_session):
+        event.listen(engine, 'connect', initialize_session)
+
+def open_connection(engine:Engine):
+    """Beziehen einer eingerichteten Verbindung aus dem Pool einer Engine
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die gewünschte Datenbank
+    
+    Ausgabe der sqlalchemy.Connection."""
+    # Auch Engines, die nicht über connect_to_db erstellt wurden, erhalten die Sitzungseinrichtung für neue Verbindungen.
+    register_session_setup(engine)
+    connection = engine.connect()
+    # Verbindungen, die vor der Registrierung aufgebaut wurden, werden einmalig nachträglich eingerichtet.
+    if engine.dialect.name == 'mariadb' and not connection.connection.info.get('session_initialized'):
+        connection.execute(text("SET sql_mode='ANSI_QUOTES'"))
+        connection.commit()
+        connection.connection.info['session_initialized'] = True
+    return connection
+
+def get_active_unit_of_work(engine:Engine):
+    """Beziehen der Verbindung und der Einstellungen einer im aktuellen Thread laufenden Arbeitseinheit für eine Engine
+    
+    engine: sqlalchemy.Engine, für die die Arbeitseinheit gesucht wird
+    
+    Ausgabe eines Tupels aus sqlalchemy.Connection und dem Savepoint-Flag oder None, wenn keine Arbeitseinheit aktiv ist."""
+    units = getattr(active_units_of_work, 'units', None)
+    if units is None:
+        return None
+    return units.get(engine)
+
+@contextmanager
+def unit_of_work(engine:Engine, commit:bool = False, use_savepoints:bool = False):
+    """Kontextmanager für Abläufe aus mehreren Anweisungen, die eine gemeinsame Verbindung und Transaktion nutzen sollen. Innerhalb des Kontexts
+    führt execute_sql_query alle Anweisungen für diese Engine über die gemeinsame Verbindung aus, ignoriert das eigene commit-Argument und gibt
+    Fehler stets weiter.
+    Verschachtelte Arbeitseinheiten derselben Engine schließen sich der äußeren an, die über das Speichern entscheidet.
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die gewünschte Datenbank
+    
+    commit: Flag für das Schreiben der Transaktion in die Datenbank beim fehlerfreien Verlassen des Kontexts; anderenfalls wird sie rückgängig gemacht
+    
+    use_savepoints: Flag für das Ausführen jeder Anweisung in einem eigenen Savepoint (nur PostgreSQL), damit ein Fehler in einer einzelnen
+    Anweisung nicht die gesamte Transaktion unbrauchbar macht
+    
+    Ausgabe der gemeinsam genutzten sqlalchemy.Connection."""
+    active = get_active_unit_of_work(engine)
+    # Läuft bereits eine Arbeitseinheit für diese Engine, wird deren Verbindung weiterverwendet.
+    if active is not None:
+        yield active[0]
+        return
+    if getattr(active_units_of_work, 'units', None) is None:
+        active_units_of_work.units = {}
+    connection = open_connection(engine)
+    active_units_of_work.units[engine] = (connection, use_savepoints and engine.dialect.name == 'postgresql')
+    try:
+        yield connection
+    # Bei Fehlern wird die gesamte Transaktion rückgängig gemacht und der Fehler weitergegeben.
+    except Exception:
+        connection.rollback()
+        raise
+    else:
+        # Anderenfalls wird sie gespeichert, wenn gewünscht, ...
+        if commit:
+            connection.commit()
+        # ... oder ebenfalls rückgängig gemacht.
+        else:
+            connection.rollback()
+    finally:
+        # Zuletzt wird die Arbeitseinheit abgemeldet und die Verbindung an den Pool zurückgegeben.
+        active_units_of_work.units.pop(engine, None)
+        connection.close()
+
 def execute_sql_query(engine:Engine, query:text, params:dict = None, raise_exceptions:bool = False, commit:bool = None):
     """Ausführung vorgefertigter SQL-Abfragen
-
+    
     engine: sqlalchemy.Engine mit Zugriff auf die gewünschte Datenbank 
     
     query: SQL-Abfrage als sqlalchemy.text
     
     params: optionales Dictionary mit den Namen und Werten der bei der Abfrage zu berücksichtigenden Parameter
     
-    raise_exceptions: optionaler Boolean-Wert, standardmäßig False. Wenn True, werden auftretende Exceptions weitergegeben
+    raise_exceptions: optionaler Boolean-Wert, standardmäßig False. Wenn True, werden auftretende Exceptions weitergegeben. Innerhalb einer
+    Arbeitseinheit werden sie stets weitergegeben, da die gemeinsame Transaktion nach einem Fehler (in PostgreSQL) keine weiteren Anweisungen
+    mehr ausführt.
     
     commit: optionaler Boolean-Wert. Die Abfrage (UPDATE o. Ä.) wird nur in die Datenbank geschrieben, wenn dieser Wert auf True gesetzt ist.
+    Innerhalb einer Arbeitseinheit (unit_of_work) entscheidet stattdessen diese über das Speichern.
     
     Ausgabe des CursorResults der Abfrage oder None"""
 
     result = None
-    # Wenn Parameter angegeben sind, ...
-    if params != None:
-        for key in params.keys():
-            # ... müssen diese zunächst an die Abfrage gebunden werden.
-            query.bindparams(bindparam(key))
+    # Läuft im aktuellen Thread eine Arbeitseinheit für diese Engine, wird deren Verbindung ohne eigenes commit oder rollback genutzt. Fehler
+    # werden hier unabhängig von raise_exceptions weitergegeben, damit der Aufrufer bzw. die Arbeitseinheit darauf reagieren kann, statt mit 
+    # None oder einer abgebrochenen Transaktion weiterzuarbeiten.
+    active = get_active_unit_of_work(engine)
+    if active is not None:
+        connection, use_savepoints = active
+        if use_savepoints:
+            with connection.begin_nested():
+                return connection.execute(query, params)
+        return connection.execute(query, params)
     try:
-        # Aufbau der Verbindung
-        connection = engine.connect()
-        # Für MariaDB: Setzen der Trennzeichen auf einfache Anführungszeichen, damit einfache Abfragen in beiden Dialekten gleich gehandhabt werden können
-        if engine.dialect.name == 'mariadb':
-            connection.execute(text("SET sql_mode='ANSI_QUOTES'"))
-            # Speichern des Ergebnisses
-            connection.commit()
+        # Beziehen einer (bereits eingerichteten) Verbindung aus dem Pool
+        connection = open_connection(engine)
         # Ohne Parameter wird die Abfrage allein ausgeführt, ...
         if params is None:
             result = connection.execute(query)
@@ -293,8 +1035,6 @@ def execute_sql_query(engine:Engine, query:text, params:dict = None, raise_excep
     # Ausgabe des Ergebnisses bzw. None bei Fehlern
     return result
 
-
-
 def get_primary_key_from_engine(engine:Engine, table_name:str):
     """Beziehen der Primärschlüsselattribute einer Tabelle aus den Servertabellen
     
@@ -327,6 +1067,7 @@ def get_primary_key_from_engine(engine:Engine, table_name:str):
 
     
 
+@lru_cache(maxsize = 4096)
 def convert_string_if_contains_capitals_or_spaces(string:str, db_dialect:str):
     """Setzt einen String in doppelte Anführungszeichen, wenn darin Leerzeichen oder Großbuchstaben enthalten sind (Letzteres ist ausschließlich für 
     Tabellen- und Spaltennamen in PostgreSQL nötig).
@@ -354,6 +1095,16 @@ def convert_result_to_list_of_lists(sql_result:CursorResult):
     result_list = [list(row) for row in sql_result.all()]
     return result_list  
 
+def convert_result_to_columnar(sql_result:CursorResult):
+    """Umwandlung eines CursorResults in ein spaltenorientiertes ColumnarResult, das (v. a. bei numerischen Attributen und sich wiederholenden 
+    Strings) deutlich weniger Speicher benötigt als eine Liste von Listen und wie diese mehrfach durchiteriert werden kann.
+    
+    sql_result: CursorResult, Ergebnis der Datenbankabfrage
+    
+    Ausgabe eines ColumnarResults."""
+
+    return ColumnarResult.from_cursor_result(sql_result, default_batch_size)
+
 def get_data_type_meta_data(engine:Engine, table_name:str):
     """Beziehen der Datentypinformationen (Attributname, Standardwert, Datentyp, max. Länge, Eindeutigkeit, NULL-Wert-Toleranz) aus den Servertabellen
     
@@ -460,4 +1211,112 @@ def get_data_type_meta_data(engine:Engine, table_name:str):
         result_dict[column_name]['column_default'] = column_default
         result_dict[column_name]['is_unique'] = is_unique
         result_dict[column_name]['auto_increment'] = auto_increment
-    return result_dict
\ No newline at end of file
+    return result_dict
+
+def get_schema_meta_data(engine:Engine, table_name:str, ttl:float = None):
+    """Beziehen der Primärschlüsselattribute und der Datentypinformationen einer Tabelle aus dem Metadaten-Cache, sodass diese bei erneuter 
+    Auswahl oder Aktualisierung der Tabelle nicht erneut aus den Servertabellen abgefragt werden müssen
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die gewünschte Tabelle
+    
+    table_name: Name der Tabelle als String
+
+    ttl: optionale Gültigkeitsdauer der Cache-Einträge in Sekunden; standardmäßig default_meta_data_ttl, bei 0 wird der Cache umgangen
+    
+    Ausgabe eines Tupels aus der Liste der Primärschlüsselattribute und dem Dictionary der Datentypinformationen (siehe get_data_type_meta_data);
+    Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    if ttl is None:
+        ttl = default_meta_data_ttl
+    key = build_meta_data_cache_key(engine, table_name)
+    with meta_data_cache_lock:
+        entry = meta_data_cache.get(key)
+    # Gültige Einträge werden als Kopie ausgegeben, damit Änderungen an den TableMetaData-Objekten den Cache nicht verfälschen.
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return copy.deepcopy(entry[1]), copy.deepcopy(entry[2])
+    # Anderenfalls werden die Metadaten aus den Servertabellen bezogen ...
+    primary_keys = get_primary_key_from_engine(engine, table_name)
+    data_type_info = get_data_type_meta_data(engine, table_name)
+    # ... und (außer bei umgangenem Cache) für spätere Aufrufe gespeichert.
+    if ttl > 0:
+        with meta_data_cache_lock:
+            meta_data_cache[key] = (time.monotonic(), copy.deepcopy(primary_keys), copy.deepcopy(data_type_info))
+    return primary_keys, data_type_info
+
+def build_meta_data_cache_key(engine:Engine, table_name:str):
+    """Erstellung des Schlüssels für den Metadaten-Cache aus der URL der Engine (ohne Passwort) und dem Tabellennamen
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die Tabelle
+    
+    table_name: Name der Tabelle als String
+    
+    Ausgabe des Schlüssels als Tupel von Strings."""
+    return (engine.url.render_as_string(hide_password = True), table_name)
+
+def invalidate_meta_data_cache(engine:Engine = None, table_name:str = None):
+    """Entfernen von Einträgen aus dem Metadaten-Cache, z. B. nachdem das Tool selbst das Schema einer Tabelle verändert hat (DDL)
+    
+    engine: optionale sqlalchemy.Engine, deren Einträge entfernt werden sollen; ohne Angabe wird der gesamte Cache geleert
+    
+    table_name: optionaler Name der Tabelle, deren Eintrag entfernt werden soll; ohne Angabe werden alle Einträge der Engine entfernt"""
+    # Die zwischengespeicherten Anweisungen und Ergebnisse der Tabelle beruhen auf den bisherigen Metadaten und werden daher ebenfalls entfernt.
+    invalidate_statement_cache(table_name)
+    invalidate_result_cache(engine, table_name)
+    # Auch die Zeichensätze werden nach Schemaänderungen bei Bedarf erneut abgefragt.
+    with table_character_set_cache_lock:
+        if engine is None:
+            table_character_set_cache.clear()
+        else:
+            character_sets = table_character_set_cache.get(engine.url.render_as_string(hide_password = True), {})
+            if table_name is not None:
+                character_sets.pop(table_name, None)
+            else:
+                character_sets.clear()
+    with meta_data_cache_lock:
+        if engine is None:
+            meta_data_cache.clear()
+        elif table_name is not None:
+            meta_data_cache.pop(build_meta_data_cache_key(engine, table_name), None)
+        else:
+            url = engine.url.render_as_string(hide_password = True)
+            for key in [key for key in meta_data_cache.keys() if key[0] == url]:
+                meta_data_cache.pop(key)
+
+def load_table_character_sets(engine:Engine):
+    """Abfrage der grundlegenden Zeichensätze aller Tabellen der Datenbank aus information_schema.TABLES und Speicherung im Cache
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die Datenbank (nur MariaDB)
+    
+    Ausgabe eines Dictionarys mit den Tabellennamen als Schlüsseln und den Zeichensätzen als Werten; Ausgabe eines DialectErrors bei anderen 
+    SQL-Dialekten bzw. eines QueryErrors, wenn die Abfrage fehlschlägt."""
+    if engine.dialect.name != 'mariadb':
+        raise DialectError(f'Die Zeichensätze der Tabellen werden nur für MariaDB benötigt, nicht für {engine.dialect.name}.')
+    query = text('SELECT TABLE_NAME, TABLE_COLLATION FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_COLLATION IS NOT NULL')
+    character_sets = {}
+    for table_name, collation in execute_sql_query(engine, query, raise_exceptions = True).fetchall():
+        # Da die binäre Version des grundlegenden Zeichensatzes benötigt wird, müssen Zusätze (wie 'mb3' in 'utf8mb3') entfernt werden.
+        if 'latin1' in collation:
+            character_sets[table_name] = 'latin1'
+        elif 'utf8' in collation:
+            character_sets[table_name] = 'utf8'
+        else:
+            character_sets[table_name] = collation.split('_')[0]
+    with table_character_set_cache_lock:
+        table_character_set_cache[engine.url.render_as_string(hide_password = True)] = character_sets
+    return character_sets
+
+def get_table_character_set(engine:Engine, table_name:str):
+    """Beziehen des grundlegenden Zeichensatzes einer MariaDB-Tabelle ('latin1' oder 'utf8') aus dem Cache; fehlt die Tabelle darin (z. B. weil 
+    sie nach dem Verbindungsaufbau erstellt wurde), werden die Zeichensätze aller Tabellen erneut abgefragt.
+    
+    engine: sqlalchemy.Engine mit Zugriff auf die Tabelle (nur MariaDB)
+    
+    table_name: Name der Tabelle als String
+    
+    Ausgabe des Zeichensatzes als String; Ausgabe eines QueryErrors, wenn die Tabelle nicht existiert."""
+    with table_character_set_cache_lock:
+        character_set = table_character_set_cache.get(engine.url.render_as_string(hide_password = True), {}).get(table_name)
+    if character_set is None:
+        character_set = load_table_character_sets(engine).get(table_name)
+    if character_set is None:
+        raise QueryError(f'Der Zeichensatz der Tabelle {table_name} konnte nicht ermittelt werden.')
+    return character_set
@@ -0,0 +1,140 @@
+# Modul für die Ausführung lang laufender Operationen (Ersetzen, Vereinheitlichen, Attributübertragung) als Hintergrundaufträge, damit sie die
+# Threads des Webservers nicht blockieren
+
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+import threading
+import time
+import uuid
+from model.SQLDatabaseError import JobCancelledError
+
+
+# Aufträge je Kennung
+jobs = {}
+jobs_lock = threading.Lock()
+# Anzahl der gleichzeitig ausgeführten Aufträge; weitere Aufträge warten im Zustand 'pending'
+max_job_workers = 2
+job_executor = ThreadPoolExecutor(max_workers = max_job_workers, thread_name_prefix = 'job')
+# Anzahl der abgeschlossenen Aufträge, deren Ergebnisse aufbewahrt werden; ältere werden beim Anlegen neuer Aufträge entfernt.
+max_finished_jobs = 100
+# Zustände abgeschlossener Aufträge
+finished_job_states = ('done', 'failed', 'cancelled')
+
+def submit_job(name:str, function, args:tuple = (), kwargs:dict = None, owner:str = None):
+    """Anlegen eines Auftrags und Übergabe an den Thread-Pool
+
+    name: Bezeichnung der Operation (z. B. 'replace')
+
+    function: auszuführende Funktion; besitzt sie einen Parameter 'progress', wird ihr eine Funktion übergeben, mit der sie ihren Fortschritt
+    (optional mit Stand und Gesamtzahl der Schritte) meldet und an der sie einen angeforderten Abbruch bemerkt (siehe report_job_progress). 
+    Nur solche Aufträge können während ihrer Ausführung abgebrochen werden ('cancellable').
+
+    args, kwargs: Argumente der Funktion
+
+    owner: optionaler Name des Anwendungsbenutzers, der den Auftrag angelegt hat
+
+    Ausgabe der Kennung des Auftrags als String."""
+    job_id = uuid.uuid4().hex
+    kwargs = dict(kwargs) if kwargs is not None else {}
+    cancellable = 'progress' in inspect.signature(function).parameters
+    job = {'id': job_id, 'name': name, 'owner': owner, 'state': 'pending', 'progress': 0, 'total': None, 'cancellable': cancellable, 'result': None, 
+           'error': None, 'cancel_requested': False, 'created': time.time(), 'finished': None, 'future': None}
+    if cancellable:
+        kwargs['progress'] = lambda done = None, total = None: report_job_progress(job_id, done, total)
+    with jobs_lock:
+        remove_old_jobs()
+        jobs[job_id] = job
+    job['future'] = job_executor.submit(run_job, job_id, function, args, kwargs)
+    return job_id
+
+def run_job(job_id:str, function, args:tuple, kwargs:dict):
+    """Ausführung eines Auftrags im Thread-Pool; das Ergebnis bzw. die Fehlermeldung wird im Auftrag gespeichert."""
+    with jobs_lock:
+        job = jobs.get(job_id)
+        # Vor dem Start abgebrochene Aufträge werden nicht mehr ausgeführt.
+        if job is None or job['cancel_requested']:
+            if job is not None:
+                finish_job(job, 'cancelled')
+            return
+        job['state'] = 'running'
+    try:
+        result = function(*args, **kwargs)
+    except JobCancelledError as error:
+        with jobs_lock:
+            job['error'] = str(error)
+            finish_job(job, 'cancelled')
+    except Exception as error:
+        with jobs_lock:
+            job['error'] = str(error)
+            finish_job(job, 'failed')
+    else:
+        with jobs_lock:
+            job['result'] = result
+            finish_job(job, 'done')
+
+def finish_job(job:dict, state:str):
+    """Setzen des Endzustands eines Auftrags (nur unter jobs_lock aufzurufen)"""
+    job['state'] = state
+    job['finished'] = time.time()
+
+def report_job_progress(job_id:str, progress:int = None, total:int = None):
+    """Meldung des Fortschritts eines laufenden Auftrags; ohne Angabe von progress wird der Fortschritt um eins erhöht (z. B. je gespeichertem
+    Abschnitt). Wurde der Abbruch des Auftrags angefordert, wird ein JobCancelledError ausgegeben, sodass die Operation an dieser Stelle endet.
+
+    job_id: Kennung des Auftrags
+
+    progress: optionaler Stand des Fortschritts
+
+    total: optionale Gesamtzahl der Schritte"""
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is None:
+            return
+        job['progress'] = job['progress'] + 1 if progress is None else progress
+        if total is not None:
+            job['total'] = total
+        cancel_requested = job['cancel_requested']
+    if cancel_requested:
+        raise JobCancelledError(f'Bis zum Abbruch wurden {job["progress"]} Schritte gespeichert.')
+
+def get_job(job_id:str, owner:str = None):
+    """Beziehen des Zustands eines Auftrags
+
+    job_id: Kennung des Auftrags
+
+    owner: optionaler Name des Anwendungsbenutzers; wenn angegeben, werden nur dessen Aufträge ausgegeben
+
+    Ausgabe einer Kopie des Auftrags als Dictionary (ohne das Future-Objekt) bzw. None, wenn kein passender Auftrag existiert."""
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is None or (owner is not None and job['owner'] != owner):
+            return None
+        return {key: value for key, value in job.items() if key != 'future'}
+
+def cancel_job(job_id:str, owner:str = None):
+    """Anforderung des Abbruchs eines Auftrags. Wartende Aufträge werden nicht mehr gestartet, laufende Aufträge enden bei ihrer nächsten
+    Fortschrittsmeldung; laufende Aufträge ohne Fortschrittsmeldungen ('cancellable' False) können nicht abgebrochen werden.
+
+    job_id: Kennung des Auftrags
+
+    owner: optionaler Name des Anwendungsbenutzers, dem der Auftrag gehören muss
+
+    Ausgabe eines Boolean-Wertes, ob der Abbruch angefordert werden konnte (False bei unbekannten, bereits abgeschlossenen oder nicht abbrechbaren 
+    laufenden Aufträgen)."""
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is None or (owner is not None and job['owner'] != owner) or job['state'] in finished_job_states:
+            return False
+        if job['state'] == 'running' and not job['cancellable']:
+            return False
+        job['cancel_requested'] = True
+        # Noch nicht gestartete Aufträge werden sofort als abgebrochen gekennzeichnet.
+        if job['state'] == 'pending' and job['future'] is not None and job['future'].cancel():
+            finish_job(job, 'cancelled')
+        return True
+
+def remove_old_jobs():
+    """Entfernen der ältesten abgeschlossenen Aufträge, sobald mehr als max_finished_jobs vorliegen (nur unter jobs_lock aufzurufen)"""
+    finished = sorted([job for job in jobs.values() if job['state'] in finished_job_states], key = lambda job: job['finished'])
+    for job in finished[:max(len(finished) - max_finished_jobs, 0)]:
+        jobs.pop(job['id'], None)
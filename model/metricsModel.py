@@ -0,0 +1,129 @@
+# Modul für die Erfassung und Auswertung von Kennzahlen zu den an die Datenbanken gesendeten SQL-Anweisungen
+
+from collections import deque
+import json
+import logging
+import math
+import re
+import sys
+import threading
+import time
+from sqlalchemy import Engine, event
+
+
+# Erfasste Kennzahlen je Engine, aufrufender Modellfunktion und Anweisungsmuster (Fingerprint)
+query_metrics = {}
+query_metrics_lock = threading.Lock()
+# Anzahl der zuletzt gemessenen Laufzeiten, die je Eintrag für die Berechnung der Perzentile aufbewahrt werden
+max_latency_samples = 1000
+# Wenn True, wird jede Anweisung zusätzlich als JSON-Zeile über den Logger 'metrics' ausgegeben.
+structured_logging = False
+metrics_logger = logging.getLogger('metrics')
+# Funktionen des Datenbankmodells, die Anweisungen nur im Auftrag anderer Modellfunktionen ausführen und daher nicht als Aufrufer gelten
+generic_query_functions = ('execute_sql_query', 'stream_sql_query', 'unit_of_work', 'open_connection', 'initialize_session', 'get_cached_statement')
+
+def register_query_metrics(engine:Engine):
+    """Registrierung der Event-Hooks für die Erfassung der Kennzahlen aller Anweisungen einer Engine (nur einmal je Engine)
+
+    engine: sqlalchemy.Engine, deren Anweisungen erfasst werden sollen"""
+    if not event.contains(engine, 'before_cursor_execute', before_cursor_execute):
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+def before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+    """Event-Hook vor der Ausführung einer Anweisung: Speichern des Startzeitpunkts in den Informationen der Verbindung"""
+    connection.info.setdefault('query_start_times', []).append(time.perf_counter())
+
+def after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+    """Event-Hook nach der Ausführung einer Anweisung: Berechnung der Laufzeit und Erfassung der Kennzahlen"""
+    start_times = connection.info.get('query_start_times')
+    if not start_times:
+        return
+    latency = time.perf_counter() - start_times.pop()
+    # Bei serverseitigen Cursorn (Streaming) ist die Anzahl der Tupel vorab nicht bekannt und wird von den Treibern als -1 ausgegeben.
+    row_count = cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else 0
+    record_query(connection.engine.url.render_as_string(hide_password = True), get_calling_model_function(), fingerprint_statement(statement), latency, row_count)
+
+def record_query(engine_label:str, function_name:str, fingerprint:str, latency:float, row_count:int):
+    """Erfassung einer ausgeführten Anweisung
+
+    engine_label: URL der Engine ohne Passwort
+
+    function_name: Name der aufrufenden Modellfunktion (Modul.Funktion)
+
+    fingerprint: Anweisungsmuster ohne konkrete Werte
+
+    latency: Laufzeit in Sekunden
+
+    row_count: Anzahl der ausgegebenen bzw. betroffenen Tupel"""
+    key = (engine_label, function_name, fingerprint)
+    with query_metrics_lock:
+        entry = query_metrics.get(key)
+        if entry is None:
+            entry = {'count': 0, 'total_time': 0.0, 'total_rows': 0, 'latencies': deque(maxlen = max_latency_samples)}
+            query_metrics[key] = entry
+        entry['count'] += 1
+        entry['total_time'] += latency
+        entry['total_rows'] += row_count
+        entry['latencies'].append(latency)
+    if structured_logging:
+        metrics_logger.info(json.dumps({'engine': engine_label, 'function': function_name, 'statement': fingerprint, 'latency_ms': round(latency * 1000, 3), 'rows': row_count}))
+
+def fingerprint_statement(statement:str):
+    """Erstellung eines Anweisungsmusters, in dem Literale durch '?' ersetzt und Leerräume zusammengefasst sind, damit gleichartige Anweisungen
+    gemeinsam ausgewertet werden
+
+    statement: SQL-Anweisung als String
+
+    Ausgabe des Musters als String."""
+    # Ersetzen von String-Literalen (mit verdoppelten oder durch Backslash maskierten Anführungszeichen) und Zahlen, die nicht Teil eines Namens sind
+    fingerprint = re.sub(r"'(?:[^'\\]|\\.|'')*'", '?', statement)
+    fingerprint = re.sub(r'(?<![\w"])-?\d+(?:\.\d+)?\b', '?', fingerprint)
+    return ' '.join(fingerprint.split())
+
+def get_calling_model_function():
+    """Ermittlung der Modellfunktion, von der die aktuell ausgeführte Anweisung stammt, anhand des Aufrufstapels
+
+    Ausgabe des Namens als String in der Form 'Modul.Funktion' bzw. 'unbekannt', wenn keine Modellfunktion beteiligt ist."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module_name = frame.f_globals.get('__name__', '')
+        if module_name.startswith('model.') and module_name != __name__ and frame.f_code.co_name not in generic_query_functions:
+            return f'{module_name[len("model."):]}.{frame.f_code.co_name}'
+        frame = frame.f_back
+    return 'unbekannt'
+
+def calculate_percentile(sorted_values:list[float], percentile:float):
+    """Berechnung eines Perzentils nach dem Nearest-Rank-Verfahren
+
+    sorted_values: aufsteigend sortierte Liste der Messwerte
+
+    percentile: gewünschtes Perzentil zwischen 0 und 100
+
+    Ausgabe des Perzentils bzw. None bei fehlenden Messwerten."""
+    if len(sorted_values) == 0:
+        return None
+    rank = max(math.ceil(percentile * len(sorted_values) / 100), 1)
+    return sorted_values[rank - 1]
+
+def get_query_metrics():
+    """Zusammenfassung der erfassten Kennzahlen
+
+    Ausgabe einer Liste von Dictionarys (je Engine, Modellfunktion und Anweisungsmuster) mit Anzahl der Ausführungen, Gesamtlaufzeit,
+    Perzentilen der Laufzeit (p50, p95, p99, in Millisekunden) und Gesamtzahl der Tupel, absteigend sortiert nach der Gesamtlaufzeit."""
+    with query_metrics_lock:
+        entries = [(key, entry['count'], entry['total_time'], entry['total_rows'], sorted(entry['latencies'])) for key, entry in query_metrics.items()]
+    summary = []
+    for (engine_label, function_name, fingerprint), count, total_time, total_rows, latencies in entries:
+        summary.append({'engine': engine_label, 'function': function_name, 'statement': fingerprint, 'count': count,
+                        'total_time_ms': round(total_time * 1000, 3), 'total_rows': total_rows,
+                        'p50_ms': round(calculate_percentile(latencies, 50) * 1000, 3),
+                        'p95_ms': round(calculate_percentile(latencies, 95) * 1000, 3),
+                        'p99_ms': round(calculate_percentile(latencies, 99) * 1000, 3)})
+    summary.sort(key = lambda item: item['total_time_ms'], reverse = True)
+    return summary
+
+def reset_query_metrics():
+    """Löschen aller erfassten Kennzahlen"""
+    with query_metrics_lock:
+        query_metrics.clear()
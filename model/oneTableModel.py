@@ -1,14 +1,58 @@
 
 from argparse import ArgumentError
-from sqlalchemy import bindparam, text
+import datetime
+from decimal import Decimal, InvalidOperation
+import json
+import os
+import re
+import threading
+import unicodedata
+from sqlalchemy import text
 from ControllerClasses import TableMetaData
+from model.ResultClasses import ColumnarResult
 from model.SQLDatabaseError import DialectError, QueryError, UpdateError
-from model.databaseModel import build_sql_condition, check_database_encoding, convert_result_to_list_of_lists, convert_string_if_contains_capitals_or_spaces, execute_sql_query, get_full_table_ordered_by_primary_key
+from model.databaseModel import build_primary_key_range_condition, build_sql_condition, check_database_encoding, convert_result_to_columnar, convert_result_to_list_of_lists, convert_string_if_contains_capitals_or_spaces, exact_row_count_limit, execute_partitioned_query, execute_sql_query, get_cached_statement, get_primary_key_ranges, get_table_character_set, get_table_page, get_table_version, invalidate_result_cache, invalidate_statement_cache, row_count_executor, stream_sql_query, unit_of_work
 
 
+# Mindestlänge der Wörter, die ein Volltextindex in MariaDB (InnoDB, innodb_ft_min_token_size) enthält; kürzere Suchbegriffe werden ohne Index gesucht
+fulltext_min_word_length = 3
+# Datentypgruppen, deren Konversion in Text in PostgreSQL unveränderlich (IMMUTABLE) ist und die daher über einen Trigrammindex auf dem 
+# konvertierten Wert durchsucht werden können (die Textdarstellung von Datumswerten hängt hingegen von der Sitzungseinstellung DateStyle ab)
+trigram_index_data_type_groups = ('text', 'integer', 'decimal', 'boolean')
+# Zeichen, die in der Textdarstellung ganzer Zahlen, Dezimalzahlen und Datumswerte vorkommen können; enthält der Suchstring andere Zeichen, kann 
+# ein Attribut dieser Datentypgruppe ihn nicht enthalten und wird bei der Suche übergangen.
+integer_search_characters = set('0123456789-')
+decimal_search_characters = set('0123456789-.')
+float_search_characters = set('0123456789-.e+')
+date_search_characters = set('0123456789-:. +')
+# Gleitkommadatentypen, deren Textdarstellung Exponenten und (in PostgreSQL) die Werte 'Infinity' und 'NaN' enthalten kann
+float_data_types = ('real', 'double precision', 'float', 'double')
+# Höchstzahl der Tupel, die bei der Suche während der Eingabe ausgegeben und für die Verfeinerung im Speicher aufbewahrt werden
+live_search_limit = 1000
+# Höchstzahl der ausgewählten Vorkommen, die bei der Ersetzung mit einer Anweisung geändert werden
+replace_batch_size = 1000
+# Standardanzahl der Tupel je Abschnitt bei der abschnittsweisen Ersetzung aller Vorkommen
+default_replace_chunk_size = 10000
+# Mindestanzahl der Tupel einer Tabelle, ab der die App alle Vorkommen abschnittsweise ersetzt
+chunked_replace_min_rows = 100000
+# Datei mit den Fortsetzungspunkten (Primärschlüsselwerte des zuletzt gespeicherten Abschnitts) unterbrochener abschnittsweiser Ersetzungen je 
+# Engine, Tabelle, Attributen und Werten; sie bleiben so auch nach einem Neustart oder Absturz der App erhalten.
+replace_checkpoints_file = 'replace_checkpoints.json'
+replace_checkpoints_lock = threading.Lock()
+# Datentypgruppen, deren Textdarstellung in Python der in der Datenbank entspricht, sodass Suchergebnisse im Speicher weiter gefiltert werden können
+in_memory_filter_data_type_groups = ('text', 'integer')
+# Datumsdatentypen, deren Textdarstellung mit dem Datum im Format JJJJ-MM-TT beginnt
+date_range_data_types = ('date', 'datetime', 'timestamp', 'timestamp without time zone', 'timestamp with time zone')
+# Unterstützte Suchmodi: Vorkommen an beliebiger Stelle, am Anfang oder Übereinstimmung mit dem gesamten Wert
+search_match_modes = ('contains', 'prefix', 'exact')
+# Attribute mit B-Baum-Index auf lower(Attribut) je Engine-URL und Tabelle (nur PostgreSQL), über die die Präfix- und exakte Suche ohne Beachtung 
+# der Groß- und Kleinschreibung erfolgen kann; ein veralteter Eintrag beeinflusst nur die Laufzeit, nicht das Ergebnis der Suche.
+lower_index_cache = {}
+lower_index_cache_lock = threading.Lock()
+
 ##### Funktionen für die Suche in einer Tabelle #####
 
-def search_string(table_meta_data:TableMetaData, string_to_search:str, columns_to_search:list[str]):
+def search_string(table_meta_data:TableMetaData, string_to_search:str, columns_to_search:list[str], columnar:bool = False, use_search_index:bool = False, limit:int = None, partitioned:bool = False, match_mode:str = 'contains', case_sensitive:bool = False):
     """Erstellen und Ausführen der Abfrage für die Suche nach einem String in einer Tabelle
     
     table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
@@ -17,55 +61,800 @@ def search_string(table_meta_data:TableMetaData, string_to_search:str, columns_t
     
     columns_to_search: Liste mit den Attributnamen (als Strings), die durchsucht werden sollen
 
-    Ausgabe des Abfrageergebnisses als Liste von Listen; Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    columnar: Boolean-Wert; wenn True, wird das Ergebnis als spaltenorientiertes ColumnarResult ausgegeben
+
+    use_search_index: Boolean-Wert; wenn True, wird in MariaDB ein Volltextindex über genau die zu durchsuchenden Attribute für die Vorauswahl
+    der Tupel genutzt, sofern vorhanden. Dabei werden nur Vorkommen am Wortanfang gefunden. Ohne passenden Index oder bei Suchbegriffen mit zu 
+    kurzen Wörtern wird die Tabelle wie bisher vollständig durchsucht. In PostgreSQL werden Trigrammindizes (pg_trgm) ohne Umformulierung der 
+    Abfrage genutzt, da sie ILIKE-Bedingungen auf den (konvertierten) Attributen direkt unterstützen (siehe create_search_indexes).
+
+    limit: optionale Höchstzahl der auszugebenden Tupel; für die seitenweise Ausgabe siehe get_search_result_page
+
+    partitioned: Boolean-Wert; wenn True, wird die Tabelle in Primärschlüsselbereiche aufgeteilt, die nebenläufig über getrennte Verbindungen 
+    durchsucht werden (siehe get_primary_key_ranges). Das Ergebnis ist dann nach dem Primärschlüssel geordnet. Kann die Tabelle nicht aufgeteilt 
+    werden, wird sie wie bisher mit einer einzigen Abfrage durchsucht.
 
-    # Beziehen der benötigten Variablen aus table_meta_data: Engine, Dialektname und Tabellenname
+    match_mode: 'contains' (Vorkommen an beliebiger Stelle), 'prefix' (Vorkommen am Anfang) oder 'exact' (Übereinstimmung mit dem gesamten Wert); 
+    Präfix- und exakte Suche nutzen Bedingungen, die von B-Baum-Indizes auf den Attributen unterstützt werden können. Ohne Beachtung der Groß- und 
+    Kleinschreibung benötigen sie in PostgreSQL einen Index auf lower(Attribut), den create_search_indexes anlegt.
+
+    case_sensitive: Boolean-Wert; wenn True, wird Groß- und Kleinschreibung beachtet
+
+    Ausgabe des Abfrageergebnisses als Liste von Listen bzw. ColumnarResult; Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+
+    # Beziehen der benötigten Variablen aus table_meta_data: Engine und Dialektname
     engine = table_meta_data.engine
     dialect = engine.dialect.name
+    # Parameter und Teilbedingungen der Suche sowie ggf. genutzter Volltextindex
+    params, predicates, fulltext_columns = get_search_parameters(table_meta_data, string_to_search, columns_to_search, use_search_index, match_mode, case_sensitive)
+    if limit is not None:
+        params['limit'] = limit
+    # Die Abfrage hängt nur vom Dialekt, der Tabelle, den Teilbedingungen je Attribut und den Datentypgruppen der Attribute, dem Suchmodus sowie 
+    # ggf. dem genutzten Volltextindex und der Begrenzung ab und wird daher nur beim ersten Aufruf mit dieser Kombination aufgebaut.
+    cache_key = (dialect, table_meta_data.table_name, 'search', tuple([(column_name, kind, table_meta_data.get_data_type_group(column_name)) for column_name, kind in predicates]), fulltext_columns, limit is not None, match_mode, case_sensitive)
+    query = get_cached_statement(cache_key, lambda: build_search_query(table_meta_data, predicates, fulltext_columns, limit is not None, None, match_mode, case_sensitive))
+    # Wenn der SQL-Dialekt entweder PostgreSQL oder MariaDB ist, ...
+    if dialect == 'postgresql' or dialect == 'mariadb':
+        ranges = get_primary_key_ranges(table_meta_data) if partitioned else None
+        # ... werden im partitionierten Modus die Primärschlüsselbereiche nebenläufig durchsucht und ihre geordneten Ergebnisse aneinandergehängt, ...
+        if ranges is not None:
+            def build_partition_query(has_lower_bound:bool, has_upper_bound:bool):
+                return get_cached_statement(cache_key + ((has_lower_bound, has_upper_bound),), 
+                                            lambda: build_search_query(table_meta_data, predicates, fulltext_columns, limit is not None, (has_lower_bound, has_upper_bound), match_mode, case_sensitive))
+            column_names, partitions = execute_partitioned_query(table_meta_data, ranges, build_partition_query, params)
+            rows = [row for partition in partitions for row in partition]
+            # Die Begrenzung gilt je Bereich, sodass das zusammengefügte Ergebnis erneut gekürzt wird.
+            if limit is not None:
+                rows = rows[:limit]
+            result = ColumnarResult.from_rows(column_names, rows) if columnar else rows
+        # ... anderenfalls wird die Abfrage ausgeführt und das Ergebnis in ein ColumnarResult oder eine Liste von Listen konvertiert.
+        elif columnar:
+            result = convert_result_to_columnar(execute_sql_query(engine, query, params))
+        else:
+            result = convert_result_to_list_of_lists(execute_sql_query(engine, query, params))
+    else:
+        # Anderenfalls wird eine Meldung ausgegeben, dass der gewählte SQL-Dialekt nicht unterstützt wird.
+        raise DialectError(f'Der SQL-Dialekt {dialect} wird nicht unterstützt.')
+    # Ausgabe des Ergebnisses der Suche
+    return result
+
+def search_multiple_strings(table_meta_data:TableMetaData, strings_to_search:list[str], columns_to_search:list[str], columnar:bool = False):
+    """Suche nach mehreren Strings (z. B. Schreibvarianten oder Altcodes) in einer einzigen Abfrage statt einer Abfrage je String
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    strings_to_search: Liste der zu suchenden Zeichenketten; mehrfach angegebene werden nur einmal gesucht
+    
+    columns_to_search: Liste mit den Attributnamen (als Strings), die durchsucht werden sollen
+    
+    columnar: Boolean-Wert; wenn True, werden die Treffer als spaltenorientiertes ColumnarResult ausgegeben
+    
+    Ausgabe eines Tupels aus den Treffern (Liste von Listen bzw. ColumnarResult mit den Attributen der Tabelle) und einer Liste, die für jeden 
+    Treffer ein Dictionary mit den darin gefundenen Strings als Schlüsseln und der Liste der Attribute, in denen sie vorkommen, als Werten enthält;
+    Ausgabe eines ArgumentErrors, wenn kein String angegeben ist, bzw. eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    engine = table_meta_data.engine
+    dialect = engine.dialect.name
+    if dialect not in ('mariadb', 'postgresql'):
+        raise DialectError(f'Der SQL-Dialekt {dialect} wird nicht unterstützt.')
+    # Entfernen doppelter Strings unter Beibehaltung der Reihenfolge
+    strings_to_search = list(dict.fromkeys(strings_to_search))
+    if len(strings_to_search) == 0:
+        raise ArgumentError(None, 'Es muss mindestens ein zu suchender String angegeben sein.')
+    ### Zuordnung der Strings zu den Attributen, die sie enthalten können (siehe get_search_predicate_kind) ###
+    column_terms = []
+    for column_name in columns_to_search:
+        term_indexes = tuple([index for index, string in enumerate(strings_to_search) if get_search_predicate_kind(table_meta_data, column_name, string) is not None])
+        if len(term_indexes) > 0:
+            column_terms.append((column_name, term_indexes))
+    column_terms = tuple(column_terms)
+    # Kann keines der Attribute einen der Strings enthalten, ist keine Abfrage nötig.
+    if len(column_terms) == 0:
+        return (ColumnarResult.from_rows(table_meta_data.columns, []) if columnar else []), []
+    params = {f'term_{index}': escape_string(dialect, string) for index, string in enumerate(strings_to_search)}
+    cache_key = (dialect, table_meta_data.table_name, 'batch_search', tuple([(column_name, table_meta_data.get_data_type_group(column_name), term_indexes) for column_name, term_indexes in column_terms]), len(strings_to_search))
+    query = get_cached_statement(cache_key, lambda: build_batch_search_query(table_meta_data, column_terms, len(strings_to_search)))
+    result = execute_sql_query(engine, query, params, raise_exceptions = True)
+    ### Trennung der Attributwerte von den Angaben zu den gefundenen Strings, die als letzte Attribute ausgegeben werden ###
+    attribute_count = len(result.keys()) - len(strings_to_search)
+    column_names = list(result.keys())[:attribute_count]
+    rows = []
+    matches = []
+    for row in result:
+        rows.append(list(row[:attribute_count]))
+        row_matches = {}
+        for index, matched_columns in enumerate(row[attribute_count:]):
+            # Die Attribute, in denen der String vorkommt, werden durch ihre kommagetrennten Positionen in column_terms angegeben.
+            if matched_columns:
+                row_matches[strings_to_search[index]] = [column_terms[int(position)][0] for position in matched_columns.split(',')]
+        matches.append(row_matches)
+    if columnar:
+        rows = ColumnarResult.from_rows(column_names, rows)
+    return rows, matches
+
+def build_batch_search_query(table_meta_data:TableMetaData, column_terms:tuple, term_count:int):
+    """Aufbau des Abfragetextes für die Suche nach mehreren Strings in einem Durchlauf. Neben allen Attributen der Tabelle wird für jeden String
+    ein Attribut batch_match_<Index> ausgegeben, das die kommagetrennten Positionen der Attribute enthält, in denen er vorkommt (bzw. einen leeren 
+    String). In PostgreSQL wird jedes Attribut mittels ILIKE ANY mit allen für es infrage kommenden Strings verglichen, in MariaDB über mit OR 
+    verbundene LIKE-Bedingungen. Die Treffer werden wie bei der seitenweisen Suche nach dem Primärschlüssel geordnet.
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    column_terms: Tupel aus Paaren von Attributname und dem Tupel der Indizes der Strings, die in dem Attribut vorkommen können; die Position des 
+    Paares ist die in batch_match_<Index> ausgegebene Position
+    
+    term_count: Anzahl der Strings, die als Platzhalter :term_<Index> eingebunden werden
+    
+    Ausgabe der Abfrage als String."""
+    dialect = table_meta_data.engine.dialect.name
     table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, dialect)
+    operator, cast_data_type = set_matching_operator_and_cast_data_type(dialect)
+    # Attributausdrücke (ggf. in Text konvertiert) je Position
+    attributes = []
+    for column_name, _ in column_terms:
+        attribute = convert_string_if_contains_capitals_or_spaces(column_name, dialect).strip()
+        if table_meta_data.get_data_type_group(column_name) != 'text':
+            attribute = f'CAST({attribute} AS {cast_data_type})'
+        attributes.append(attribute)
+    ### Angaben zu den gefundenen Strings: je String die Positionen der Attribute, in denen er vorkommt ###
+    match_columns = []
+    for term_index in range(term_count):
+        pattern = get_concatenated_string_for_matching(dialect, f'term_{term_index}')
+        cases = [f"CASE WHEN {attributes[position]} {operator} {pattern} THEN '{position}' END" for position, (_, term_indexes) in enumerate(column_terms) if term_index in term_indexes]
+        if len(cases) == 0:
+            match_columns.append(f"'' AS batch_match_{term_index}")
+        else:
+            # CONCAT_WS überspringt die NULL-Werte der Attribute ohne Vorkommen.
+            match_columns.append(f"CONCAT_WS(',', {', '.join(cases)}) AS batch_match_{term_index}")
+    ### Bedingung: mindestens ein String kommt in einem der Attribute vor ###
+    conditions = []
+    for position, (_, term_indexes) in enumerate(column_terms):
+        patterns = [get_concatenated_string_for_matching(dialect, f'term_{term_index}') for term_index in term_indexes]
+        if dialect == 'postgresql':
+            conditions.append(f"{attributes[position]} {operator} ANY(ARRAY[{', '.join(patterns)}])")
+        else:
+            conditions.extend([f'{attributes[position]} {operator} {pattern}' for pattern in patterns])
+    primary_keys = ', '.join([convert_string_if_contains_capitals_or_spaces(key, dialect) for key in table_meta_data.primary_keys])
+    return f"SELECT *, {', '.join(match_columns)} FROM {table_name} WHERE {' OR '.join(conditions)} ORDER BY {primary_keys}"
+
+def get_search_result_page(table_meta_data:TableMetaData, string_to_search:str, columns_to_search:list[str], limit:int, last_key:list = None, sort_column:str = None, descending:bool = False, offset:int = None, use_search_index:bool = False, match_mode:str = 'contains', case_sensitive:bool = False, look_ahead:bool = False):
+    """Beziehen einer einzelnen Seite des Suchergebnisses per Keyset bzw. OFFSET (siehe get_table_page), damit bei breiten Suchbegriffen nicht 
+    alle Treffer übertragen und angezeigt werden müssen
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    string_to_search: zu suchende Zeichenkette
+    
+    columns_to_search: Liste mit den Attributnamen (als Strings), die durchsucht werden sollen
+    
+    limit, last_key, sort_column, descending, offset, look_ahead: Angaben zur Paginierung und Sortierung wie bei get_table_page
+    
+    use_search_index: Boolean-Wert für die Nutzung eines Volltextindexes wie bei search_string
+
+    match_mode, case_sensitive: Suchmodus und Beachtung der Groß- und Kleinschreibung wie bei search_string
+    
+    Ausgabe eines Tupels aus der Liste von Listen mit den Treffern der Seite und dem Schlüssel für die nächste Seite (bei look_ahead = True 
+    ergänzt um einen Boolean-Wert, ob weitere Treffer folgen)."""
+    params, predicates, fulltext_columns = get_search_parameters(table_meta_data, string_to_search, columns_to_search, use_search_index, match_mode, case_sensitive)
+    condition = build_search_condition(table_meta_data, predicates, fulltext_columns, match_mode, case_sensitive)
+    return get_table_page(table_meta_data, limit, last_key, sort_column, descending, offset, condition, params, look_ahead)
+
+def get_search_match_count(table_meta_data:TableMetaData, string_to_search:str, columns_to_search:list[str], estimate:bool = False, use_search_index:bool = False, match_mode:str = 'contains', case_sensitive:bool = False):
+    """Ermittlung der Anzahl der Treffer einer Suche unabhängig von deren seitenweiser Ausgabe
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    string_to_search: zu suchende Zeichenkette
+    
+    columns_to_search: Liste mit den Attributnamen (als Strings), die durchsucht werden sollen
+    
+    estimate: Boolean-Wert; wenn True, wird die Schätzung des Abfrageplaners (EXPLAIN) verwendet, sofern diese mindestens exact_row_count_limit 
+    beträgt, anderenfalls wird exakt gezählt
+    
+    use_search_index: Boolean-Wert für die Nutzung eines Volltextindexes wie bei search_string
+
+    match_mode, case_sensitive: Suchmodus und Beachtung der Groß- und Kleinschreibung wie bei search_string
+    
+    Ausgabe der Trefferanzahl als Integer bzw. bei estimate = True als Tupel aus der Anzahl und einem Boolean-Wert, der angibt, ob diese exakt ist; 
+    Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    engine = table_meta_data.engine
+    db_dialect = engine.dialect.name
+    if db_dialect not in ('mariadb', 'postgresql'):
+        raise DialectError(f'Der SQL-Dialekt {db_dialect} wird nicht unterstützt.')
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+    params, predicates, fulltext_columns = get_search_parameters(table_meta_data, string_to_search, columns_to_search, use_search_index, match_mode, case_sensitive)
+    condition = build_search_condition(table_meta_data, predicates, fulltext_columns, match_mode, case_sensitive)
+    if estimate:
+        estimated_count = None
+        # Die Schätzung des Planers wird ohne Ausführung der Abfrage bezogen: in PostgreSQL aus dem JSON-Plan ('Plan Rows'), in MariaDB aus der 
+        # Anzahl der zu lesenden Tupel und dem geschätzten Anteil, der die Bedingung erfüllt.
+        if db_dialect == 'postgresql':
+            plan = execute_sql_query(engine, text(f'EXPLAIN (FORMAT JSON) SELECT * FROM {table_name} WHERE {condition}'), params).fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimated_count = int(plan[0]['Plan']['Plan Rows'])
+        else:
+            result = execute_sql_query(engine, text(f'EXPLAIN SELECT * FROM {table_name} WHERE {condition}'), params)
+            row = result.mappings().fetchone()
+            if row is not None and row['rows'] is not None:
+                estimated_count = int(int(row['rows']) * float(row['filtered'] if row['filtered'] is not None else 100) / 100)
+        if estimated_count is not None and estimated_count >= exact_row_count_limit:
+            return estimated_count, False
+    count = execute_sql_query(engine, text(f'SELECT COUNT(*) FROM {table_name} WHERE {condition}'), params, raise_exceptions = True).fetchone()[0]
+    if estimate:
+        return count, True
+    return count
+
+def start_search_match_count(table_meta_data:TableMetaData, string_to_search:str, columns_to_search:list[str], use_search_index:bool = False, match_mode:str = 'contains', case_sensitive:bool = False):
+    """Start der exakten Zählung der Treffer einer Suche im Hintergrund, wenn get_search_match_count nur eine Schätzung ausgegeben hat; die 
+    Parameter entsprechen denen von get_search_match_count.
+    
+    Ausgabe des Future-Objekts, dessen Ergebnis die exakte Trefferanzahl ist."""
+    return row_count_executor.submit(get_search_match_count, table_meta_data, string_to_search, columns_to_search, use_search_index = use_search_index, match_mode = match_mode, case_sensitive = case_sensitive)
+
+def get_live_search_result(table_meta_data:TableMetaData, string_to_search:str, columns_to_search:list[str], previous_result:dict = None, limit:int = None):
+    """Suche während der Eingabe des Suchstrings: Enthält dieser den Suchstring der vorigen Suche und war deren Ergebnis vollständig, werden die 
+    Treffer im Speicher gefiltert, statt die Tabelle erneut zu durchsuchen (siehe can_refine_search_in_memory); anderenfalls wird search_string 
+    mit Begrenzung auf limit Tupel ausgeführt.
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    string_to_search: zu suchende Zeichenkette
+    
+    columns_to_search: Liste mit den Attributnamen (als Strings), die durchsucht werden sollen
+    
+    previous_result: optionales Ergebnis des vorigen Aufrufs
+    
+    limit: optionale Höchstzahl der auszugebenden Tupel, standardmäßig live_search_limit
+    
+    Ausgabe eines Dictionarys mit der Tabelle ('table'), ihrem Versionszähler ('version'), den durchsuchten Attributen ('columns'), dem Suchstring 
+    ('search'), den Treffern als Liste von Listen ('rows'), der Angabe, ob alle Treffer enthalten sind ('complete'), und der Angabe, ob das Ergebnis 
+    im Speicher ermittelt wurde ('from_memory'); es wird als previous_result an den nächsten Aufruf übergeben."""
+    if limit is None:
+        limit = live_search_limit
+    engine = table_meta_data.engine
+    dialect = engine.dialect.name
+    table = (engine.url.render_as_string(hide_password = True), table_meta_data.table_name)
+    version = get_table_version(table_meta_data)
+    columns = tuple(columns_to_search)
+    ### Verfeinerung des vorigen Ergebnisses im Speicher ###
+    if can_refine_search_in_memory(table_meta_data, previous_result, string_to_search, columns, version):
+        # SELECT * gibt die Attribute in der Reihenfolge der Tabelle aus.
+        positions = [table_meta_data.columns.index(column_name) for column_name in columns]
+        searched = normalize_search_text(dialect, string_to_search)
+        rows = [row for row in previous_result['rows'] if any([row[position] is not None and searched in normalize_search_text(dialect, row[position]) for position in positions])]
+        return {'table': table, 'version': version, 'columns': columns, 'search': string_to_search, 'rows': rows, 'complete': True, 'from_memory': True}
+    ### Suche in der Datenbank ###
+    # Ein zusätzliches Tupel zeigt an, ob das Ergebnis durch die Begrenzung gekürzt wurde.
+    rows = search_string(table_meta_data, string_to_search, columns_to_search, limit = limit + 1)
+    return {'table': table, 'version': version, 'columns': columns, 'search': string_to_search, 'rows': rows[:limit], 'complete': len(rows) <= limit, 'from_memory': False}
+
+def can_refine_search_in_memory(table_meta_data:TableMetaData, previous_result:dict, string_to_search:str, columns:tuple, version:int):
+    """Überprüfung, ob das Ergebnis einer vorigen Suche im Speicher auf die Treffer eines neuen Suchstrings gefiltert werden kann. Das ist der 
+    Fall, wenn es dieselbe unveränderte Tabelle und dieselben Attribute betrifft, vollständig ist, der neue Suchstring den vorigen enthält (sodass 
+    jeder neue Treffer auch ein voriger ist) und die Textdarstellung aller Attribute in Python der in der Datenbank entspricht.
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    previous_result: Ergebnis des vorigen Aufrufs von get_live_search_result oder None
+    
+    string_to_search: neuer Suchstring
+    
+    columns: Tupel der zu durchsuchenden Attribute
+    
+    version: aktueller Versionszähler der Tabelle
+    
+    Ausgabe eines Boolean-Wertes."""
+    if previous_result is None or not previous_result['complete'] or previous_result['columns'] != columns or previous_result['version'] != version:
+        return False
+    engine = table_meta_data.engine
+    if previous_result['table'] != (engine.url.render_as_string(hide_password = True), table_meta_data.table_name):
+        return False
+    dialect = engine.dialect.name
+    if normalize_search_text(dialect, previous_result['search']) not in normalize_search_text(dialect, string_to_search):
+        return False
+    for column_name in columns:
+        data_type_group = table_meta_data.get_data_type_group(column_name)
+        # Datumswerte ohne Uhrzeit werden in beiden Dialekten wie in Python im Format JJJJ-MM-TT dargestellt.
+        if data_type_group not in in_memory_filter_data_type_groups and table_meta_data.get_data_type(column_name) != 'date':
+            return False
+    return True
+
+def normalize_search_text(db_dialect:str, value):
+    """Umwandlung eines Wertes in seine Textdarstellung für den Vergleich im Speicher, die wie die Suche in der Datenbank nicht zwischen Groß- und 
+    Kleinschreibung unterscheidet. In MariaDB werden zusätzlich diakritische Zeichen entfernt, da die üblichen Kollationen (*_general_ci, 
+    *_unicode_ci) z. B. 'é' und 'e' gleich behandeln.
+    
+    db_dialect: SQL-Dialekt der durchsuchten Datenbank
+    
+    value: zu vergleichender Wert
+    
+    Ausgabe des Vergleichsstrings."""
+    if isinstance(value, bytes):
+        value = value.decode('utf-8', errors = 'replace')
+    text_value = value if isinstance(value, str) else str(value)
+    if db_dialect == 'mariadb':
+        text_value = ''.join([character for character in unicodedata.normalize('NFKD', text_value) if not unicodedata.combining(character)])
+        return text_value.casefold()
+    return text_value.lower()
+
+def get_search_parameters(table_meta_data:TableMetaData, string_to_search:str, columns_to_search:list[str], use_search_index:bool = False, match_mode:str = 'contains', case_sensitive:bool = False):
+    """Aufbau des Parameter-Dictionarys und der Teilbedingungen der Suche sowie ggf. Ermittlung eines Volltextindexes (nur MariaDB), der genau 
+    die zu durchsuchenden Attribute abdeckt
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    string_to_search: zu suchende Zeichenkette
+    
+    columns_to_search: Liste mit den Attributnamen (als Strings), die durchsucht werden sollen
+    
+    use_search_index: Boolean-Wert; wenn True, wird nach einem passenden Volltextindex gesucht (nur bei der Suche nach enthaltenen Strings ohne 
+    Beachtung der Groß- und Kleinschreibung)
+
+    match_mode, case_sensitive: Suchmodus und Beachtung der Groß- und Kleinschreibung wie bei search_string
+    
+    Ausgabe eines Tupels aus dem Parameter-Dictionary, dem Tupel der Teilbedingungen (Paare aus Attributname und Art der Teilbedingung, siehe 
+    get_search_predicate_kind; Attribute, die den Suchstring nicht enthalten können, sind darin nicht enthalten) und dem Tupel der Attribute 
+    des zu nutzenden Volltextindexes (bzw. None); Ausgabe eines ArgumentErrors bei unbekanntem Suchmodus."""
+    dialect = table_meta_data.engine.dialect.name
+    if match_mode not in search_match_modes:
+        raise ArgumentError(None, f'Der Suchmodus {match_mode} wird nicht unterstützt.')
     # Sonderzeichen wie % müssen in regulären Ausdrücken dialektspezifisch gekennzeichnet werden, da sie darin eine besondere Bedeutung haben 
-    string_to_search = escape_string(dialect, string_to_search)
+    params = {'string_to_search': escape_string(dialect, string_to_search)}
+    # Für die exakte Suche wird der String ohne Escaping verglichen.
+    if match_mode == 'exact':
+        params['string_value'] = string_to_search
+    ### Bestimmung der Teilbedingung je Attribut anhand seiner Datentypinformationen ###
+    predicates = []
+    for column_name in columns_to_search:
+        kind = get_search_predicate_kind(table_meta_data, column_name, string_to_search, match_mode, case_sensitive)
+        if kind is None:
+            continue
+        predicates.append((column_name, kind))
+        # Für Datumsbereiche werden der gesuchte Tag und der Folgetag als Grenzen übergeben.
+        if kind == 'date_range' and 'date_from' not in params.keys():
+            params['date_from'] = datetime.date.fromisoformat(string_to_search)
+            params['date_to'] = params['date_from'] + datetime.timedelta(days = 1)
+        # Für die exakte Suche in Zahlen- und Datumsattributen wird der in den passenden Python-Datentyp umgewandelte String übergeben, damit der 
+        # Vergleich ohne Konversion des Attributs erfolgen kann.
+        elif kind == 'exact_integer':
+            params['integer_value'] = int(string_to_search.strip())
+        elif kind == 'exact_decimal':
+            params['decimal_value'] = Decimal(string_to_search.strip())
+        elif kind == 'exact_date':
+            params['date_value'] = datetime.date.fromisoformat(string_to_search.strip())
+        elif kind == 'exact_datetime':
+            params['datetime_value'] = datetime.datetime.fromisoformat(string_to_search.strip())
+    predicates = tuple(predicates)
+    ### Volltextindex, der genau die verbliebenen (ausschließlich per LIKE durchsuchten) Attribute abdeckt ###
+    fulltext_columns = None
+    if use_search_index and dialect == 'mariadb' and match_mode == 'contains' and not case_sensitive and len(predicates) > 0 and all([kind == 'like' for _, kind in predicates]):
+        fulltext_search_term = build_fulltext_search_term(string_to_search)
+        if fulltext_search_term is not None:
+            for index_columns in get_search_index_columns(table_meta_data):
+                if set(index_columns) == set([column_name for column_name, _ in predicates]):
+                    fulltext_columns = index_columns
+                    params['fulltext_search'] = fulltext_search_term
+                    break
+    return params, predicates, fulltext_columns
+
+def get_search_predicate_kind(table_meta_data:TableMetaData, column_name:str, string_to_search:str, match_mode:str = 'contains', case_sensitive:bool = False):
+    """Bestimmung der Teilbedingung, mit der ein Attribut nach einem String durchsucht wird, anhand der Datentypinformationen. Die Teilbedingung 
+    liefert stets dieselben Tupel wie der Vergleich der Textdarstellung des Attributs per (I)LIKE, ist aber ggf. günstiger auszuwerten.
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    column_name: Name des zu durchsuchenden Attributs
+    
+    string_to_search: zu suchende Zeichenkette (ohne Escaping)
+
+    match_mode, case_sensitive: Suchmodus und Beachtung der Groß- und Kleinschreibung wie bei search_string; für die exakte Suche siehe 
+    get_exact_match_predicate_kind
+    
+    Ausgabe der Art der Teilbedingung als String: 'like' (Vergleich der ggf. konvertierten Textdarstellung), 'prefix_lower' (Präfixsuche ohne 
+    Beachtung der Groß- und Kleinschreibung über einen Index auf lower(Attribut) in PostgreSQL, siehe get_lower_index_columns), 'true', 'false' 
+    bzw. 'not_null' (Boolean-Attribute in PostgreSQL, deren Textdarstellung 'true' oder 'false' lautet), 'date_range' (Datumsattribute bei Suche 
+    nach einem vollständigen Datum im Format JJJJ-MM-TT); None, wenn das Attribut den String nicht enthalten kann."""
+    if match_mode == 'exact':
+        return get_exact_match_predicate_kind(table_meta_data, column_name, string_to_search, case_sensitive)
+    dialect = table_meta_data.engine.dialect.name
+    data_type_group = table_meta_data.get_data_type_group(column_name)
+    data_type = str(table_meta_data.data_type_info.get(column_name, {}).get('data_type', '')).lower()
+    # Ohne Beachtung der Groß- und Kleinschreibung wird der String in Kleinbuchstaben mit den Textdarstellungen verglichen.
+    searched = string_to_search if case_sensitive else string_to_search.lower()
+    characters = set(searched)
+    # In MariaDB werden Boolean-Werte als tinyint(1) gespeichert und daher wie ganze Zahlen behandelt.
+    if data_type_group == 'integer' or (data_type_group == 'boolean' and dialect == 'mariadb'):
+        return 'like' if characters <= integer_search_characters else None
+    elif data_type_group == 'decimal':
+        if data_type in float_data_types:
+            # PostgreSQL schreibt die Sonderwerte als 'Infinity', '-Infinity' und 'NaN'; der Vergleich erfolgt daher stets in Kleinbuchstaben, 
+            # die Groß- und Kleinschreibung wird ggf. erst durch die LIKE-Bedingung geprüft.
+            if characters <= float_search_characters or (dialect == 'postgresql' and (searched.lower() in '-infinity' or searched.lower() in 'nan')):
+                return 'like'
+            return None
+        return 'like' if characters <= decimal_search_characters else None
+    elif data_type_group == 'boolean':
+        # In PostgreSQL lautet die Textdarstellung 'true' oder 'false', sodass der Vergleich durch eine Gleichheitsbedingung ersetzt werden kann.
+        if match_mode == 'prefix':
+            in_true = 'true'.startswith(searched)
+            in_false = 'false'.startswith(searched)
+        else:
+            in_true = searched in 'true'
+            in_false = searched in 'false'
+        if in_true and in_false:
+            return 'not_null'
+        elif in_true:
+            return 'true'
+        elif in_false:
+            return 'false'
+        return None
+    elif data_type_group == 'date':
+        # Die Textdarstellung von Intervallen enthält Wörter wie 'days', sodass sie nicht eingeschränkt wird.
+        if 'interval' in data_type:
+            return 'like'
+        # Ein vollständiges Datum ist in der Textdarstellung von Datums- und Zeitstempelwerten nur am Anfang enthalten und entspricht daher dem 
+        # Bereich vom Beginn des Tages bis zum Beginn des Folgetages.
+        if data_type in date_range_data_types and re.fullmatch(r'\d{4}-\d{2}-\d{2}', string_to_search):
+            try:
+                datetime.date.fromisoformat(string_to_search)
+                return 'date_range'
+            except ValueError:
+                return None
+        # In PostgreSQL können zudem die Werte 'infinity' und der Zusatz 'BC' vorkommen.
+        if characters <= date_search_characters or (dialect == 'postgresql' and (characters <= date_search_characters | set('bc') or searched in '-infinity')):
+            return 'like'
+        return None
+    # ILIKE kann in PostgreSQL keinen B-Baum-Index nutzen; für die Präfixsuche ohne Beachtung der Groß- und Kleinschreibung in Textattributen wird 
+    # daher ein Index auf lower(Attribut) mit Operatorklasse text_pattern_ops genutzt, sofern vorhanden.
+    if (match_mode == 'prefix' and not case_sensitive and dialect == 'postgresql' and data_type_group == 'text' 
+        and get_lower_index_columns(table_meta_data).get(column_name, False)):
+        return 'prefix_lower'
+    # Textbasierte und alle übrigen Attribute werden stets per (I)LIKE durchsucht.
+    return 'like'
+
+def get_exact_match_predicate_kind(table_meta_data:TableMetaData, column_name:str, string_to_search:str, case_sensitive:bool = False):
+    """Bestimmung der Teilbedingung, mit der ein Attribut auf Übereinstimmung mit einem String geprüft wird. Zahlen- und Datumsattribute werden 
+    mit dem umgewandelten String verglichen, damit Indizes auf den Attributen genutzt werden können.
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    column_name: Name des zu durchsuchenden Attributs
+    
+    string_to_search: zu suchende Zeichenkette (ohne Escaping)
+
+    case_sensitive: Boolean-Wert; wenn True, wird Groß- und Kleinschreibung beachtet
+    
+    Ausgabe der Art der Teilbedingung als String: 'exact_text' (Gleichheit der ggf. konvertierten Textdarstellung), 'exact_text_lower' bzw. 
+    'exact_text_ilike' (Gleichheit ohne Beachtung der Groß- und Kleinschreibung in PostgreSQL über lower() bzw. ILIKE, siehe 
+    get_exact_text_predicate_kind), 'exact_integer', 'exact_decimal', 'exact_date' bzw. 'exact_datetime' (Gleichheit mit dem umgewandelten 
+    String), 'true' bzw. 'false' (Boolean-Attribute in PostgreSQL); None, wenn der String keinem Wert des Attributs entsprechen kann."""
+    dialect = table_meta_data.engine.dialect.name
+    data_type_group = table_meta_data.get_data_type_group(column_name)
+    data_type = str(table_meta_data.data_type_info.get(column_name, {}).get('data_type', '')).lower()
+    value = string_to_search.strip()
+    if data_type_group == 'integer' or (data_type_group == 'boolean' and dialect == 'mariadb'):
+        return 'exact_integer' if re.fullmatch(r'[+-]?\d+', value) else None
+    elif data_type_group == 'decimal':
+        try:
+            number = Decimal(value)
+        except InvalidOperation:
+            return None
+        # Werte wie 'NaN' und 'Infinity' (PostgreSQL) werden über ihre Textdarstellung verglichen.
+        return 'exact_decimal' if number.is_finite() else get_exact_text_predicate_kind(table_meta_data, column_name, string_to_search, case_sensitive)
+    elif data_type_group == 'boolean':
+        searched = string_to_search if case_sensitive else string_to_search.lower()
+        if searched == 'true' or searched == 'false':
+            return searched
+        return None
+    elif data_type_group == 'date' and data_type in date_range_data_types:
+        # Nicht umwandelbare Strings (z. B. 'infinity' oder Jahre vor Christus in PostgreSQL) werden über die Textdarstellung verglichen.
+        try:
+            if data_type == 'date':
+                datetime.date.fromisoformat(value)
+                return 'exact_date'
+            datetime.datetime.fromisoformat(value)
+            return 'exact_datetime'
+        except ValueError:
+            return get_exact_text_predicate_kind(table_meta_data, column_name, string_to_search, case_sensitive)
+    return get_exact_text_predicate_kind(table_meta_data, column_name, string_to_search, case_sensitive)
+
+def get_exact_text_predicate_kind(table_meta_data:TableMetaData, column_name:str, string_to_search:str, case_sensitive:bool = False):
+    """Bestimmung der Teilbedingung für den Vergleich der Textdarstellung eines Attributs mit einem String bei der exakten Suche. In PostgreSQL 
+    wird ohne Beachtung der Groß- und Kleinschreibung nur dann lower() verwendet, wenn ein Index auf lower(Attribut) existiert; anderenfalls 
+    wird ILIKE ohne Platzhalter verwendet, das zumindest ein Trigrammindex unterstützt. Ohne Groß- und Kleinbuchstaben im String genügt der 
+    Vergleich per '=', den ein B-Baum-Index auf dem Attribut unterstützt.
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    column_name: Name des zu durchsuchenden Attributs
+    
+    string_to_search: zu suchende Zeichenkette (ohne Escaping)
+
+    case_sensitive: Boolean-Wert; wenn True, wird Groß- und Kleinschreibung beachtet
+    
+    Ausgabe der Art der Teilbedingung als String ('exact_text', 'exact_text_lower' oder 'exact_text_ilike')."""
+    # MariaDB vergleicht gemäß der Sortierung des Attributs, PostgreSQL unterscheidet bei '=' stets Groß- und Kleinschreibung.
+    if table_meta_data.engine.dialect.name != 'postgresql' or case_sensitive or string_to_search.lower() == string_to_search.upper():
+        return 'exact_text'
+    if column_name in get_lower_index_columns(table_meta_data):
+        return 'exact_text_lower'
+    return 'exact_text_ilike'
+
+def build_search_query(table_meta_data:TableMetaData, columns_to_search:list, fulltext_columns:tuple = None, with_limit:bool = False, partition_bounds:tuple = None, match_mode:str = 'contains', case_sensitive:bool = False):
+    """Aufbau des Abfragetextes für die Suche nach einem String in einer Tabelle
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    columns_to_search: Liste der zu durchsuchenden Attribute, siehe build_search_condition
+
+    fulltext_columns: optionales Tupel mit den Attributen eines Volltextindexes (MariaDB), siehe build_search_condition
+
+    with_limit: Boolean-Wert; wenn True, wird die Anzahl der Tupel mit dem Platzhalter :limit begrenzt
+
+    partition_bounds: optionales Tupel zweier Boolean-Werte, ob eine untere und eine obere Grenze des Primärschlüsselbereichs vorhanden ist; 
+    wenn angegeben, wird die Suche auf den Bereich beschränkt und das Ergebnis nach dem Primärschlüssel geordnet (siehe execute_partitioned_query)
+
+    match_mode, case_sensitive: Suchmodus und Beachtung der Groß- und Kleinschreibung, siehe build_search_condition
+    
+    Ausgabe der Abfrage als String mit dem Platzhalter :string_to_search (und ggf. :fulltext_search); Ausgabe eines DialectErrors bei nicht 
+    unterstützten SQL-Dialekten."""
+    dialect = table_meta_data.engine.dialect.name
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, dialect)
+    condition = build_search_condition(table_meta_data, columns_to_search, fulltext_columns, match_mode, case_sensitive)
+    if partition_bounds is None:
+        query = f"SELECT * FROM {table_name} WHERE {condition}"
+    # Im partitionierten Modus wird die Suche auf den Primärschlüsselbereich beschränkt und nach dem Primärschlüssel geordnet.
+    else:
+        key = convert_string_if_contains_capitals_or_spaces(table_meta_data.primary_keys[0], dialect)
+        query = f"SELECT * FROM {table_name} WHERE ({condition}) AND {build_primary_key_range_condition(table_meta_data, *partition_bounds)} ORDER BY {key}"
+    if with_limit:
+        query = f'{query} LIMIT :limit'
+    return query
+
+def build_search_condition(table_meta_data:TableMetaData, columns_to_search:list, fulltext_columns:tuple = None, match_mode:str = 'contains', case_sensitive:bool = False):
+    """Aufbau der Bedingung (ohne WHERE) für die Suche nach einem String in einer Tabelle
+    
+    table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
+    
+    columns_to_search: Liste der zu durchsuchenden Attribute, entweder als Attributnamen (Vergleich per (I)LIKE) oder als Paare aus Attributname
+    und Art der Teilbedingung (siehe get_search_predicate_kind); Teilbedingungen der Art 'date_range' nutzen die Platzhalter :date_from und :date_to,
+    Teilbedingungen der Arten 'exact_text_ilike' und 'prefix_lower' (nur PostgreSQL) den Platzhalter :string_to_search.
+    Ist die Liste leer, kann kein Tupel den Suchstring enthalten.
+
+    fulltext_columns: optionales Tupel mit den Attributen eines Volltextindexes (MariaDB), dessen Bedingung MATCH ... AGAINST der Suchbedingung 
+    vorangestellt wird, damit der Index die Tupel vorauswählt
+
+    match_mode: 'contains', 'prefix' oder 'exact' (siehe search_string); bei 'prefix' wird die Textdarstellung mit dem Muster ':string_to_search%' 
+    verglichen, das anders als '%:string_to_search%' einen Indexbereich beschreibt. Die Teilbedingungen der exakten Suche (siehe 
+    get_exact_match_predicate_kind) nutzen die Platzhalter :string_value, :integer_value, :decimal_value, :date_value und :datetime_value.
+
+    case_sensitive: Boolean-Wert; wenn True, wird Groß- und Kleinschreibung beachtet. In MariaDB wird dafür zusätzlich der binäre Vergleich 
+    geprüft, der die Nutzung des Indexes durch den Vergleich mit der (case-insensitiven) Sortierung des Attributs nicht verhindert.
+    
+    Ausgabe der Bedingung als String mit dem Platzhalter :string_to_search (und ggf. :fulltext_search); Ausgabe eines DialectErrors bei nicht 
+    unterstützten SQL-Dialekten."""
+
+    dialect = table_meta_data.engine.dialect.name
     # Damit die Suche in MariaDB und PostgreSQL Groß- und Kleinschreibung ignoriert, müssen in MariaDB der Operator 'LIKE' und der Datentyp 'CHAR'
     # zur Konversion nicht textbasierter Datentypen verwendet werden, in PostgreSQL 'ILIKE' bzw. 'TEXT'.
     operator, cast_data_type = set_matching_operator_and_cast_data_type(dialect)
+    # Bei Beachtung der Groß- und Kleinschreibung wird in PostgreSQL 'LIKE' verwendet.
+    if case_sensitive and dialect == 'postgresql':
+        operator = 'LIKE'
     # Auch das Verbinden von Strings erfordert unterschiedliche Vorgehensweisen. In PostgreSQL können Strings mit dem Operator '||' verbunden
     # werden, in MariaDB müssen die beiden Strings hingegen der Funktion 'CONCAT' übergeben werden.
-    concatenated_string = get_concatenated_string_for_matching(dialect, 'string_to_search')
+    if match_mode == 'prefix':
+        concatenated_string = get_prefix_string_for_matching(dialect, 'string_to_search')
+    else:
+        concatenated_string = get_concatenated_string_for_matching(dialect, 'string_to_search')
     # Aufbau der Bedingung für die Suche
-    sql_condition = 'WHERE'
+    sql_condition = ''
     # Iteration durch alle Attribute in der ausgewählten Tabelle
-    for column_name in columns_to_search:
+    for entry in columns_to_search:
+        column_name, kind = (entry, 'like') if isinstance(entry, str) else entry
         # Sie werden mit doppelten Anführungszeichen versehen, wenn sie Großbuchstaben (PostgreSQL) oder Leerzeichen enthalten (MariaDB und PostgreSQL).
         attribute_to_search = convert_string_if_contains_capitals_or_spaces(column_name, dialect).strip()
-        # Wenn sie nicht textbasiert sind, ...
-        if table_meta_data.get_data_type_group(column_name) != 'text':
-            # ... werden sie in den dialektspezifischen Textdatentyp konvertiert.
-            attribute_to_search = f'CAST({attribute_to_search} AS {cast_data_type})'
-        if sql_condition == 'WHERE':
-            # Anängen des zu durchsuchenden Attributs und des regulären Ausdrucks für die Suche an die Bedingung 
-            sql_condition = f"{sql_condition} {attribute_to_search} {operator} {concatenated_string}"
+        ### Teilbedingungen ohne Typkonversion, die von Indizes auf dem Attribut unterstützt werden ###
+        if kind == 'true' or kind == 'false':
+            predicate = f'{attribute_to_search} = {kind}'
+        elif kind == 'not_null':
+            predicate = f'{attribute_to_search} IS NOT NULL'
+        elif kind in ('exact_integer', 'exact_decimal', 'exact_date', 'exact_datetime'):
+            predicate = f'{attribute_to_search} = :{kind[len("exact_"):]}_value'
+        elif kind == 'date_range':
+            predicate = f'({attribute_to_search} >= :date_from AND {attribute_to_search} < :date_to)'
+            # In PostgreSQL sind auch Jahre ab 10000 und vor Christus möglich, deren Textdarstellung das Datum an anderer Stelle enthalten kann; 
+            # diese seltenen Werte werden weiterhin über ihre Textdarstellung geprüft.
+            if dialect == 'postgresql':
+                predicate = f"({predicate} OR (({attribute_to_search} >= '10000-01-01' OR {attribute_to_search} < '0001-01-01') AND CAST({attribute_to_search} AS {cast_data_type}) {operator} {concatenated_string}))"
+        ### Vergleich der Textdarstellung ###
+        else:
+            # Wenn sie nicht textbasiert sind, ...
+            if table_meta_data.get_data_type_group(column_name) != 'text':
+                # ... werden sie in den dialektspezifischen Textdatentyp konvertiert.
+                attribute_to_search = f'CAST({attribute_to_search} AS {cast_data_type})'
+            if kind == 'exact_text':
+                # PostgreSQL vergleicht Strings mit '=' unter Beachtung der Groß- und Kleinschreibung, MariaDB gemäß der (in der Regel 
+                # case-insensitiven) Sortierung des Attributs.
+                predicate = f'{attribute_to_search} = :string_value'
+                if case_sensitive and dialect == 'mariadb':
+                    predicate = f'({predicate} AND BINARY {attribute_to_search} = :string_value)'
+            # Ohne Beachtung der Groß- und Kleinschreibung wird in PostgreSQL nur bei vorhandenem Index auf lower(Attribut) lower() verwendet, ...
+            elif kind == 'exact_text_lower':
+                predicate = f'lower({attribute_to_search}) = lower(CAST(:string_value AS TEXT))'
+            # ... anderenfalls ILIKE mit dem maskierten String ohne Platzhalter.
+            elif kind == 'exact_text_ilike':
+                predicate = f'{attribute_to_search} ILIKE :string_to_search'
+            elif kind == 'prefix_lower':
+                predicate = f"lower({attribute_to_search}) LIKE lower(:string_to_search) || '%'"
+            else:
+                predicate = f'{attribute_to_search} {operator} {concatenated_string}'
+                if case_sensitive and dialect == 'mariadb':
+                    # Bei der Präfixsuche bleibt der indexfähige Vergleich erhalten und wird um den binären Vergleich ergänzt.
+                    if match_mode == 'prefix':
+                        predicate = f'({predicate} AND BINARY {attribute_to_search} {operator} {concatenated_string})'
+                    else:
+                        predicate = f'BINARY {attribute_to_search} {operator} {concatenated_string}'
+        if sql_condition == '':
+            # Anängen der Teilbedingung des zu durchsuchenden Attributs an die Bedingung 
+            sql_condition = predicate
         # Handelt es sich nicht um das erste Attribut, ...
         else:
             # ... wird hierbei noch der Operator 'OR' ergänzt.
-            sql_condition = f"{sql_condition} OR {attribute_to_search} {operator} {concatenated_string}"
-    # Zusammenfügen der Abfrage für die Suche 
-    query = text(f"SELECT * FROM {table_name} {sql_condition}")
-    # Aufbau des Parameter-Dictionarys
-    params = {'string_to_search': string_to_search}
-    # Wenn der SQL-Dialekt entweder PostgreSQL oder MariaDB ist, ...
-    if dialect == 'postgresql' or dialect == 'mariadb':
-        # ... wird die Abfrage ausgeführt und das Ergebnis in eine Liste von Listen konvertiert.
-        result = convert_result_to_list_of_lists(execute_sql_query(engine, query, params))
+            sql_condition = f"{sql_condition} OR {predicate}"
+    # Kann keines der Attribute den Suchstring enthalten, wird eine stets falsche Bedingung ausgegeben.
+    if sql_condition == '':
+        sql_condition = '1 = 0'
+    # Bei Nutzung eines Volltextindexes wählt dieser die Tupel vor; die bisherige Bedingung stellt sicher, dass der Suchbegriff als Ganzes enthalten ist.
+    if fulltext_columns is not None:
+        match_columns = ', '.join([convert_string_if_contains_capitals_or_spaces(column_name, dialect) for column_name in fulltext_columns])
+        sql_condition = f"MATCH({match_columns}) AGAINST(:fulltext_search IN BOOLEAN MODE) AND ({sql_condition})"
+    return sql_condition
+
+def build_fulltext_search_term(string_to_search:str):
+    """Umwandlung eines Suchstrings in einen Suchbegriff für die Volltextsuche in MariaDB (BOOLEAN MODE), bei dem jedes Wort als Wortanfang
+    enthalten sein muss
+    
+    string_to_search: zu suchende Zeichenkette
+    
+    Ausgabe des Suchbegriffs als String bzw. None, wenn der String keine Wörter oder Wörter unterhalb der Mindestlänge des Volltextindexes 
+    enthält und daher nicht über den Index gesucht werden kann."""
+    # Operatoren der Volltextsuche (+, -, *, Anführungszeichen etc.) werden dabei ignoriert, da nur Wortzeichen berücksichtigt werden.
+    words = re.findall(r'\w+', string_to_search)
+    if len(words) == 0 or any([len(word) < fulltext_min_word_length for word in words]):
+        return None
+    return ' '.join([f'+{word}*' for word in words])
+
+def get_search_index_columns(table_meta_data:TableMetaData):
+    """Ermittlung der für die Suche nutzbaren Indizes einer Tabelle aus den Servertabellen
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    Ausgabe einer Liste von Tupeln mit den Attributnamen je Index: in PostgreSQL ein Tupel je Attribut mit Trigrammindex (gin_trgm_ops, auch auf 
+    dem in Text konvertierten Attribut), in MariaDB ein Tupel je Volltextindex mit allen seinen Attributen; Ausgabe eines DialectErrors bei nicht 
+    unterstützten SQL-Dialekten."""
+    engine = table_meta_data.engine
+    db_dialect = engine.dialect.name
+    index_columns = []
+    if db_dialect == 'postgresql':
+        # Ausgabe der Definition jedes Indexattributs, dessen Operatorklasse gin_trgm_ops ist (z. B. '"Vorname"' oder '(("Matrikelnummer")::text)')
+        query = text("SELECT pg_get_indexdef(i.indexrelid, k.n + 1, true) FROM pg_index i CROSS JOIN LATERAL generate_series(0, i.indnatts - 1) AS k(n) JOIN pg_opclass o ON o.oid = i.indclass[k.n] WHERE i.indrelid = CAST(:table_name AS regclass) AND o.opcname = 'gin_trgm_ops'")
+        result = execute_sql_query(engine, query, {'table_name': convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)})
+        for row in result:
+            # Entfernen von Klammern, Anführungszeichen und der Typkonversion, sodass der Attributname übrig bleibt
+            column_name = row[0].replace('(', '').replace(')', '').replace('"', '').removesuffix('::text')
+            if column_name in table_meta_data.columns and (column_name,) not in index_columns:
+                index_columns.append((column_name,))
+    elif db_dialect == 'mariadb':
+        query = text("SELECT INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name AND INDEX_TYPE = 'FULLTEXT' ORDER BY INDEX_NAME, SEQ_IN_INDEX")
+        columns_by_index = {}
+        for index_name, column_name in execute_sql_query(engine, query, {'table_name': table_meta_data.table_name}):
+            columns_by_index.setdefault(index_name, []).append(column_name)
+        index_columns = [tuple(columns) for columns in columns_by_index.values()]
     else:
-        # Anderenfalls wird eine Meldung ausgegeben, dass der gewählte SQL-Dialekt nicht unterstützt wird.
-        raise DialectError(f'Der SQL-Dialekt {dialect} wird nicht unterstützt.')
-    # Ausgabe des Ergebnisses der Suche
-    return result
+        raise DialectError(f'Der SQL-Dialekt {db_dialect} wird nicht unterstützt.')
+    return index_columns
+
+def get_lower_index_columns(table_meta_data:TableMetaData):
+    """Ermittlung der Attribute einer Tabelle, deren Wert in Kleinbuchstaben (lower(Attribut)) als erstes Attribut eines B-Baum-Indexes indiziert 
+    ist (nur PostgreSQL; in MariaDB werden solche Indizes nicht benötigt). Das Ergebnis wird je Engine-URL und Tabelle zwischengespeichert.
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    Ausgabe eines Dictionarys mit den Attributnamen als Schlüsseln und einem Boolean-Wert, ob der Index (durch die Operatorklasse 
+    text_pattern_ops bzw. varchar_pattern_ops) auch die Präfixsuche per LIKE unterstützt."""
+    engine = table_meta_data.engine
+    if engine.dialect.name != 'postgresql':
+        return {}
+    cache_key = (engine.url.render_as_string(hide_password = True), table_meta_data.table_name)
+    with lower_index_cache_lock:
+        lower_index_columns = lower_index_cache.get(cache_key)
+    if lower_index_columns is not None:
+        return lower_index_columns
+    # Ausgabe der Definition des ersten Indexattributs (z. B. 'lower("Vorname"::text)') und seiner Operatorklasse für alle B-Baum-Indizes
+    query = text("SELECT pg_get_indexdef(i.indexrelid, 1, true), o.opcname FROM pg_index i JOIN pg_opclass o ON o.oid = i.indclass[0] JOIN pg_am a ON a.oid = o.opcmethod WHERE i.indrelid = CAST(:table_name AS regclass) AND a.amname = 'btree'")
+    result = execute_sql_query(engine, query, {'table_name': convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, 'postgresql')})
+    # Kann der Katalog nicht abgefragt werden, wird ohne Index auf lower(Attribut) gesucht (ohne Zwischenspeicherung).
+    if result is None:
+        return {}
+    lower_index_columns = {}
+    for index_definition, operator_class in result:
+        if not index_definition.startswith('lower('):
+            continue
+        # Entfernen von lower(), Klammern, Anführungszeichen und der Typkonversion, sodass der Attributname übrig bleibt
+        column_name = index_definition.removeprefix('lower(').removesuffix(')').replace('"', '').removesuffix('::text')
+        if column_name in table_meta_data.columns:
+            lower_index_columns[column_name] = lower_index_columns.get(column_name, False) or operator_class in ('text_pattern_ops', 'varchar_pattern_ops')
+    with lower_index_cache_lock:
+        lower_index_cache[cache_key] = lower_index_columns
+    return lower_index_columns
+
+def create_search_indexes(table_meta_data:TableMetaData, columns:list[str]):
+    """Anlegen der Indizes, mit denen die Suche in den angegebenen Attributen ohne vollständiges Durchsuchen der Tabelle erfolgen kann: in 
+    PostgreSQL je Attribut ein GIN-Trigrammindex (Erweiterung pg_trgm) und je Textattribut ein B-Baum-Index auf lower(Attribut) für die Präfix- 
+    und exakte Suche ohne Beachtung der Groß- und Kleinschreibung, in MariaDB ein gemeinsamer Volltextindex über alle textbasierten Attribute
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    columns: Liste der Attribute, die über Indizes durchsucht werden sollen; Attribute, für die kein solcher Index möglich ist (in PostgreSQL 
+    Datumswerte, in MariaDB nicht textbasierte Attribute), werden übergangen
+    
+    Ausgabe der Namen der neu angelegten Indizes als Liste; Ausgabe eines QueryErrors, wenn das Anlegen fehlschlägt (z. B. wegen fehlender 
+    Berechtigungen), eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    engine = table_meta_data.engine
+    db_dialect = engine.dialect.name
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+    existing_index_columns = get_search_index_columns(table_meta_data)
+    statements = []
+    created_indexes = []
+    if db_dialect == 'postgresql':
+        statements.append('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        lower_index_columns = get_lower_index_columns(table_meta_data)
+        for column_name in columns:
+            data_type_group = table_meta_data.get_data_type_group(column_name)
+            # Der Index auf lower(Attribut) nutzt die Operatorklasse text_pattern_ops, damit er auch LIKE-Vergleiche mit Präfixmustern unterstützt.
+            if data_type_group == 'text' and not lower_index_columns.get(column_name, False):
+                index_name = f'{table_meta_data.table_name}_{column_name}_lower_idx'[:63]
+                statements.append(f'CREATE INDEX IF NOT EXISTS {convert_string_if_contains_capitals_or_spaces(index_name, db_dialect)} ON {table_name} (lower({convert_string_if_contains_capitals_or_spaces(column_name, db_dialect)}) text_pattern_ops)')
+                created_indexes.append(index_name)
+            if (column_name,) in existing_index_columns or data_type_group not in trigram_index_data_type_groups:
+                continue
+            # Indexnamen sind in PostgreSQL auf 63 Zeichen beschränkt.
+            index_name = f'{table_meta_data.table_name}_{column_name}_trgm_idx'[:63]
+            column_to_index = convert_string_if_contains_capitals_or_spaces(column_name, db_dialect)
+            # Nicht textbasierte Attribute werden mit demselben Ausdruck indiziert, den die Suchabfrage verwendet, damit der Index genutzt wird.
+            if data_type_group != 'text':
+                column_to_index = f'(CAST({column_to_index} AS TEXT))'
+            statements.append(f'CREATE INDEX IF NOT EXISTS {convert_string_if_contains_capitals_or_spaces(index_name, db_dialect)} ON {table_name} USING gin ({column_to_index} gin_trgm_ops)')
+            created_indexes.append(index_name)
+    elif db_dialect == 'mariadb':
+        text_columns = [column_name for column_name in columns if table_meta_data.get_data_type_group(column_name) == 'text']
+        if len(text_columns) > 0 and not any([set(index_columns) == set(text_columns) for index_columns in existing_index_columns]):
+            index_name = f'{table_meta_data.table_name}_search_idx'[:64]
+            column_list = ', '.join([convert_string_if_contains_capitals_or_spaces(column_name, db_dialect) for column_name in text_columns])
+            statements.append(f'ALTER TABLE {table_name} ADD FULLTEXT INDEX {convert_string_if_contains_capitals_or_spaces(index_name, db_dialect)} ({column_list})')
+            created_indexes.append(index_name)
+    else:
+        raise DialectError(f'Der SQL-Dialekt {db_dialect} wird nicht unterstützt.')
+    if len(created_indexes) == 0:
+        return created_indexes
+    try:
+        with unit_of_work(engine, commit = True) as connection:
+            for statement in statements:
+                connection.execute(text(statement))
+    except Exception as error:
+        raise QueryError(f'Die Suchindizes konnten nicht angelegt werden. {str(error)}')
+    # Die zwischengespeicherten Suchabfragen und Indexattribute der Tabelle werden verworfen, damit die neuen Indizes bei der nächsten Suche 
+    # berücksichtigt werden.
+    invalidate_statement_cache(table_meta_data.table_name)
+    with lower_index_cache_lock:
+        lower_index_cache.pop((engine.url.render_as_string(hide_password = True), table_meta_data.table_name), None)
+    return created_indexes
 
 
 ##### Funktionen für das Ersetzen von (Teil-)Strings #####
 
-def get_replacement_information(table_meta_data:TableMetaData, affected_attributes_and_positions:list[tuple[str, int:0|1]], old_value:str, replacement:str):
+def get_replacement_information(table_meta_data:TableMetaData, affected_attributes_and_positions:list[tuple[str, int:0|1]], old_value:str, replacement:str, partitioned:bool = False):
     """Ermittlung der Zeilennummern, der Positionen der betroffenen Attribute sowie ihrer alten und ihrer neuen Werte für die Ersetzung von (Teil-)Strings.
     
     table_meta_data: TableMetaData-Objekt der zu durchsuchenden Tabelle
@@ -78,6 +867,10 @@ def get_replacement_information(table_meta_data:TableMetaData, affected_attribut
     
     replacement: der neu einzutragende String
 
+    partitioned: Boolean-Wert; wenn True, werden die betroffenen Tupel nebenläufig je Primärschlüsselbereich ermittelt (siehe search_string)
+
+    Die Informationen werden mit einer einzigen Abfrage ermittelt, die nur die betroffenen Tupel ausgibt (siehe build_replacement_preview_query).
+
     Ausgabe zweier Dictionarys: eines zur Identifizierung der betroffenen Tupel der Tabelle, ihrer alten und neuen Werte sowie eines zur eindeutigen
     Identifizierung der Vorkommen des gesuchten Strings für den Fall, dass mehrere Attribute durchsucht wurden; Ausgabe eines ArgumentErrors, wenn
     kein TableMetaData-Objekt übergeben wurde, min. ein Positionswert weder 0 noch 1 ist oder keine Attribute von der Änderung betroffen sein können."""
@@ -90,122 +883,120 @@ def get_replacement_information(table_meta_data:TableMetaData, affected_attribut
     if any([x[1] != 0 and x[1] != 1 for x in affected_attributes_and_positions]):
         raise ArgumentError(None, 'Kann ein Attribut von der Änderung betroffen sein, muss dies durch den Wert 1 in der Liste gekennzeichnet sein. Anderenfalls sollte dort der Wert 0 stehen.')
     
-    ### Auflistung der betroffenen Attribute und Herausfiltern der Positionsliste aus affected_attributes_and_positions ###
+    ### Auflistung der betroffenen Attribute ###
     affected_attributes = []
-    positions = []
     for item in affected_attributes_and_positions:
-        # Wenn der Positionswert des aktuellen Attributs 1 ist, ...
+        # Wenn der Positionswert des aktuellen Attributs 1 ist, wird es in die Liste der betroffenen Attribute aufgenommen.
         if item[1]:
-            # ... wird es in die Liste der betroffenen Attribute aufgenommen
             affected_attributes.append(item[0])
-        # Außerdem wird der Positionswert in eine neue Positionsliste übertragen.
-        positions.append(item[1])
     
-    ### Ermittlung der Tupel und Attribute, in denen der zu ersetzende Wert vorkommt ###
-    # Anlegen eines Dictionarys, in dem die Vorkommen des zu ersetzenden Wertes gespeichert werden
-    occurrence_dict = {}
-    # Beziehen der Primärschlüsselattribute
-    primary_keys = table_meta_data.primary_keys
     # Wenn kein Attribut der Tabelle von der Änderung betroffen sein kann, wird hierzu eine Fehlermeldung ausgegeben.
     if len(affected_attributes) < 1:
-        raise ArgumentError('Es muss mindestens ein Attribut angegeben sein, dessen Werte bearbeitet werden sollen.')
-    
-    ### Ermittlung der betroffenen Tupel, wenn mehr als ein involviert sein kann ###
-    elif len(affected_attributes) > 1:
-        # unveränderte Tabelle zur Ermittlung der alten Werte für die Anzeige
-        unaltered_table = get_full_table_ordered_by_primary_key(table_meta_data, convert = False)
-        # vollständige Attributliste der Tabelle
-        all_attributes = list(unaltered_table.keys())
-
-        ### Ermittlung der Positionen der Primärschlüsselattribute im Abfrageergebnis für die unverönderte Tabelle ###
-        primary_key_indexes = []
-        for index, key in enumerate(all_attributes):
-            if key in primary_keys:
-                primary_key_indexes.append(index)
-
-        # Umwandlung der unveränderten Tabelle in eine Liste von Listen, damit sie ggf. mehrfach durchiteriert werden kann
-        unaltered_table = convert_result_to_list_of_lists(unaltered_table)
-        # Simulation der Ersetzung aller Vorkommen des Strings, um die neuen Werte für die Anzeige zu ermitteln
-        table_with_full_replacement = replace_all_string_occurrences(table_meta_data, affected_attributes, old_value, replacement, commit = False)
-        # Beziehen eines Dictionarys mit den Zeilennummern aller betroffenen Tupel als Schlüssel und einer Liste als Wert, die an der Position
-        # jedes Attributs der Tabelle den Wert 1 enthält, wenn es den gesuchten Wert enthält, sonst 0.
-        row_nos_old_and_new_values = get_indexes_of_affected_attributes_for_replacing(table_meta_data, old_value, affected_attributes)
-
-        ### Erstellen des Dictionarys zur Zuordnung der alten und der neuen Werte sowie der Primärschlüsselwerte zu den Vorkommen des gesuchten Strings ###
-        # Zähler für die Vorkommen des gesuchten Wertes
-        occurrence_counter = 0
-        primary_key_value = []
-        # Für alle betroffenen Tupel wird nun ermittelt, welche ihrer Attribute den gesuchten Wert enthalten.
-        for row_no in row_nos_old_and_new_values.keys():
-            # Da die unveränderte Tabelle und die Tabelle zur Ermittlung der Zeilennummern beide nach den Primärschlüsselattributen geordnet waren,
-            # stehen die alten Werte jedes betroffenen Tupels in der unveränderten Tabelle an derselben Zeilenposition (-1, weil die SQL-Funktion
-            # ROW_NUMBER bei 1 anfängt zu zählen, List-Indizes jedoch bei 0 beginnen).
-            old_values = list(unaltered_table[row_no-1])
-            # Die Positionsliste (aus Nullen und Einsen) wird aus dem Index-Dictionary übernommen.
-            positions = row_nos_old_and_new_values[row_no]
-            for index in positions:
-                # Ist der Wert in dieser Liste nicht 0, handelt es sich um ein Vorkommen des gesuchten Wertes.
-                if index != 0:
-                    # Daher wird der Vorkommenszähler erhöht.
-                    occurrence_counter += 1
-                    # Außerdem werden die Primärschlüsselwerte des Tupels zu dessen eindeutiger Identifizierung für die Ausführung der Ersetzung ermittelt.
-                    for pk_index in primary_key_indexes:
-                        primary_key_value.append(old_values[pk_index])
-                    # Anschließend wird dem Vorkommens-Dictionary ein neuer Eintrag hinzugefügt: mit der laufenden Nummer des Vorkommens als
-                    # Schlüssel und einem weiteren Dictionary mit der Zeilennumer, den Primärschlüsselwerten und dem Namen des betroffenen Attributs als Wert.
-                    occurrence_dict[occurrence_counter] = {'row_no': row_no, 'primary_key': primary_key_value, 'affected_attribute': all_attributes[index]}
-            # Die neuen Werte für das jeweilige Tupel werden der Tabelle entnommen, in der alle Ersetzungen simuliert wurden.
-            new_values = list(table_with_full_replacement[row_no-1])
-            ### In dieser Liste werden alle nicht von der Änderung betroffenen Werte zur leichteren Identifizierung mit 'None' ersetzt. ###
-            for index in range(len(old_values)):
-                if not positions[index]:
-                    new_values[index] = None
-            # Anschließend erhält das Dictionary zur Identifizierung der betroffenen Tupel einen neuen Eintrag: Über die Zeilennummer identifiziert
-            # wird ein weiteres Dictionary eingetragen, das die alten Werte des Tupels, die Positionsliste, die Liste der neuen Werte und die 
-            # Primärschlüsselwerte zur eindeutigen Identifizierung enthält.
-            row_nos_old_and_new_values[row_no] = {'old': old_values, 'positions': positions, 'new': new_values, 'primary_key': primary_key_value}
-    
-    ### Ermittlung der betroffenen Tupel, wenn nur ein Attribut involviert sein kann ### 
+        raise ArgumentError(None, 'Es muss mindestens ein Attribut angegeben sein, dessen Werte bearbeitet werden sollen.')
+
+    ### Beziehen der benötigten Variablen ###
+    engine = table_meta_data.engine
+    db_dialect = engine.dialect.name
+    all_attributes = list(cols_and_dtypes.keys())
+    primary_key_indexes = [index for index, key in enumerate(all_attributes) if key in table_meta_data.primary_keys]
+
+    ### Ermittlung der betroffenen Tupel mit ihren alten und neuen Werten in einer einzigen Abfrage ###
+    # Die Abfrage gibt nur die betroffenen Tupel mit ihrer Zeilennummer, den alten Werten und je betroffenem Attribut einer Markierung des 
+    # Vorkommens sowie dem mit regexp_replace berechneten neuen Wert aus, sodass die Tabelle weder vollständig übertragen noch (in einer 
+    # anschließend zurückgesetzten Transaktion) verändert werden muss. Die Tupel werden mit derselben Bedingung wie von der UPDATE-Anweisung 
+    # ausgewählt (siehe build_replace_match_condition), sodass Vorschau, Anzahl der Ersetzungen und geänderte Tupel übereinstimmen.
+    affected_attributes_and_groups = tuple([(attribute, table_meta_data.get_data_type_group(attribute)) for attribute in affected_attributes])
+    cache_key = (db_dialect, table_meta_data.table_name, 'replacement_preview', affected_attributes_and_groups, tuple(table_meta_data.primary_keys), 
+                 tuple(all_attributes))
+    params = build_replace_all_parameters(table_meta_data, affected_attributes, old_value, replacement)
+    ranges = get_primary_key_ranges(table_meta_data) if partitioned else None
+    # Im partitionierten Modus werden die Zeilennummern wie bei get_row_number_of_affected_entries je Bereich gezählt und um die Anzahl der 
+    # Tupel in den vorangehenden Bereichen erhöht.
+    if ranges is not None:
+        table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+        _, partition_sizes = execute_partitioned_query(table_meta_data, ranges, lambda has_lower_bound, has_upper_bound: get_cached_statement(
+            (db_dialect, table_meta_data.table_name, 'partition_size', has_lower_bound, has_upper_bound), 
+            lambda: f'SELECT COUNT(*) FROM {table_name} WHERE {build_primary_key_range_condition(table_meta_data, has_lower_bound, has_upper_bound)}'))
+        _, partitions = execute_partitioned_query(table_meta_data, ranges, lambda has_lower_bound, has_upper_bound: get_cached_statement(
+            cache_key + ((has_lower_bound, has_upper_bound),), 
+            lambda: build_replacement_preview_query(table_meta_data, affected_attributes, (has_lower_bound, has_upper_bound))), params)
+        result = []
+        row_number_offset = 0
+        for partition_size, partition in zip(partition_sizes, partitions):
+            for row in partition:
+                row[0] += row_number_offset
+                result.append(row)
+            row_number_offset += partition_size[0][0]
     else:
-        ### Wie zuvor werden die Tabelle mit allen Ersetzungen und die Nummern der betroffenen Tupel bezogen ###
-        attribute_with_full_replacement = replace_all_string_occurrences(table_meta_data, affected_attributes, old_value, replacement, commit = False, return_only_affected_attribute = True)
-        affected_row_nos_and_unaltered_entries = get_row_number_of_affected_entries(table_meta_data, affected_attributes, [old_value], 'replace', convert = False)
-        row_nos_old_and_new_values = {}
-        # Hier ist jedoch nur ein Attribut betroffen, sodass keine Liste erforderlich ist.
-        affected_attribute_no = None
-
-        ##### Erstellung des Vorkommens-Dictionarys #####
-        occurrence_counter = 0
-        ### Ermittlung der Position des für die Ersetzung ausgewählten Attributs im Abfrageergebnis der vollen Ersetzung ###
-        for index, key in enumerate(affected_row_nos_and_unaltered_entries.keys()):
-            if key == affected_attributes[0]:
-                # Abzug von 1, weil das Abfrageergebnis zusätzlich zu den Attributen der Tabelle die Zeilennummer an erster Stelle enthält
-                affected_attribute_no = index - 1
-                # Abbruch der Schleife, da nur ein Attribut durchsucht wird
-                break
-        for row in affected_row_nos_and_unaltered_entries:
-            ### Ermittlung der Primärschlüsselwerte des aktuellen Tupels ###
-            primary_key_value = []
-            for index, key in enumerate(affected_row_nos_and_unaltered_entries.keys()):
-                if key in primary_keys:
-                    primary_key_value.append(row[index])
-            # Die Tupelnummer steht im ersten Eintrag der aktuellen Zeile des Abfrageergebnisses.
-            row_no = row[0]
-            # Somit enthalten alle anderen Einträge der Zeile die alten Werte, die als Liste übernommen werden.
-            old_values = list(row[1:])
-            ### Ermittlung der Liste der neuen Werte ###
-            # Erstellen einer Liste mit einem Eintrag 'None' für jedes Attribut der Tabelle
-            new_values = [None] * len(old_values)
-            # An der Position des betroffenen Attributs wird in diese der entsprechende neue Wert eingetragen.
-            new_values[affected_attribute_no] = attribute_with_full_replacement[row_no-1][0]
-            ### Zusammenfügen der Ausgabe-Dictionarys ###
-            row_nos_old_and_new_values[row_no] = {'old': old_values, 'positions': positions, 'new': new_values, 'primary_key': primary_key_value}
-            occurrence_counter += 1
-            occurrence_dict[occurrence_counter] = {'row_no': row_no, 'primary_key': primary_key_value, 'affected_attribute': affected_attributes[0]}
+        query = get_cached_statement(cache_key, lambda: build_replacement_preview_query(table_meta_data, affected_attributes))
+        result = convert_result_to_list_of_lists(execute_sql_query(engine, query, params, raise_exceptions = True))
+
+    ### Erstellen der Dictionarys zur Zuordnung der alten und der neuen Werte sowie der Primärschlüsselwerte zu den Vorkommen des gesuchten Strings ###
+    row_nos_old_and_new_values = {}
+    occurrence_dict = {}
+    # Zähler für die Vorkommen des gesuchten Wertes
+    occurrence_counter = 0
+    attribute_count = len(all_attributes)
+    for row in result:
+        # Die Tupelnummer steht im ersten Eintrag der Ergebniszeile, danach folgen die alten Werte aller Attribute sowie je betroffenem Attribut 
+        # die Markierung des Vorkommens und der neue Wert.
+        row_no = row[0]
+        old_values = list(row[1:attribute_count + 1])
+        primary_key_value = [old_values[index] for index in primary_key_indexes]
+        positions = [0] * attribute_count
+        new_values = [None] * attribute_count
+        for affected_index, attribute in enumerate(affected_attributes):
+            if row[attribute_count + 1 + 2 * affected_index]:
+                attribute_index = all_attributes.index(attribute)
+                positions[attribute_index] = 1
+                new_values[attribute_index] = row[attribute_count + 2 + 2 * affected_index]
+        # Die Vorkommen werden in der Reihenfolge der Attribute der Tabelle gezählt.
+        for attribute_index, position in enumerate(positions):
+            if position:
+                occurrence_counter += 1
+                occurrence_dict[occurrence_counter] = {'row_no': row_no, 'primary_key': primary_key_value, 'affected_attribute': all_attributes[attribute_index]}
+        row_nos_old_and_new_values[row_no] = {'old': old_values, 'positions': positions, 'new': new_values, 'primary_key': primary_key_value}
     # Ausgabe der vollständigen Dictionarys
     return row_nos_old_and_new_values, occurrence_dict
 
-def replace_all_string_occurrences(table_meta_data:TableMetaData, column_names:list, string_to_replace:str, replacement_string:str, commit:bool = False, return_only_affected_attribute:bool = False):
+def stream_replacement_preview(table_meta_data:TableMetaData, affected_attributes:list[str], old_value:str, replacement:str, batch_size:int = None):
+    """Blockweise Ausgabe der Vorschau für das Ersetzen (siehe get_replacement_information) für den Export, ohne dass die betroffenen Tupel 
+    vollständig im Speicher gehalten werden
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    affected_attributes: Liste der Attribute, die von der Ersetzung betroffen sein können
+    
+    old_value: zu ersetzender Wert als String
+    
+    replacement: neu einzutragender Wert als String
+
+    batch_size: optionale Anzahl der Tupel je Block (siehe stream_sql_query)
+    
+    Ausgabe eines Tupels aus der Liste der Attributnamen (Zeilennummer, alle Attribute der Tabelle und je betroffenem Attribut '<Name> (neu)') und 
+    einem Generator, der die betroffenen Tupel nach Primärschlüsseln geordnet in Blöcken als Listen von Listen liefert; bei Attributen ohne 
+    Vorkommen ist der neue Wert None. Ausgabe eines ArgumentErrors, wenn kein Attribut angegeben ist."""
+    if len(affected_attributes) < 1:
+        raise ArgumentError(None, 'Es muss mindestens ein Attribut angegeben sein, dessen Werte bearbeitet werden sollen.')
+    engine = table_meta_data.engine
+    db_dialect = engine.dialect.name
+    all_attributes = list(table_meta_data.data_type_info.keys())
+    # Es wird dieselbe Abfrage wie für die Vorschau im Browser verwendet, die die Tupel bereits nach ihrer Zeilennummer ordnet.
+    affected_attributes_and_groups = tuple([(attribute, table_meta_data.get_data_type_group(attribute)) for attribute in affected_attributes])
+    cache_key = (db_dialect, table_meta_data.table_name, 'replacement_preview', affected_attributes_and_groups, tuple(table_meta_data.primary_keys), 
+                 tuple(all_attributes))
+    query = get_cached_statement(cache_key, lambda: build_replacement_preview_query(table_meta_data, affected_attributes))
+    params = build_replace_all_parameters(table_meta_data, affected_attributes, old_value, replacement)
+    column_names = ['Nr'] + all_attributes + [f'{attribute} (neu)' for attribute in affected_attributes]
+    # Hinter der Zeilennummer und den alten Werten folgen je betroffenem Attribut die Markierung des Vorkommens und der neue Wert, von denen 
+    # nur Letzterer ausgegeben wird.
+    old_value_count = len(all_attributes) + 1
+    batches = ([row[:old_value_count] + [row[old_value_count + 2 * index + 1] for index in range(len(affected_attributes))] for row in batch] 
+               for batch in stream_sql_query(engine, query, params, batch_size))
+    return column_names, batches
+
+def replace_all_string_occurrences(table_meta_data:TableMetaData, column_names:list, string_to_replace:str, replacement_string:str, commit:bool = False, return_only_affected_attribute:bool = False,
+                                   return_row_count:bool = False):
     """Ersetzt alle Vorkommen des gesuchten Wertes, für Strings auch als Teilersetzungen und gibt die aktualisierte Tabelle aus.
     
     table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
@@ -220,103 +1011,383 @@ def replace_all_string_occurrences(table_meta_data:TableMetaData, column_names:l
 
     return_only_affected_attribute: Flag für eine Beschränkung des ausgegebenen Abfrageergebnisses auf das betroffene Attribut
 
-    Ausgabe der gesamten aktualisierten Tabelle bzw. des aktualisierten Attributs, wenn dies ausgewählt wurde als Liste von Listen; Ausgabe
-    eines UpdateErrors, wenn bei der Abfrageausführung Fehler auftreten."""
+    return_row_count: Flag für die zusätzliche Ausgabe der Anzahl der geänderten Tupel
+
+    Ausgabe der gesamten aktualisierten Tabelle bzw. des aktualisierten Attributs, wenn dies ausgewählt wurde als Liste von Listen (mit 
+    return_row_count als Tupel aus dieser Liste und der Anzahl der geänderten Tupel); Ausgabe eines UpdateErrors, wenn bei der Abfrageausführung 
+    Fehler auftreten."""
 
-    ### Vorbereiten der Variablen für die Datenbankabfrage, ggf. mit Escaping ###
+    ### Vorbereiten der Variablen für die Datenbankabfrage ###
     engine = table_meta_data.engine
     db_dialect = engine.dialect.name
-    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
-    string_to_replace = escape_string(db_dialect, string_to_replace)
-    replacement_string = escape_string(db_dialect, replacement_string)
-    primary_keys = ', '.join([convert_string_if_contains_capitals_or_spaces(key, db_dialect) for key in table_meta_data.primary_keys])
 
-    ### Aufbau der Abfrage und des Parameter-Dictionarys ###
-    update_params = {}
+    ### Beziehen der Anweisung aus dem Anweisungs-Cache; sie hängt nur vom Dialekt, der Tabelle und den betroffenen Attributen ab ###
+    column_names_and_groups = tuple([(column_name, table_meta_data.get_data_type_group(convert_string_if_contains_capitals_or_spaces(column_name, db_dialect))) for column_name in column_names])
+    query = get_cached_statement((db_dialect, table_meta_data.table_name, 'replace_all', column_names_and_groups), lambda: build_replace_all_query(table_meta_data, column_names))
 
-    query = f'UPDATE {table_name} SET'
-    ## Aufbau des Abfragenabschnitts, in dem der einzutragende Wert steht ##
-    for index, column_name in enumerate(column_names):
-        column_name = convert_string_if_contains_capitals_or_spaces(column_name, db_dialect)
-        data_type_group = table_meta_data.get_data_type_group(column_name)
-        ## Im Fall nicht textbasierter Datentypen wird der neue Wert als vollständiger Ersatz für den alten eingetragen ##
-        if data_type_group != 'text':
-            # Einfügen des Platzhalters für den neuen Wert in die Abfrage
-            query = f"{query} {column_name} = :new_value_{str(index)}"
-            ## Eintragen des ggf. konvertierten neuen Wertes in das Parameter-Dictionary ##
-            if data_type_group == 'integer':
-                update_params[f'new_value_{str(index)}'] = int(replacement_string)
-            elif data_type_group == 'decimal':
-                update_params[f'new_value_{str(index)}'] = float(replacement_string)
-            elif data_type_group == 'boolean':
-                update_params[f'new_value_{str(index)}'] = bool(replacement_string)
-            else:
-                update_params[f'new_value_{str(index)}'] = replacement_string
-        ## Im Fall textbasierter Datentypen wird eine Ersetzung des gesuchten (Teil-)Strings mit regexp_replace vorgenommen. ##
-        else:
-             ## Ergänzung von Flags, damit das Matching mittels regulärer Ausdrücke in MariaDB und PostgreSQL gleich erfolgt ##
-            postgres_flag = ''
-            old_value = string_to_replace
-            if db_dialect == 'postgresql':
-                postgres_flag = ", 'g'"
-            # In MariaDB muss dem alten Wert das Flag '(?-i)' vorangestellt werden, damit das Matching unabhängig von der Tabellenkollation unter
-            # Berücksichtigung von Groß- und Kleinschreibung erfolgt.
-            elif db_dialect == 'mariadb':
-                old_value = f'(?-i){string_to_replace}'
-
-            # Erstellung der Abfrage    
-            query = f"{query} {column_name} = regexp_replace({column_name}, :old_value, :new_value{postgres_flag})"
-            # Wenn noch keine Eintragung dieser Art im Parameter-Dictionary vorgenommen wurde, ...
-            if 'old_value' not in update_params.keys():
-                # ... werden der zu ersetzende ...
-                update_params['old_value'] = old_value
-                # ... und der neue String in das Dictionary eingetragen.
-                update_params['new_value'] = replacement_string
-        # Wenn es sich nicht um den letzten aufzulistenden Wert handelt, wird dem Ausdruck ein Komma angehängt.
-        if index != len(column_names)-1:
-            query = f'{query},' 
-    # Da alle Vorkommen ersetzt werden, enthält die Anweisung keine Bedingung.
-    query = text(query)
+    ### Aufbau des Parameter-Dictionarys ###
+    update_params = build_replace_all_parameters(table_meta_data, column_names, string_to_replace, replacement_string)
+
+    ### Beziehen der Abfrage für das Ergebnis der Änderung ###
+    # Wenn gewünscht, wird nur das betroffene Attribut abgefragt, anderenfalls werden alle Attribute der Tabelle abgefragt.
+    selected_column = column_names[0] if return_only_affected_attribute else None
+    select_query = get_cached_statement((db_dialect, table_meta_data.table_name, 'select_ordered', selected_column, tuple(table_meta_data.primary_keys)), lambda: build_ordered_select_query(table_meta_data, selected_column))
     ### Ausführung der Abfrage ###
-    # Binden der Parameter 
-    for key in update_params.keys():
-        query.bindparams(bindparam(key))
     try:
-        ## Ausführung der Änderung ##
-        connection = engine.connect()
-        connection.execute(query, update_params)
-        ## Anschließend wird das Ergebnis der Änderung über dieselbe Verbindung abgefragt. ##
-        # Wenn gewünscht, wird nur das betroffene Attribut abgefragt.
-        if return_only_affected_attribute:
-            column_name = convert_string_if_contains_capitals_or_spaces(column_names[0], db_dialect)
-            result = connection.execute(text(f'SELECT {column_name} FROM {table_name} ORDER BY {primary_keys}'))
-        # Anderenfalls werden alle Attribute der Tabelle abgefragt.
-        else:
-            result = connection.execute(text(f'SELECT * FROM {table_name} ORDER BY {primary_keys}'))
-    # Treten Fehler auf, wird die gesamte Transaktion rückgängig gemacht ...
+        # Änderung und anschließende Abfrage teilen sich eine Verbindung und eine Transaktion, die nur bei Erfolg und nur wenn gewünscht
+        # in die Datenbank geschrieben wird; bei Fehlern wird sie vollständig rückgängig gemacht.
+        with unit_of_work(engine, commit) as connection:
+            ## Ausführung der Änderung, die nur die Tupel mit Vorkommen des gesuchten Wertes umschreibt ##
+            row_count = connection.execute(query, update_params).rowcount
+            ## Anschließend wird das Ergebnis der Änderung über dieselbe Verbindung abgefragt. ##
+            result = connection.execute(select_query)
+            # Das Ergebnis wird noch innerhalb der Transaktion in eine Liste von Listen umgewandelt.
+            result = convert_result_to_list_of_lists(result)
+    # Bei Fehlern wird ein UpdateError ausgegeben.
     except Exception as error:
-        connection.rollback()   
-        # ... und ein UpdateError ausgegeben.     
         raise UpdateError(str(error))
+    # Nach gespeicherten Änderungen sind zwischengespeicherte Such- und Vorschauergebnisse der Tabelle veraltet.
+    if commit:
+        invalidate_result_cache(engine, table_meta_data.table_name)
+    # Ausgabe der aktualisierten Tabelle (bzw. nur des aktualisierten Attributs) als Liste von Listen, ggf. mit der Anzahl der geänderten Tupel
+    if return_row_count:
+        return result, row_count
+    return result
+
+def get_replace_checkpoint_key(table_meta_data:TableMetaData, column_names:list, string_to_replace:str, replacement_string:str):
+    """Schlüssel des Fortsetzungspunktes einer abschnittsweisen Ersetzung in replace_checkpoints_file (Engine ohne Passwort, Tabelle, Attribute und Werte)"""
+    return (table_meta_data.engine.url.render_as_string(hide_password = True), table_meta_data.table_name, tuple(column_names), string_to_replace, replacement_string)
+
+def load_replace_checkpoints():
+    """Einlesen der Fortsetzungspunkte aus replace_checkpoints_file (nur unter replace_checkpoints_lock aufzurufen)
+    
+    Ausgabe eines Dictionarys mit den Schlüsseln aus get_replace_checkpoint_key und den Fortsetzungspunkten als Werten."""
+    if not os.path.exists(replace_checkpoints_file):
+        return {}
+    with open(replace_checkpoints_file, 'r', encoding = 'utf-8') as f:
+        entries = json.load(f)
+    # Jeder Eintrag enthält die Bestandteile des Schlüssels (mit der Attributliste an dritter Stelle) und den Fortsetzungspunkt.
+    return {(engine_url, table_name, tuple(column_names), string_to_replace, replacement_string): last_key 
+            for engine_url, table_name, column_names, string_to_replace, replacement_string, last_key in entries}
+
+def store_replace_checkpoint(checkpoint_key:tuple, last_key:list|None):
+    """Speichern bzw. (bei last_key = None) Entfernen eines Fortsetzungspunktes in replace_checkpoints_file (nur unter replace_checkpoints_lock 
+    aufzurufen). Die Datei wird über eine temporäre Datei ersetzt, sodass sie auch bei einem Absturz während des Schreibens lesbar bleibt.
+    
+    checkpoint_key: Schlüssel aus get_replace_checkpoint_key
+    
+    last_key: Primärschlüsselwerte des zuletzt gespeicherten Abschnitts; Werte ohne JSON-Entsprechung werden wie bei get_table_page als String 
+    gespeichert, den die Datenbank beim Vergleich wieder in den Datentyp des Attributs umwandelt."""
+    checkpoints = load_replace_checkpoints()
+    if last_key is None:
+        # Ohne gespeicherten Fortsetzungspunkt muss die Datei nicht angelegt werden.
+        if checkpoints.pop(checkpoint_key, None) is None:
+            return
     else:
-        # Bei Erfolg wird die Aktion in die Datenbank geschrieben, wenn gewünscht.
-        if commit:
-            connection.commit()
-        # Anderenfalls wird die Transaktion ebenfalls rückgängig gemacht. 
+        checkpoints[checkpoint_key] = last_key
+    entries = [[key[0], key[1], list(key[2]), key[3], key[4], value] for key, value in checkpoints.items()]
+    temporary_file = f'{replace_checkpoints_file}.tmp'
+    with open(temporary_file, 'w', encoding = 'utf-8') as f:
+        json.dump(entries, f, default = str, ensure_ascii = False)
+    os.replace(temporary_file, replace_checkpoints_file)
+
+def get_replace_checkpoint(table_meta_data:TableMetaData, column_names:list, string_to_replace:str, replacement_string:str):
+    """Ausgabe des Fortsetzungspunktes (Primärschlüsselwerte des zuletzt gespeicherten Abschnitts) einer unterbrochenen abschnittsweisen Ersetzung 
+    mit denselben Argumenten bzw. None, wenn keine solche Ersetzung besteht; die Parameter entsprechen denen von replace_all_string_occurrences_in_chunks."""
+    with replace_checkpoints_lock:
+        return load_replace_checkpoints().get(get_replace_checkpoint_key(table_meta_data, column_names, string_to_replace, replacement_string))
+
+def replace_all_string_occurrences_in_chunks(table_meta_data:TableMetaData, column_names:list, string_to_replace:str, replacement_string:str, chunk_size:int = None, resume:bool = False, progress = None):
+    """Ersetzt alle Vorkommen des gesuchten Wertes wie replace_all_string_occurrences, aber abschnittsweise entlang des Primärschlüssels. Jeder 
+    Abschnitt wird in einer eigenen Transaktion gespeichert, sodass Sperren und Undo- bzw. WAL-Daten auf einen Abschnitt beschränkt bleiben. Nach 
+    jedem Abschnitt wird ein Fortsetzungspunkt gespeichert, an dem eine unterbrochene Ersetzung mit denselben Argumenten fortgesetzt wird.
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    column_names: Liste der zu betrachtenden Attribute
+    
+    string_to_replace: zu ersetzender Wert als String
+    
+    replacement_string: neu einzutragender Wert als String
+
+    chunk_size: Anzahl der Tupel je Abschnitt (Standard: default_replace_chunk_size)
+
+    resume: Boolean-Wert; wenn True, wird eine zuvor (auch durch einen Neustart der App) unterbrochene Ersetzung mit denselben Argumenten am in 
+    replace_checkpoints_file gespeicherten Fortsetzungspunkt fortgesetzt, anderenfalls (Standard) wird ein gespeicherter Fortsetzungspunkt verworfen und die Ersetzung beginnt am Anfang der Tabelle
+
+    progress: optionale Funktion, die nach jedem gespeicherten Abschnitt mit dessen Bericht (siehe Ausgabe) aufgerufen wird
+
+    Ausgabe eines Dictionarys mit der Liste der Berichte je Abschnitt ('chunks', jeweils mit den Primärschlüsselwerten des letzten Tupels 
+    ('last_key') und der Anzahl der geänderten Tupel ('row_count')), der Gesamtzahl der geänderten Tupel ('row_count') und dem Fortsetzungspunkt, 
+    an dem die Ersetzung begonnen hat ('resumed_from'); Ausgabe eines UpdateErrors, wenn bei der Ausführung eines Abschnitts Fehler auftreten. 
+    Die bis dahin gespeicherten Abschnitte bleiben erhalten."""
+    engine = table_meta_data.engine
+    db_dialect = engine.dialect.name
+    if chunk_size is None:
+        chunk_size = default_replace_chunk_size
+    if chunk_size < 1:
+        raise ArgumentError(None, 'Ein Abschnitt muss mindestens ein Tupel umfassen.')
+    primary_keys = table_meta_data.primary_keys
+    checkpoint_key = get_replace_checkpoint_key(table_meta_data, column_names, string_to_replace, replacement_string)
+    with replace_checkpoints_lock:
+        if resume:
+            last_key = load_replace_checkpoints().get(checkpoint_key)
+        # Eine neu begonnene Ersetzung verwirft den Fortsetzungspunkt einer früheren, unterbrochenen Ersetzung.
         else:
-            connection.rollback()
-    ## Schließen der Verbindung ##
-    finally:
+            store_replace_checkpoint(checkpoint_key, None)
+            last_key = None
+    resumed_from = last_key
+
+    ### Beziehen der Anweisungen aus dem Anweisungs-Cache ###
+    column_names_and_groups = tuple([(column_name, table_meta_data.get_data_type_group(column_name)) for column_name in column_names])
+    cache_key = (db_dialect, table_meta_data.table_name, 'replace_chunk', column_names_and_groups, tuple(primary_keys))
+    update_params = build_replace_all_parameters(table_meta_data, column_names, string_to_replace, replacement_string)
+
+    chunks = []
+    row_count = 0
+    while True:
+        has_lower_bound = last_key is not None
+        params = {'offset': chunk_size - 1}
+        if has_lower_bound:
+            params.update({f'lower_{index}': value for index, value in enumerate(last_key)})
         try:
-            connection.close()
-        # Fehler treten hierbei üblicherweise auf, wenn keine Verbindung aufgebaut werden konnte. Da eine nicht geöffnete Verbindung nicht 
-        # geschlossen werden muss, kann dies ignoriert werden.
+            ## Ermittlung des letzten Tupels des Abschnitts; fehlt dieses, reicht der Abschnitt bis zum Ende der Tabelle. ##
+            bound_query = get_cached_statement(cache_key + ('bound', has_lower_bound), lambda: build_chunk_bound_query(table_meta_data, has_lower_bound))
+            upper_key = execute_sql_query(engine, bound_query, params, raise_exceptions = True).fetchone()
+            has_upper_bound = upper_key is not None
+            if has_upper_bound:
+                params.update({f'upper_{index}': value for index, value in enumerate(upper_key)})
+            update_query = get_cached_statement(cache_key + ('update', has_lower_bound, has_upper_bound), lambda: build_replace_all_query(
+                table_meta_data, column_names, build_chunk_condition(table_meta_data, has_lower_bound, has_upper_bound).removeprefix(' WHERE ')))
+            ## Ausführung und Speicherung des Abschnitts in einer eigenen Transaktion ##
+            with unit_of_work(engine, commit = True) as connection:
+                chunk_row_count = connection.execute(update_query, dict(update_params, **params)).rowcount
         except Exception as error:
-            pass
-    # Ausgabe der aktualisierten Tabelle (bzw. nur des aktualisierten Attributs) als Liste von Listen
-    return convert_result_to_list_of_lists(result)
+            raise UpdateError(f'Die Ersetzung wurde nach {len(chunks)} Abschnitten mit {row_count} geänderten Tupeln unterbrochen und kann fortgesetzt werden: {str(error)}')
+        ## Fortsetzungspunkt und Bericht des gespeicherten Abschnitts ##
+        last_key = list(upper_key) if has_upper_bound else None
+        # Nach dem letzten Abschnitt ist die Ersetzung vollständig und der Fortsetzungspunkt wird entfernt.
+        with replace_checkpoints_lock:
+            store_replace_checkpoint(checkpoint_key, last_key)
+        chunk_report = {'last_key': last_key, 'row_count': chunk_row_count}
+        chunks.append(chunk_report)
+        row_count += chunk_row_count
+        invalidate_result_cache(engine, table_meta_data.table_name)
+        if progress is not None:
+            progress(chunk_report)
+        if not has_upper_bound:
+            break
+    return {'chunks': chunks, 'row_count': row_count, 'resumed_from': resumed_from}
+
+def build_chunk_bound_query(table_meta_data:TableMetaData, has_lower_bound:bool):
+    """Aufbau der Abfrage für die Primärschlüsselwerte des letzten Tupels eines Abschnitts bei der abschnittsweisen Ersetzung
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    has_lower_bound: Boolean-Wert, ob der Abschnitt hinter dem Tupel mit den Primärschlüsselwerten :lower_<Index> beginnt
+    
+    Ausgabe der Abfrage als String mit dem Platzhalter :offset (Anzahl der Tupel je Abschnitt - 1)."""
+    db_dialect = table_meta_data.engine.dialect.name
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+    keys = ', '.join([convert_string_if_contains_capitals_or_spaces(key, db_dialect) for key in table_meta_data.primary_keys])
+    return f'SELECT {keys} FROM {table_name}{build_chunk_condition(table_meta_data, has_lower_bound, False)} ORDER BY {keys} LIMIT 1 OFFSET :offset'
+
+def build_chunk_condition(table_meta_data:TableMetaData, has_lower_bound:bool, has_upper_bound:bool):
+    """Aufbau der Bedingung für einen Abschnitt der abschnittsweisen Ersetzung als Vergleich der Primärschlüsselwerte (bei mehreren 
+    Primärschlüsselattributen als Zeilenwertvergleich wie bei get_table_page)
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    has_lower_bound: Boolean-Wert, ob der Abschnitt hinter dem Tupel mit den Primärschlüsselwerten :lower_<Index> beginnt
+    
+    has_upper_bound: Boolean-Wert, ob der Abschnitt mit dem Tupel mit den Primärschlüsselwerten :upper_<Index> endet
+    
+    Ausgabe der Bedingung mit vorangestelltem ' WHERE' bzw. eines leeren Strings, wenn der Abschnitt die gesamte Tabelle umfasst."""
+    db_dialect = table_meta_data.engine.dialect.name
+    primary_keys = table_meta_data.primary_keys
+    keys = ', '.join([convert_string_if_contains_capitals_or_spaces(key, db_dialect) for key in primary_keys])
+    if len(primary_keys) > 1:
+        keys = f'({keys})'
+    conditions = []
+    for has_bound, operator, prefix in ((has_lower_bound, '>', 'lower'), (has_upper_bound, '<=', 'upper')):
+        if has_bound:
+            values = ', '.join([f':{prefix}_{index}' for index in range(len(primary_keys))])
+            if len(primary_keys) > 1:
+                values = f'({values})'
+            conditions.append(f'{keys} {operator} {values}')
+    if len(conditions) == 0:
+        return ''
+    return f' WHERE {" AND ".join(conditions)}'
+
+def build_replace_all_parameters(table_meta_data:TableMetaData, column_names:list, string_to_replace:str, replacement_string:str):
+    """Aufbau des Parameter-Dictionarys für die Anweisung aus build_replace_all_query bzw. die Abfrage aus build_replacement_preview_query
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    column_names: Liste der zu betrachtenden Attribute
+    
+    string_to_replace: zu ersetzender Wert als String (ohne Escaping)
+    
+    replacement_string: neu einzutragender Wert als String (ohne Escaping)
+    
+    Ausgabe des Dictionarys mit den Einträgen 'new_value_<Index>' für nicht textbasierte Attribute, 'old_value' und 'new_value' für 
+    textbasierte Attribute sowie 'search_value' für den Vergleich per (I)LIKE."""
+    db_dialect = table_meta_data.engine.dialect.name
+    # Sonderzeichen werden dialektspezifisch gekennzeichnet.
+    string_to_replace = escape_string(db_dialect, string_to_replace)
+    replacement_string = escape_string(db_dialect, replacement_string)
+    # Für den Vergleich per (I)LIKE wird der zu ersetzende Wert ohne das Flag für regexp_replace übergeben.
+    update_params = {'search_value': string_to_replace}
+    for index, column_name in enumerate(column_names):
+        data_type_group = table_meta_data.get_data_type_group(convert_string_if_contains_capitals_or_spaces(column_name, db_dialect))
+        ## Im Fall nicht textbasierter Datentypen wird der ggf. konvertierte neue Wert als vollständiger Ersatz für den alten eingetragen ##
+        if data_type_group == 'integer':
+            update_params[f'new_value_{str(index)}'] = int(replacement_string)
+        elif data_type_group == 'decimal':
+            update_params[f'new_value_{str(index)}'] = float(replacement_string)
+        elif data_type_group == 'boolean':
+            update_params[f'new_value_{str(index)}'] = bool(replacement_string)
+        elif data_type_group != 'text':
+            update_params[f'new_value_{str(index)}'] = replacement_string
+        ## Im Fall textbasierter Datentypen werden der zu ersetzende und der neue String für regexp_replace eingetragen. ##
+        elif 'old_value' not in update_params.keys():
+            # In MariaDB muss dem alten Wert das Flag '(?-i)' vorangestellt werden, damit das Matching unabhängig von der Tabellenkollation unter
+            # Berücksichtigung von Groß- und Kleinschreibung erfolgt.
+            if db_dialect == 'mariadb':
+                update_params['old_value'] = f'(?-i){string_to_replace}'
+            else:
+                update_params['old_value'] = string_to_replace
+            update_params['new_value'] = replacement_string
+    return update_params
 
-def get_indexes_of_affected_attributes_for_replacing(table_meta_data:TableMetaData, old_value:str, affected_attributes:list = None):
+def build_replace_all_query(table_meta_data:TableMetaData, column_names:list, additional_condition:str = None):
+    """Aufbau des Anweisungstextes für das Ersetzen aller Vorkommen eines Wertes in den angegebenen Attributen. Die Anweisung schreibt nur die 
+    Tupel um, die den Wert in mindestens einem der Attribute enthalten; bei mehreren Attributen wird jedes nur in den Tupeln verändert, in 
+    denen es den Wert enthält, sodass rowcount genau die Anzahl der geänderten Tupel angibt.
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    column_names: Liste der zu betrachtenden Attribute
+
+    additional_condition: optionale weitere Bedingung (ohne WHERE), z. B. für den Primärschlüsselbereich eines Abschnitts
+    
+    Ausgabe der UPDATE-Anweisung als String mit den Platzhaltern :new_value_<Index> für nicht textbasierte Attribute, :old_value und 
+    :new_value für textbasierte Attribute sowie :search_value für den Vergleich."""
+
+    db_dialect = table_meta_data.engine.dialect.name
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+    assignments = []
+    conditions = []
+    ## Aufbau des Abfragenabschnitts, in dem der einzutragende Wert steht ##
+    for index, column_name in enumerate(column_names):
+        column_name = convert_string_if_contains_capitals_or_spaces(column_name, db_dialect)
+        data_type_group = table_meta_data.get_data_type_group(column_name)
+        new_value = build_replacement_expression(db_dialect, column_name, data_type_group, index)
+        condition = build_replace_match_condition(db_dialect, column_name, data_type_group)
+        conditions.append(condition)
+        # Bei mehreren Attributen behalten diejenigen, die den Wert im jeweiligen Tupel nicht enthalten, ihren bisherigen Wert.
+        if len(column_names) > 1:
+            new_value = f'CASE WHEN {condition} THEN {new_value} ELSE {column_name} END'
+        assignments.append(f'{column_name} = {new_value}')
+    # Nur Tupel, die den gesuchten Wert in mindestens einem Attribut enthalten, werden umgeschrieben.
+    condition = ' OR '.join(conditions)
+    if additional_condition:
+        condition = f'({condition}) AND {additional_condition}'
+    return f'UPDATE {table_name} SET {", ".join(assignments)} WHERE {condition}'
+
+def build_replacement_expression(db_dialect:str, column_name:str, data_type_group:str, index:int):
+    """Aufbau des Ausdrucks für den neuen Wert eines Attributs beim Ersetzen
+    
+    db_dialect: Name des SQL-Dialekts der betroffenen Tabelle
+    
+    column_name: bereits für den Dialekt angepasster Attributname
+    
+    data_type_group: Datentypgruppe des Attributs
+    
+    index: Position des Attributs in der Liste der betroffenen Attribute (für den Platzhalter :new_value_<Index>)
+    
+    Ausgabe des Ausdrucks als String."""
+    # Im Fall nicht textbasierter Datentypen wird der neue Wert als vollständiger Ersatz für den alten eingetragen, ...
+    if data_type_group != 'text':
+        return f':new_value_{str(index)}'
+    # ... im Fall textbasierter Datentypen wird eine Ersetzung des gesuchten (Teil-)Strings mit regexp_replace vorgenommen. Das Flag 'g' wird
+    # in PostgreSQL ergänzt, damit wie in MariaDB alle Vorkommen ersetzt werden.
+    postgres_flag = ", 'g'" if db_dialect == 'postgresql' else ''
+    return f'regexp_replace({column_name}, :old_value, :new_value{postgres_flag})'
+
+def build_replace_match_condition(db_dialect:str, column_name:str, data_type_group:str):
+    """Aufbau der Bedingung, ob ein Attribut den zu ersetzenden Wert (Platzhalter :search_value) unter Berücksichtigung von Groß- und 
+    Kleinschreibung enthält, wie es auch regexp_replace voraussetzt. Dieselbe Bedingung wählt die Tupel der Vorschau (build_replacement_preview_query) 
+    und der UPDATE-Anweisung (build_replace_all_query) aus.
+    
+    db_dialect: Name des SQL-Dialekts der betroffenen Tabelle
+    
+    column_name: bereits für den Dialekt angepasster Attributname
+    
+    data_type_group: Datentypgruppe des Attributs; nicht textbasierte Attribute werden für den Vergleich konvertiert
+    
+    Ausgabe der Bedingung als String."""
+    # In MariaDB erfolgt der Vergleich binär, da LIKE sonst je nach Kollation Groß- und Kleinschreibung ignoriert.
+    if db_dialect == 'mariadb':
+        value = column_name if data_type_group == 'text' else f'CAST({column_name} AS CHAR)'
+        return f"BINARY {value} LIKE CONCAT('%', CONCAT(:search_value, '%'))"
+    value = column_name if data_type_group == 'text' else f'CAST({column_name} AS TEXT)'
+    return f"{value} LIKE '%' || :search_value || '%'"
+
+def build_replacement_preview_query(table_meta_data:TableMetaData, affected_attributes:list[str], partition_bounds:tuple = None):
+    """Aufbau des Abfragetextes für die Vorschau der Ersetzung, der nur die betroffenen Tupel mit ihrer Zeilennummer (bezogen auf die nach den 
+    Primärschlüsselattributen geordnete Tabelle), den alten Werten aller Attribute sowie je betroffenem Attribut einer Markierung (1, wenn es den 
+    zu ersetzenden Wert enthält, sonst 0) und dem neuen Wert (bzw. NULL) ausgibt. Bedingung und neuer Wert entsprechen denen der UPDATE-Anweisung 
+    aus build_replace_all_query (binärer Vergleich in MariaDB, LIKE in PostgreSQL).
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    affected_attributes: Liste der Attribute, die von der Ersetzung betroffen sein können
+
+    partition_bounds: optionales Tupel zweier Boolean-Werte, ob eine untere und eine obere Grenze des Primärschlüsselbereichs vorhanden ist; 
+    wenn angegeben, werden nur die Tupel des Bereichs nummeriert (siehe execute_partitioned_query)
+    
+    Ausgabe der Abfrage als String mit dem Platzhalter :search_value für den Vergleich per (I)LIKE sowie den Platzhaltern aus 
+    build_replace_all_parameters für die neuen Werte."""
+    db_dialect = table_meta_data.engine.dialect.name
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+    key_for_ordering = ', '.join([convert_string_if_contains_capitals_or_spaces(key, db_dialect) for key in table_meta_data.primary_keys])
+    # Alle Attribute werden explizit aufgelistet, da MariaDB hinter ROW_NUMBER() das Alias '*' nicht zulässt.
+    columns_to_select = ', '.join([convert_string_if_contains_capitals_or_spaces(key, db_dialect) for key in table_meta_data.data_type_info.keys()])
+    range_condition = ''
+    if partition_bounds is not None:
+        range_condition = f' WHERE {build_primary_key_range_condition(table_meta_data, *partition_bounds)}'
+    conditions = []
+    preview_columns = []
+    for index, attribute in enumerate(affected_attributes):
+        escaped_attribute = convert_string_if_contains_capitals_or_spaces(attribute, db_dialect)
+        data_type_group = table_meta_data.get_data_type_group(escaped_attribute)
+        # Nicht textbasierte Attribute werden für den Vergleich konvertiert und vollständig durch den neuen Wert ersetzt, in textbasierten 
+        # Attributen wird der gesuchte (Teil-)String mit regexp_replace ersetzt, jeweils wie bei build_replace_all_query.
+        condition = build_replace_match_condition(db_dialect, f'sub.{escaped_attribute}', data_type_group)
+        new_value = build_replacement_expression(db_dialect, f'sub.{escaped_attribute}', data_type_group, index)
+        conditions.append(condition)
+        preview_columns.append(f'CASE WHEN {condition} THEN 1 ELSE 0 END AS affected_{str(index)}, CASE WHEN {condition} THEN {new_value} END AS new_value_{str(index)}')
+    # Die Zeilennummern werden vor der Filterung über alle Tupel vergeben; die neuen Werte werden nur für die betroffenen Tupel berechnet.
+    return (f"SELECT sub.*, {', '.join(preview_columns)} FROM (SELECT ROW_NUMBER() OVER (ORDER BY {key_for_ordering}) AS Nr, {columns_to_select} "
+            f"FROM {table_name}{range_condition}) sub WHERE {' OR '.join(conditions)} ORDER BY sub.Nr")
+
+def build_ordered_select_query(table_meta_data:TableMetaData, column_name:str = None):
+    """Aufbau des Abfragetextes für alle Tupel einer Tabelle, sortiert nach dem Primärschlüssel
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    column_name: optionaler Name des einzigen abzufragenden Attributs; ohne Angabe werden alle Attribute abgefragt
+    
+    Ausgabe der Abfrage als String."""
+
+    db_dialect = table_meta_data.engine.dialect.name
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+    primary_keys = ', '.join([convert_string_if_contains_capitals_or_spaces(key, db_dialect) for key in table_meta_data.primary_keys])
+    columns_to_select = convert_string_if_contains_capitals_or_spaces(column_name, db_dialect) if column_name is not None else '*'
+    return f'SELECT {columns_to_select} FROM {table_name} ORDER BY {primary_keys}'
+
+def get_indexes_of_affected_attributes_for_replacing(table_meta_data:TableMetaData, old_value:str, affected_attributes:list = None, partitioned:bool = False):
     """Ermittlung der Tupel und der Attribute, die den zu ersetzenden Wert enthalten.
     
     table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
@@ -325,6 +1396,8 @@ def get_indexes_of_affected_attributes_for_replacing(table_meta_data:TableMetaDa
     
     affected_attributes: Liste der Attribute, die von der Ersetzung betroffen sein können, optional
 
+    partitioned: Boolean-Wert; wenn True, werden die Primärschlüsselbereiche der Tabelle nebenläufig abgefragt (siehe search_string)
+
     Ausgabe eines Dictionarys, das die Nummer der betroffenen Tupel als Schlüssel und eine Liste von Nullen und Einsen als Wert enthält. In Letzterer
     bedeutet jede Eins, dass das Attribut an dieser Position den zu ersetzenden Wert enthält."""
 
@@ -372,30 +1445,39 @@ def get_indexes_of_affected_attributes_for_replacing(table_meta_data:TableMetaDa
             query = f'{query},'
 
     ### Zusammensetzen und Ausführen der Abfrage, die nach Primärschlüsseln geordnet erfolgt ###
+    select_clause = query
     query = f'{query} FROM {table_name} ORDER BY {keys}'
+    # Die Primärschlüsselbereiche werden vor Beginn der Arbeitseinheit ermittelt, da sie innerhalb einer solchen nicht genutzt werden.
+    ranges = get_primary_key_ranges(table_meta_data) if partitioned else None
+    collation = ''
     # In MariaDB muss die Abfrage mit der binären Version der Datenbankkollation ausgeführt werden, damit das Matching unter Berücksichtigung
     # von Groß- und Kleinschreibung erfolgt.
-    if db_dialect == 'mariadb':
-        # Der Zeichensatz der Tabelle wird im Ergebnis der Abfrage SHOW TABLE STATUS an 15. Stelle ausgegeben
-        character_set = str(execute_sql_query(engine, text(f"SHOW TABLE STATUS WHERE name LIKE '{table_name}'")).fetchone()[14])
-        # Da die binäre Version des grundlegenden Zeichensatzes benötigt wird, müssen Zusätze (wie 'mb3' in 'utf8mb3') entfernt werden
-        if 'latin1' in character_set:
-            character_set = 'latin1'
-        elif 'utf8' in character_set:
-            character_set = 'utf8'
-        # Zuletzt wird der Abfrage die Kollation angehängt
-        query = f'{query} COLLATE {character_set}_bin'
-    # Ausführen der Abfrage
-    result = execute_sql_query(engine, text(query), params_dict)
-
-    ### Aufbau des Rückgabe-Dictionarys ###
-    row_ids = dict()
-    for index, row in enumerate(result):
-        # Für alle Ergebniszeilen der Abfrage, die nicht nur Nullen enthalten, ...
-        if sum(row) != 0:
-            # ... wird dem Dictionary ein Eintrag mit der Zeilenummer als Schlüssel (index + 1, da die SQL-Funktion ROW_NUMBER() ab 1 zählt) und
-            # der Ergebniszeile als Wert (konvertiert in eine Liste, damit die Einträge verändert werden können) angehängt.
-            row_ids[index+1] = list(row)
+    # Eine ggf. nötige erneute Abfrage der Zeichensätze und die eigentliche Abfrage nutzen eine gemeinsame Verbindung.
+    with unit_of_work(engine):
+        if db_dialect == 'mariadb':
+            # Der Zeichensatz der Tabelle wird aus dem beim Verbindungsaufbau gefüllten Cache bezogen.
+            character_set = get_table_character_set(engine, table_meta_data.table_name)
+            # Zuletzt wird der Abfrage die Kollation angehängt
+            collation = f' COLLATE {character_set}_bin'
+            query = f'{query}{collation}'
+        # Im partitionierten Modus werden die jeweils nach Primärschlüsseln geordneten Ergebnisse der Bereiche in deren Reihenfolge aneinander-
+        # gehängt, sodass die Zeilennummern wie bei einer einzigen Abfrage gezählt werden.
+        if ranges is not None:
+            _, partitions = execute_partitioned_query(table_meta_data, ranges, lambda has_lower_bound, has_upper_bound: text(
+                f'{select_clause} FROM {table_name} WHERE {build_primary_key_range_condition(table_meta_data, has_lower_bound, has_upper_bound)} ORDER BY {keys}{collation}'), params_dict)
+            result = [row for partition in partitions for row in partition]
+        # Ausführen der Abfrage
+        else:
+            result = execute_sql_query(engine, text(query), params_dict)
+
+        ### Aufbau des Rückgabe-Dictionarys ###
+        row_ids = dict()
+        for index, row in enumerate(result):
+            # Für alle Ergebniszeilen der Abfrage, die nicht nur Nullen enthalten, ...
+            if sum(row) != 0:
+                # ... wird dem Dictionary ein Eintrag mit der Zeilenummer als Schlüssel (index + 1, da die SQL-Funktion ROW_NUMBER() ab 1 zählt) und
+                # der Ergebniszeile als Wert (konvertiert in eine Liste, damit die Einträge verändert werden können) angehängt.
+                row_ids[index+1] = list(row)
     # Ausgabe des Dictionarys
     return row_ids
 
@@ -414,87 +1496,78 @@ def replace_some_string_occurrences(table_meta_data:TableMetaData, occurrences_d
     replacement_string: neu einzutragender Wert als String
     
     commit: Flag für das Schreiben der Änderung in die Datenbank. Das Ergebnis der Anweisung wird nur gespeichert, wenn dieser Parameter True ist.
+
+    Die Vorkommen werden je Attribut blockweise in einer gemeinsamen Transaktion geändert, jeder Block in einem eigenen Savepoint; nur bei 
+    Fehlern in einem Block wird dieser vollständig zurückgesetzt und werden dessen Tupel einzeln (ebenfalls je in einem Savepoint) geändert. 
+    Als erfolgreich gelten die Vorkommen, deren Tupel laut rowcount geändert wurden.
     
     Ausgabe einer Meldung über den (Miss-)Erfolg der Operation, die in der App angezeigt werden kann. Bei Fehlern sind hierin die 
     Primärschlüsselwerte der von den Fehlern betroffenen Tupeln angegeben."""
 
-    ### Vorbereiten der Variablen für die Datenbankabfrage, ggf. mit Escaping ###
+    ### Vorbereiten der Variablen für die Datenbankabfrage ###
     engine = table_meta_data.engine
     db_dialect = engine.dialect.name
-    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
-    string_to_replace = escape_string(db_dialect, string_to_replace)
-    replacement_string = escape_string(db_dialect, replacement_string)
 
     # Beziehen der Primärschlüssel aus dem Vorkommens-Dictionary
     primary_key_attributes = occurrences_dict[0]['primary_keys']
     # Entfernen der Primärschlüssel aus dem Dictionary
     occurrences_dict.pop(0)
 
-    ### Ausführung der Änderung in einer eigenen Abfrage für jedes Vorkommen ###
+    ### Gruppierung der Primärschlüsselwerte der Vorkommen nach dem betroffenen Attribut ###
+    occurrences_by_attribute = {}
+    for row in occurrences_dict.values():
+        occurrences_by_attribute.setdefault(row['affected_attribute'], []).append(row['primary_key'])
+
+    ### Mengenbasierte Ausführung der Änderung ###
     # Zähler für die erfolgreichen Änderungen
     success_counter = 0
     # Liste der Primärschlüsselwerte der Vorkommen, die nicht geändert werden konnten
     failed_updates = []
-    for row in occurrences_dict.values():
-        ## Aufbau der Abfrage ##
-        query = f'UPDATE {table_name} SET'
-        update_params = {}
-        # Primärschlüsselwerte des Tupels mit dem aktuell betrachteten Vorkommen des gesuchten Wertes
-        primary_key_value = row['primary_key']
-        # Name des Attributs, in dem das aktuelle Vorkommen enthalten ist und ... 
-        affected_attribute = convert_string_if_contains_capitals_or_spaces(row['affected_attribute'], db_dialect)
-        # ... dessen Datentypgruppe
-        data_type_group = table_meta_data.get_data_type_group(affected_attribute)
-        # Bei nicht textbasierten Datentypen wird der gesuchte Wert vollständig durch den neuen Wert ersetzt
-        if data_type_group != 'text':
-            query = f"{query} {affected_attribute} = :new_value"
-            ## Der in das Parameter-Dictionary eingefügte Wert wird für Zahlen und Boolean-Werte in den dem Attributdatentyp entsprechenden 
-            # Python-Datentyp konvertiert ...
-            if data_type_group == 'integer':
-                update_params[f'new_value'] = int(replacement_string)
-            elif data_type_group == 'decimal':
-                update_params[f'new_value'] = float(replacement_string)
-            elif data_type_group == 'boolean':
-                update_params[f'new_value'] = bool(replacement_string)
-            # ... und für alle anderen nicht textbasierten Datentypen unverändert übernommen.
-            else:
-                update_params[f'new_value'] = replacement_string
-        else:
-            ## Ergänzung von Flags, damit das Matching mittels regulärer Ausdrücke in MariaDB und PostgreSQL gleich erfolgt ##
-            postgres_flag = ''
-            old_value = string_to_replace
-            # In PostgreSQL muss das Flag 'g' als vierter Parameter in regexp_replace eingesetzt werden, damit wie in MariaDB alle Vorkommen des 
-            # gesuchten Wertes ersetzt werden, nicht nur das erste.
-            if db_dialect == 'postgresql':
-                postgres_flag = ", 'g'"
-            # In MariaDB muss dem alten Wert das Flag '(?-i)' vorangestellt werden, damit das Matching unabhängig von der Tabellenkollation unter
-            # Berücksichtigung von Groß- und Kleinschreibung erfolgt.
-            elif db_dialect == 'mariadb':
-                old_value = f'(?-i){string_to_replace}'
-            
-            # Aufbau der Abfrage
-            query = f"{query} {affected_attribute} = regexp_replace({affected_attribute}, :old_value, :replacement_string{postgres_flag})"
-            ## Eintragen der alten und der neuen Werte in das Parameter-Dictionary ##
-            update_params['old_value'] = old_value
-            update_params['replacement_string'] = replacement_string
-        
-        ### Aufbau der Bedingung zur eindeutigen Identifizierung der zu ersetzenden Vorkommen anhand ihrer Primärschlüsselwerte ###
-        for index, key in enumerate(primary_key_attributes):
-            # Einfügen der Primärschlüsselwerte in das Parameter-Dictionary
-            update_params[key] = primary_key_value[index]
-        # Erstellen der Bedingung
-        condition = build_sql_condition(tuple(primary_key_attributes), db_dialect, 'AND')
-
-        ### Zusammenfügen und Ausführen der UPDATE-Anweisung ###
-        query = text(f'{query} {condition}')
-        try:
-            execute_sql_query(engine, query, update_params, raise_exceptions = True, commit = commit)
-        # Bei Fehlern werden die Primärschlüsselwerte des aktuellen Vorkommens in die Liste der fehlgeschlagenen Änderungen aufgenommen.
-        except Exception:
-            failed_updates.append(primary_key_value)
-        # Anderenfalls konnte die Änderung erfolgreich durchgeführt werden.
-        else:
-            success_counter += 1
+    # Alle Änderungen erfolgen über eine gemeinsame Verbindung in einer Transaktion. In beiden Dialekten wird jeder Block in einem eigenen 
+    # Savepoint ausgeführt: In PostgreSQL verhindert ein Fehler so nicht die übrigen Änderungen, in MariaDB werden so auch die bereits 
+    # ausgeführten Einzelanweisungen eines per executemany geänderten Blocks zurückgesetzt, bevor dessen Tupel einzeln erneut geändert werden.
+    with unit_of_work(engine, commit) as connection:
+        for affected_attribute, primary_key_values in occurrences_by_attribute.items():
+            update_params = build_replace_all_parameters(table_meta_data, [affected_attribute], string_to_replace, replacement_string)
+            # Anweisung zur Änderung eines einzelnen Tupels, das über die Primärschlüsselwerte identifiziert wird
+            cache_key = (db_dialect, table_meta_data.table_name, 'replace_some', affected_attribute, table_meta_data.get_data_type_group(affected_attribute), tuple(primary_key_attributes))
+            single_row_query = get_cached_statement(cache_key + (None,), lambda: build_replace_some_query(table_meta_data, affected_attribute, primary_key_attributes))
+            # Die Vorkommen werden in Blöcken von höchstens replace_batch_size Tupeln geändert: bei nur einem Primärschlüsselattribut mit einer 
+            # Anweisung, die alle Primärschlüsselwerte des Blocks als IN-Liste erhält, anderenfalls mit executemany über die Anweisung für einzelne Tupel.
+            for batch_start in range(0, len(primary_key_values), replace_batch_size):
+                batch = primary_key_values[batch_start:batch_start + replace_batch_size]
+                if len(primary_key_attributes) == 1:
+                    query = get_cached_statement(cache_key + (len(batch),), lambda: build_replace_some_query(table_meta_data, affected_attribute, primary_key_attributes, len(batch)))
+                    batch_params = dict(update_params, **{f'key_{index}': value[0] for index, value in enumerate(batch)})
+                else:
+                    query = single_row_query
+                    batch_params = [dict(update_params, **dict(zip(primary_key_attributes, value))) for value in batch]
+                try:
+                    with connection.begin_nested():
+                        result = connection.execute(query, batch_params)
+                # Schlägt der Block fehl, ist er durch den Savepoint vollständig zurückgesetzt; seine Tupel werden einzeln geändert, um die 
+                # fehlerhaften Tupel zu ermitteln.
+                except Exception:
+                    for primary_key_value in batch:
+                        try:
+                            with connection.begin_nested():
+                                result = connection.execute(single_row_query, dict(update_params, **dict(zip(primary_key_attributes, primary_key_value))))
+                        # Bei Fehlern werden die Primärschlüsselwerte des aktuellen Vorkommens in die Liste der fehlgeschlagenen Änderungen aufgenommen, ...
+                        except Exception:
+                            failed_updates.append(primary_key_value)
+                        # ... ebenso, wenn das Tupel (z. B. weil es inzwischen gelöscht wurde) nicht geändert wurde.
+                        else:
+                            if result.rowcount == 0:
+                                failed_updates.append(primary_key_value)
+                            else:
+                                success_counter += 1
+                # Die Anzahl der erfolgreichen Änderungen wird der Anzahl der geänderten Tupel entnommen; nur Treiber, die für executemany keine 
+                # Gesamtzahl melden (rowcount -1), werden mit der Blockgröße gezählt.
+                else:
+                    success_counter += result.rowcount if result.rowcount >= 0 else len(batch)
+    # Nach gespeicherten Änderungen sind zwischengespeicherte Such- und Vorschauergebnisse der Tabelle veraltet.
+    if commit and success_counter > 0:
+        invalidate_result_cache(engine, table_meta_data.table_name)
     ### Wenn der Erfolgszähler nach Abschluss der Schleife der Anzahl der ausgewählten Vorkommen entspricht, waren alle Ersetzungen erfolgreich.
     # Daher wird eine Erfolgsmeldung mit der Gesamtanzahl der Ersetzungen ausgegeben. ###
     if success_counter == len(occurrences_dict):
@@ -512,6 +1585,33 @@ def replace_some_string_occurrences(table_meta_data:TableMetaData, occurrences_d
         return f'{success_counter} von {len(occurrences_dict)} betroffenen Werten {verb} erfolgreich aktualisiert. Fehler sind in den Zeilen mit folgenden Primärschlüsselwerten aufgetreten: {failed_updates}. Bitte sehen Sie sich diese nochmal an.'
     
 
+def build_replace_some_query(table_meta_data:TableMetaData, column_name:str, primary_key_attributes:list[str], key_count:int = None):
+    """Aufbau des Anweisungstextes für das Ersetzen ausgewählter Vorkommen eines Wertes in einem Attribut
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    column_name: Name des betroffenen Attributs
+    
+    primary_key_attributes: Liste der Primärschlüsselattribute der Tabelle
+    
+    key_count: Anzahl der Primärschlüsselwerte, für die je ein Platzhalter (:key_<Index>) in eine IN-Liste eingefügt wird (nur bei einem 
+    Primärschlüsselattribut); ohne Angabe wird ein einzelnes Tupel über Platzhalter mit den Namen der Primärschlüsselattribute identifiziert.
+    
+    Ausgabe der UPDATE-Anweisung als String mit den Platzhaltern aus build_replace_all_parameters."""
+    db_dialect = table_meta_data.engine.dialect.name
+    table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+    # Die Zuweisung des neuen Wertes entspricht der Ersetzung aller Vorkommen; die Tupel werden jedoch über ihre Primärschlüssel ausgewählt.
+    escaped_column_name = convert_string_if_contains_capitals_or_spaces(column_name, db_dialect)
+    new_value = build_replacement_expression(db_dialect, escaped_column_name, table_meta_data.get_data_type_group(escaped_column_name), 0)
+    query = f'UPDATE {table_name} SET {escaped_column_name} = {new_value}'
+    if key_count is None:
+        condition = build_sql_condition(tuple(primary_key_attributes), db_dialect, 'AND')
+    else:
+        key = convert_string_if_contains_capitals_or_spaces(primary_key_attributes[0], db_dialect)
+        condition = f"WHERE {key} IN ({', '.join([f':key_{index}' for index in range(key_count)])})"
+    return f'{query} {condition}'
+    
+
 ### Funktionen für das Vereinheitlichen von Datenbankeinträgen
 
 def get_unique_values_for_attribute(table_meta_data:TableMetaData, attribute_to_search:str):
@@ -608,6 +1708,9 @@ def update_to_unify_entries(table_meta_data:TableMetaData, attribute_to_change:s
     ### Zusammenfügen und Ausführen der Abfrage ###
     query = text(f'{query} {condition}')
     execute_sql_query(engine, query, condition_dict, True, commit)
+    # Nach gespeicherten Änderungen sind zwischengespeicherte Such- und Vorschauergebnisse der Tabelle veraltet.
+    if commit:
+        invalidate_result_cache(engine, table_meta_data.table_name)
 
 
 ### Hilfsfunktionen, die an mehreren Stellen verwendet werden (können) ###
@@ -707,7 +1810,7 @@ def check_data_type_and_constraint_compatibility(table_meta_data:TableMetaData,
         # Ausgabe des Wertes 0, wenn bei der Ausführung keine Fehler aufgetreten sind.
         return 0
 
-def get_row_number_of_affected_entries(table_meta_data:TableMetaData, affected_attributes:list[str], old_values:list[str], mode:str, convert:bool = True):
+def get_row_number_of_affected_entries(table_meta_data:TableMetaData, affected_attributes:list[str], old_values:list[str], mode:str, convert:bool = True, partitioned:bool = False):
     """Erstellen und Ausführen einer SQL-Abfrage zur Ermittlung der Nummer der Zeilen, die von der Vereinheitlichung oder der Ersetzung betroffen sind,
     sowie ihrer aktuellen Werte.
     
@@ -720,8 +1823,12 @@ def get_row_number_of_affected_entries(table_meta_data:TableMetaData, affected_a
     mode: Ersetzungsmodus ('replace' für die Funktion 'Suchen und Ersetzen' oder 'unify' für die Vereinheitlichungsfunktion)
     
     convert: Flag für das Umwandeln des Abfrageergebnisses in eine Liste von Listen. Bei False wird das Ergebnis unverändert als CursorResult ausgegeben.
+
+    partitioned: Boolean-Wert; wenn True, werden die Primärschlüsselbereiche der Tabelle nebenläufig abgefragt (siehe search_string). Die 
+    Zeilennummern werden dabei je Bereich gezählt und um die Anzahl der Tupel in den vorangehenden Bereichen erhöht; bei convert = False wird 
+    das Ergebnis als ColumnarResult ausgegeben.
     
-    Ausgabe des Abfrageergebnisses als Liste von Listen oder als CursorResult; Ausgabe eines ArgumentErrors, wenn ein ungültiger Modus angegeben ist
+    Ausgabe des Abfrageergebnisses als Liste von Listen oder als CursorResult bzw. ColumnarResult; Ausgabe eines ArgumentErrors, wenn ein ungültiger Modus angegeben ist
     oder für das Vereinheitlichen nicht genau ein Attribut oder für das Ersetzen nicht genau ein Wert angegeben ist."""
 
     ### Überprüfung der Form der übergebenen Argumente ###
@@ -732,10 +1839,138 @@ def get_row_number_of_affected_entries(table_meta_data:TableMetaData, affected_a
     elif mode == 'replace' and len(old_values) != 1:
         raise ArgumentError(None, 'Im Modus \'replace\' kann nur ein Wert ersetzt werden.')
     
-    ##### Erstellen der SQL-Anweisung #####
-    ### Beziehen und Vorbereiten der Variablen (Versehen mit Trennzeichen) für die Abfrage ###
+    ### Beziehen der benötigten Variablen ###
     engine = table_meta_data.engine
     db_dialect = engine.dialect.name
+    character_set = None
+    # In MariaDB muss die Abfrage mit der binären Version der Datenbankkollation ausgeführt werden, damit das Matching unter Berücksichtigung
+    # von Groß- und Kleinschreibung erfolgt.
+    if db_dialect == 'mariadb':
+        # Der Zeichensatz der Tabelle wird aus dem beim Verbindungsaufbau gefüllten Cache bezogen.
+        character_set = get_table_character_set(engine, table_meta_data.table_name)
+
+    ### Beziehen der Abfrage aus dem Anweisungs-Cache ###
+    # Der Abfragetext hängt neben Dialekt, Tabelle und Modus von den betroffenen Attributen und ihren Datentypgruppen, den Primärschlüssel-
+    # attributen, (in MariaDB) allen Attributen der Tabelle und dem Zeichensatz sowie der Anzahl der alten Werte ab.
+    affected_attributes_and_groups = tuple([(attribute, table_meta_data.get_data_type_group(attribute)) for attribute in affected_attributes])
+    cache_key = (db_dialect, table_meta_data.table_name, 'row_numbers', mode, affected_attributes_and_groups, len(old_values), tuple(table_meta_data.primary_keys), 
+                 tuple(table_meta_data.data_type_info.keys()), character_set)
+    query = get_cached_statement(cache_key, lambda: build_row_number_query(table_meta_data, affected_attributes, len(old_values), mode, character_set))
+
+    ### Aufbau des Parameter-Dictionarys ###
+    condition_params = build_row_number_parameters(table_meta_data, affected_attributes, old_values, mode)
+
+    ### Nebenläufige Abfrage der Primärschlüsselbereiche im partitionierten Modus ###
+    ranges = get_primary_key_ranges(table_meta_data) if partitioned else None
+    if ranges is not None:
+        table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
+        # Anzahl der Tupel je Bereich für die Fortsetzung der Zeilennummern über die Bereichsgrenzen hinweg
+        _, partition_sizes = execute_partitioned_query(table_meta_data, ranges, lambda has_lower_bound, has_upper_bound: get_cached_statement(
+            (db_dialect, table_meta_data.table_name, 'partition_size', has_lower_bound, has_upper_bound), 
+            lambda: f'SELECT COUNT(*) FROM {table_name} WHERE {build_primary_key_range_condition(table_meta_data, has_lower_bound, has_upper_bound)}'))
+        column_names, partitions = execute_partitioned_query(table_meta_data, ranges, lambda has_lower_bound, has_upper_bound: get_cached_statement(
+            cache_key + ((has_lower_bound, has_upper_bound),), 
+            lambda: build_row_number_query(table_meta_data, affected_attributes, len(old_values), mode, character_set, (has_lower_bound, has_upper_bound))), condition_params)
+        rows = []
+        row_number_offset = 0
+        for partition_size, partition in zip(partition_sizes, partitions):
+            for row in partition:
+                row[0] += row_number_offset
+                rows.append(row)
+            row_number_offset += partition_size[0][0]
+        if convert:
+            return rows
+        else:
+            return ColumnarResult.from_rows(column_names, rows)
+    # Ausführen der Abfrage
+    result = execute_sql_query(engine, query, condition_params, raise_exceptions=True)
+    # Ausgabe des in eine Liste von Listen umgewandelten Ergebnisses ...
+    if convert:
+        return convert_result_to_list_of_lists(result)
+    # ... oder des Ergebnisses als CursorResult.
+    else:
+        return result
+
+def stream_unify_preview(table_meta_data:TableMetaData, column_name:str, old_values:list[str], new_value:str|None, batch_size:int = None):
+    """Blockweise Ausgabe der Vorschau für das Vereinheitlichen für den Export, ohne dass die Tabelle vollständig im Speicher gehalten wird
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    column_name: Name des zu vereinheitlichenden Attributs
+    
+    old_values: Liste der bestehenden Werte (als Strings), die vereinheitlicht werden sollen
+    
+    new_value: einzutragender Wert (None für NULL)
+
+    batch_size: optionale Anzahl der Tupel je Block (siehe stream_sql_query)
+    
+    Ausgabe eines Tupels aus der Liste der Attributnamen (Zeilennummer, alle Attribute der Tabelle und '<Name> (neu)') und einem Generator, der 
+    die betroffenen Tupel nach Primärschlüsseln geordnet in Blöcken als Listen von Listen liefert."""
+    engine = table_meta_data.engine
+    db_dialect = engine.dialect.name
+    character_set = get_table_character_set(engine, table_meta_data.table_name) if db_dialect == 'mariadb' else None
+    # Die Abfrage entspricht der von get_row_number_of_affected_entries, wird jedoch zusätzlich nach der Zeilennummer geordnet.
+    cache_key = (db_dialect, table_meta_data.table_name, 'row_numbers_ordered', (column_name, table_meta_data.get_data_type_group(column_name)), len(old_values), 
+                 tuple(table_meta_data.primary_keys), tuple(table_meta_data.data_type_info.keys()), character_set)
+    query = get_cached_statement(cache_key, lambda: f"{build_row_number_query(table_meta_data, [column_name], len(old_values), 'unify', character_set)} ORDER BY sub.Nr")
+    params = build_row_number_parameters(table_meta_data, [column_name], old_values, 'unify')
+    column_names = ['Nr'] + list(table_meta_data.data_type_info.keys()) + [f'{column_name} (neu)']
+    batches = ([row + [new_value] for row in batch] for batch in stream_sql_query(engine, query, params, batch_size))
+    return column_names, batches
+
+def build_row_number_parameters(table_meta_data:TableMetaData, affected_attributes:list[str], old_values:list[str], mode:str):
+    """Aufbau des Parameter-Dictionarys für die Abfrage aus build_row_number_query
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    affected_attributes: Liste der zu betrachtenden Attribute der betroffenen Tabelle
+    
+    old_values: Liste der bestehenden Werte (als Strings), die ersetzt oder vereinheitlicht werden sollen
+    
+    mode: Ersetzungsmodus ('replace' oder 'unify')
+    
+    Ausgabe des Dictionarys mit dem Eintrag 'old_value' im Modus 'replace' bzw. den Einträgen 'value_<Index>' im Modus 'unify'."""
+    condition_params = {}
+    ## Bei der Ersetzung wird nur ein Wert verändert, sodass die Liste old_values nur einen Eintrag enthält. ##
+    if mode == 'replace':
+        condition_params['old_value'] = old_values[0]
+    ## Bei der Vereinheitlichung werden alle alten Werte eingetragen. ##
+    else:
+        data_type_group = table_meta_data.get_data_type_group(affected_attributes[0])
+        for index, value in enumerate(old_values):
+            ## Ist das betroffene Attribut eine Zahl oder ein Boolean-Wert, wird der Wert in den entsprechenden Python-Datentyp konvertiert. 
+            # Hierdurch wird erreicht, dass SQLAlchemy Strings mit Anführungszeichen versieht, Zahlen jedoch nicht. ##
+            if data_type_group == 'integer':
+                condition_params['value_' + str(index)] = int(value)
+            elif data_type_group == 'decimal':
+                condition_params['value_' + str(index)] = float(value)
+            elif data_type_group == 'boolean':
+                condition_params['value_' + str(index)] = bool(value)
+            # Für alle anderen Datentypgruppen wird der alte Wert unbearbeitet eingefügt.
+            else:
+                condition_params['value_' + str(index)] = value
+    return condition_params
+
+def build_row_number_query(table_meta_data:TableMetaData, affected_attributes:list[str], value_count:int, mode:str, character_set:str = None, partition_bounds:tuple = None):
+    """Aufbau des Abfragetextes zur Ermittlung der Nummer der Zeilen, die von der Vereinheitlichung oder der Ersetzung betroffen sind
+    
+    table_meta_data: TableMetaData-Objekt der betroffenen Tabelle
+    
+    affected_attributes: Liste der zu betrachtenden Attribute der betroffenen Tabelle
+    
+    value_count: Anzahl der alten Werte, für die im Modus 'unify' je ein Platzhalter (:value_<Index>) eingefügt wird
+    
+    mode: Ersetzungsmodus ('replace' oder 'unify')
+    
+    character_set: grundlegender Zeichensatz der Tabelle ('latin1' oder 'utf8'), der in MariaDB für die binäre Kollation benötigt wird
+
+    partition_bounds: optionales Tupel zweier Boolean-Werte, ob eine untere und eine obere Grenze des Primärschlüsselbereichs vorhanden ist; 
+    wenn angegeben, werden nur die Tupel des Bereichs nummeriert (siehe execute_partitioned_query)
+    
+    Ausgabe der Abfrage als String."""
+
+    ### Beziehen und Vorbereiten der Variablen (Versehen mit Trennzeichen) für die Abfrage ###
+    db_dialect = table_meta_data.engine.dialect.name
     table_name = convert_string_if_contains_capitals_or_spaces(table_meta_data.table_name, db_dialect)
     cols_and_dtypes = table_meta_data.data_type_info
     primary_keys = table_meta_data.primary_keys
@@ -753,20 +1988,18 @@ def get_row_number_of_affected_entries(table_meta_data:TableMetaData, affected_a
             else:
                 columns_to_select = f'{columns_to_select}, {convert_string_if_contains_capitals_or_spaces(key, db_dialect)}'
     
+    # Im partitionierten Modus werden nur die Tupel des jeweiligen Primärschlüsselbereichs nummeriert.
+    range_condition = ''
+    if partition_bounds is not None:
+        range_condition = f' WHERE {build_primary_key_range_condition(table_meta_data, *partition_bounds)}'
     # Die Abfrage beginnt für beide Modi und beide Dialekte gleich.
-    query = f"SELECT * FROM (SELECT ROW_NUMBER() OVER (ORDER BY {key_for_ordering}) AS Nr, {columns_to_select} FROM {table_name}) sub"
+    query = f"SELECT * FROM (SELECT ROW_NUMBER() OVER (ORDER BY {key_for_ordering}) AS Nr, {columns_to_select} FROM {table_name}{range_condition}) sub"
 
     ### Aufbau der Abfragebedingung ###
     condition = 'WHERE'
-    # Parameter-Dictionary für die Abfrage
-    condition_params = {}
 
     ## Abfragebedingung für die Ersetzung ## 
     if mode == 'replace':
-        ## In diesem Fall wird nur ein Wert verändert, sodass die Liste old_values nur einen Eintrag enthält, der in das Parameter-Dictionary
-        # eingetragen wird. ##
-        old_value = old_values[0]
-        condition_params['old_value'] = old_value
         # Die Ersetzung beruht auf einer Suche mithilfe regulärer Ausdrücke, sodass der zu suchende Wert dialektspezifisch als Parameterplatzhalter
         # in die Abfrage eingebunden werden muss. 
         concat_string = get_concatenated_string_for_matching(db_dialect, 'old_value')
@@ -791,21 +2024,8 @@ def get_row_number_of_affected_entries(table_meta_data:TableMetaData, affected_a
     elif mode == 'unify':
         # In diesem Fall enthält die Liste der betroffenen Attribute nur einen Eintrag.
         affected_attribute = affected_attributes[0]
-        # Datentypgruppe zur Überprüfung, ob Typkonversionen nötig sind
-        data_type_group = table_meta_data.get_data_type_group(affected_attribute)
-        ## Einfügen der zu vereinheitlichenden alten Werte in das Parameter-Dictionary ##
-        for index, value in enumerate(old_values):
-            ## Ist das betroffene Attribut eine Zahl oder ein Boolean-Wert, wird der Wert in den entsprechenden Python-Datentyp konvertiert. 
-            # Hierdurch wird erreicht, dass SQLAlchemy Strings mit Anführungszeichen versieht, Zahlen jedoch nicht. ##
-            if data_type_group == 'integer':
-                condition_params['value_' + str(index)] = int(value)
-            elif data_type_group == 'decimal':
-                condition_params['value_' + str(index)] = float(value)
-            elif data_type_group == 'boolean':
-                condition_params['value_' + str(index)] = bool(value)
-            # Für alle anderen Datentypgruppen wird der alte Wert unbearbeitet eingefügt.
-            else:
-                condition_params['value_' + str(index)] = value
+        ## Einfügen eines Platzhalters je zu vereinheitlichendem alten Wert ##
+        for index in range(value_count):
             # Die Bedingung für das erste Attribut wird unmittelbar an die bestehende Bedingung angehängt.
             if index == 0:
                 condition = f"{condition} sub.{convert_string_if_contains_capitals_or_spaces(affected_attribute, db_dialect)} = :{'value_' + str(index)}"
@@ -817,23 +2037,8 @@ def get_row_number_of_affected_entries(table_meta_data:TableMetaData, affected_a
     # In MariaDB muss die Abfrage mit der binären Version der Datenbankkollation ausgeführt werden, damit das Matching unter Berücksichtigung
     # von Groß- und Kleinschreibung erfolgt.
     if db_dialect == 'mariadb':
-        # Der Zeichensatz der Tabelle wird im Ergebnis der Abfrage SHOW TABLE STATUS an 15. Stelle ausgegeben
-        character_set = str(execute_sql_query(engine, text(f"SHOW TABLE STATUS WHERE name LIKE '{table_name}'")).fetchone()[14])
-        # Da die binäre Version des grundlegenden Zeichensatzes benötigt wird, müssen Zusätze (wie 'mb3' in 'utf8mb3') entfernt werden
-        if 'latin1' in character_set:
-            character_set = 'latin1'
-        elif 'utf8' in character_set:
-            character_set = 'utf8'
-        # Zuletzt wird der Abfrage die Kollation angehängt
         query = f'{query} COLLATE {character_set}_bin'
-    # Ausführen der Abfrage
-    result = execute_sql_query(engine, text(query), condition_params, raise_exceptions=True)
-    # Ausgabe des in eine Liste von Listen umgewandelten Ergebnisses ...
-    if convert:
-        return convert_result_to_list_of_lists(result)
-    # ... oder des Ergebnisses als CursorResult.
-    else:
-        return result
+    return query
 
 def set_matching_operator_and_cast_data_type(db_dialect:str):
     """Festlegung des Operators und des Datentyps für die Typkonversion bei der Suche mittels regulärer Ausdrücke.
@@ -872,6 +2077,21 @@ def get_concatenated_string_for_matching(db_dialect:str, search_parameter_name:s
     else:
         return f"'%' || :{search_parameter_name} || '%'"
     
+def get_prefix_string_for_matching(db_dialect:str, search_parameter_name:str):
+    """Aufbau des Musters für die Suche nach Strings, die mit dem Suchstring beginnen
+
+    db_dialect: Name des SQL-Dialekts ('mariadb' oder 'postgresql')
+
+    search_parameter_name: Name des Platzhalters für den Suchstring
+
+    Ausgabe des Musters als String; Ausgabe eines DialectErrors bei nicht unterstützten SQL-Dialekten."""
+    if db_dialect == 'postgresql':
+        return f":{search_parameter_name} || '%'"
+    elif db_dialect == 'mariadb':
+        return f"CONCAT(:{search_parameter_name}, '%')"
+    else:
+        raise DialectError(f'Der SQL-Dialekt {db_dialect} wird nicht unterstützt.')
+
 def escape_string(db_dialect:str, string:str):
     """Escaping von Zeichen, die in regulären Ausdrücken in SQL eine besondere Funktion haben
     
@@ -6,10 +6,11 @@ from dateutil import parser
 from sqlalchemy import bindparam, text
 from ControllerClasses import TableMetaData
 from model.CompatibilityClasses import MariaToPostgresCompatibility, PostgresToMariaCompatibility
-from model.databaseModel import convert_result_to_list_of_lists, execute_sql_query, convert_string_if_contains_capitals_or_spaces
+from model.ResultClasses import ColumnarResult
+from model.databaseModel import convert_result_to_columnar, convert_result_to_list_of_lists, execute_sql_query, convert_string_if_contains_capitals_or_spaces, ensure_exact_row_count, invalidate_meta_data_cache, stream_sql_query, unit_of_work
 from model.SQLDatabaseError import DialectError, MergeError
 
-def join_tables_of_same_dialect_on_same_server(table_meta_data:list[TableMetaData], attributes_to_join_on:list[str], attributes_to_select_1:list[str], attributes_to_select_2:list[str], cast_direction:int = 0, full_outer_join:bool = False, add_table_names_to_column_names:bool = True, return_cast_direction:bool = False):
+def join_tables_of_same_dialect_on_same_server(table_meta_data:list[TableMetaData], attributes_to_join_on:list[str], attributes_to_select_1:list[str], attributes_to_select_2:list[str], cast_direction:int = 0, full_outer_join:bool = False, add_table_names_to_column_names:bool = True, return_cast_direction:bool = False, columnar:bool = False):
     """Erstellung eines Inner oder Outer Joins zweier Tabellen, die in derselben Datenbank (MariaDB und PostgreSQL) oder auf demselben Server 
     liegen (MariaDB).
     
@@ -32,7 +33,9 @@ def join_tables_of_same_dialect_on_same_server(table_meta_data:list[TableMetaDat
     return_cast_direction: Boolean-Wert für die Auswahl, ob die Konversionsrichtung mit ausgegeben werden soll; standardmäßig False, anwählbar für
     die Attributsübertragung
 
-    Ausgabe des Join-Results als Liste von Listen, der Attributnamen für die Anzeige als Liste, einer Liste mit der Anzahl von Tupeln ohne Übereinstimmung
+    columnar: Boolean-Wert; wenn True, wird das Join-Result als spaltenorientiertes ColumnarResult statt als Liste von Listen ausgegeben
+
+    Ausgabe des Join-Results als Liste von Listen (bzw. ColumnarResult), der Attributnamen für die Anzeige als Liste, einer Liste mit der Anzahl von Tupeln ohne Übereinstimmung
     in der anderen Tabelle und ggf. der Konversionsrichtung; Ausgabe von MergeErrors, DialectErrors, TypeErrors oder ArgumentErrors bei ungeeigneten Argumenten."""
     
     engine_1 = table_meta_data[0].engine
@@ -151,8 +154,11 @@ def join_tables_of_same_dialect_on_same_server(table_meta_data:list[TableMetaDat
     else:
         # Wenn ein Inner Join gewünscht ist, kann für MariaDB und PostgreSQL dieselbe Anfrage verwendet werden.
         join_query = f'{join_query} FROM {table_1} INNER JOIN {table_2} ON {join_attribute_1} = {join_attribute_2}'
-    # Ausführen des Joins
-    joined_table_result = convert_result_to_list_of_lists(execute_sql_query(engine_1, text(join_query), raise_exceptions = True))
+    # Ausführen des Joins und Umwandlung des Ergebnisses in ein ColumnarResult oder eine Liste von Listen
+    if columnar:
+        joined_table_result = convert_result_to_columnar(execute_sql_query(engine_1, text(join_query), raise_exceptions = True))
+    else:
+        joined_table_result = convert_result_to_list_of_lists(execute_sql_query(engine_1, text(join_query), raise_exceptions = True))
 
     ### Ermittlung der Attributnamen für die Anzeige ###
     # Für die Vergleichsfunktion ist es sinnvoll, den Spaltennamen die Tabellennamen voranzustellen, um sie bei gleichen Namen richtig zuordnen zu können.
@@ -186,7 +192,7 @@ def join_tables_of_same_dialect_on_same_server(table_meta_data:list[TableMetaDat
         # Anderenfalls gebe nur die Ergebnistabelle, die Spaltennamen und die Liste der Zähler mit nicht zugeordneten Tupeln beider Tabellen zurück.
         return joined_table_result, column_names_for_display, no_of_unmatched_rows
     
-def join_tables_of_different_dialects_dbs_or_servers(table_meta_data:list[TableMetaData], attributes_to_join_on:list[str], attributes_to_select_1:list[str], attributes_to_select_2:list[str], cast_direction:int = None, full_outer_join:bool = False, add_table_names_to_column_names:bool = True):
+def join_tables_of_different_dialects_dbs_or_servers(table_meta_data:list[TableMetaData], attributes_to_join_on:list[str], attributes_to_select_1:list[str], attributes_to_select_2:list[str], cast_direction:int = None, full_outer_join:bool = False, add_table_names_to_column_names:bool = True, columnar:bool = False):
     """Erstellung eines Inner oder Outer Joins zweier Tabellen, die in verschiedenen Datenbanken (PostgreSQL) oder auf verschiedenen Servern liegen 
     (MariaDB und PostgreSQL) oder verschiedene SQL-Dialekte aufweisen (Python-basierter Join). 
     
@@ -209,7 +215,9 @@ def join_tables_of_different_dialects_dbs_or_servers(table_meta_data:list[TableM
     return_cast_direction: Boolean-Wert für die Auswahl, ob die Konversionsrichtung mit ausgegeben werden soll; standardmäßig False, anwählbar für
     die Attributsübertragung
 
-    Ausgabe des Join-Results als Liste von Listen, der Attributnamen für die Anzeige als Liste, einer Liste mit der Anzahl von Tupeln ohne Übereinstimmung
+    columnar: Boolean-Wert; wenn True, wird das Join-Result als spaltenorientiertes ColumnarResult statt als Liste von Listen ausgegeben
+
+    Ausgabe des Join-Results als Liste von Listen (bzw. ColumnarResult), der Attributnamen für die Anzeige als Liste, einer Liste mit der Anzahl von Tupeln ohne Übereinstimmung
     in der anderen Tabelle und ggf. der Konversionsrichtung; Ausgabe von MergeErrors, DialectErrors, TypeErrors oder ArgumentErrors bei ungeeigneten Argumenten."""
     
     # Überprüfung der Eignung der Argumente
@@ -255,12 +263,20 @@ def join_tables_of_different_dialects_dbs_or_servers(table_meta_data:list[TableM
         # Erstellen der Datenbankabfrage ...
         query = f'SELECT {selection} FROM {convert_string_if_contains_capitals_or_spaces(tables[index], engine.dialect.name)}'
         # ... und Ausführung mit Ausgabe von Fehlermeldungen, die auf dem Server abgefangen werden.
-        result = execute_sql_query(engine, text(query), raise_exceptions = True)
-        # Kopieren der Spaltennamen des Abfrageergebnisses als Liste ...
-        result_columns.append(list(result.keys()))
-        # ... und Eintragen des Abfrageergebnisses als Liste von Listen in das Dictionary results ein, damit mehrfach über die Ergebniszeilen iteriert
-        # werden kann.
-        results.append(convert_result_to_list_of_lists(result))
+        # Über die erste Tabelle wird nur einmal iteriert, sodass sie blockweise über einen serverseitigen Cursor gelesen werden kann.
+        if index == 0:
+            batches = stream_sql_query(engine, text(query), with_column_names = True)
+            # Der Generator liefert zuerst die Spaltennamen, ...
+            result_columns.append(next(batches))
+            # ... danach die Tupel in Blöcken.
+            results.append(batches)
+        else:
+            result = execute_sql_query(engine, text(query), raise_exceptions = True)
+            # Kopieren der Spaltennamen des Abfrageergebnisses als Liste ...
+            result_columns.append(list(result.keys()))
+            # ... und Eintragen des Abfrageergebnisses als Liste von Listen in das Dictionary results ein, damit mehrfach über die Ergebniszeilen iteriert
+            # werden kann.
+            results.append(convert_result_to_list_of_lists(result))
 
     # Auslesen der Datentypgruppen der Join-Attribute ...
     data_type_group_1 = table_meta_data_1.get_data_type_group(attributes_to_join_on[0])
@@ -268,15 +284,15 @@ def join_tables_of_different_dialects_dbs_or_servers(table_meta_data:list[TableM
     # ... und ihrer Position in der Liste der Spaltennamen des Abfrageergebnisses
     join_attribute_index_1 = result_columns[0].index(attributes_to_join_on[0])
     join_attribute_index_2 = result_columns[1].index(attributes_to_join_on[1])
-    # Anlegen einer Liste zur Speicherung der verbundenen Tabelle
-    joined_table = []
+    # Anlegen einer Liste bzw. eines spaltenorientierten ColumnarResults zur Speicherung der verbundenen Tabelle
+    joined_table = ColumnarResult() if columnar else []
     # Anlegen einer Liste mit Übereinstimmungszählern für jedes Tupel in Tabelle 2; für die Erstellung eines Full Outer Joins
     match_counter_table_2 = [0] * len(results[1])
     # Anlegen einer Liste mit der Anzahl Tupel ohne Übereinstimmung in der anderen Tabelle; für die Statistik nicht zugeordneter Tupel und zur
     # Einschätzung, ob ein Join eindeutig ist
     no_of_unmatched_rows = [0, 0]
     # Iteriere die Tupel der ersten Tabelle durch ...
-    for row_1_index, row_1 in enumerate(results[0]):
+    for row_1, is_last_row_1 in iterate_rows_of_batches(results[0]):
         # ... und setze ihren Übereinstimmungszähler auf 0.
         match_counter_row_1 = 0
         # Beginne die Überprüfung der Übereinstimmung des aktuellen Tupels der ersten Tabelle mit den einzelnen Tupeln der zweiten Tabelle.
@@ -418,7 +434,7 @@ def join_tables_of_different_dialects_dbs_or_servers(table_meta_data:list[TableM
             else:
                 # ... und es handelt sich um die letzte Iteration dieses Tupels der zweiten Tabelle (d. h. das überprüfte Tupel aus der ersten 
                 # Tabelle ist das letzte dort), während für das aktuelle Tupel der zweiten Tabelle keine Übereinstimmung gefunden wurde, ...
-                if row_1_index == len(results[0]) - 1 and match_counter_table_2[row_2_index] == 0:
+                if is_last_row_1 and match_counter_table_2[row_2_index] == 0:
                     # ... erhöhe den Zähler für nicht zuzuordnende Tupel der zweiten Tabelle um den Wert 1.
                     no_of_unmatched_rows[1] += 1 
                     # War zudem ein Full Outer Join gewünscht, ...
@@ -450,10 +466,31 @@ def join_tables_of_different_dialects_dbs_or_servers(table_meta_data:list[TableM
     # Anderenfalls (für Merge) füge die Spaltennamen nur zu einer Liste zusammen.
     else:
         column_names_for_display = result_columns[0] + result_columns[1]
+    # Ein ColumnarResult erhält die Attributnamen erst hier, da sie zuvor noch angepasst werden.
+    if columnar:
+        joined_table.column_names = column_names_for_display
     # Falls der Parameter für nachfolgende Funktionen (merge_two_tables) gebraucht wird, ...
     # Gebe die Ergebnistabelle, die Spaltennamen und die Liste der Zähler mit nicht zugeordneten Tupeln beider Tabellen zurück.
     return joined_table, column_names_for_display, no_of_unmatched_rows
 
+def iterate_rows_of_batches(batches):
+    """Einzelne Ausgabe der Tupel eines blockweise gelesenen Abfrageergebnisses mit der Angabe, ob es sich um das letzte Tupel handelt
+    
+    batches: Iterable von Listen von Listen (z. B. von stream_sql_query)
+    
+    Ausgabe eines Generators von Tupeln aus der Zeile (als Liste) und einem Boolean-Wert, der für die letzte Zeile True ist."""
+    previous_row = None
+    has_previous_row = False
+    for batch in batches:
+        for row in batch:
+            # Die vorherige Zeile wird erst ausgegeben, wenn feststeht, dass noch eine weitere folgt.
+            if has_previous_row:
+                yield previous_row, False
+            previous_row = row
+            has_previous_row = True
+    if has_previous_row:
+        yield previous_row, True
+
 def force_cast_and_match(data_type_group_1:str, data_type_group_2:str, values_to_match:list, cast_direction:int):
     """Erzwingen der Typkonversion für den Python-basierten Join mit gleichzeitiger Überprüfung der Übereinstimmung
     
@@ -605,7 +642,8 @@ def simulate_merge_and_build_query(target_table_data:TableMetaData, source_table
         # ... wähle die Variante mit dem nicht SQL-basierten Join.
         joined_result, joined_column_names, unmatched_rows = join_tables_of_different_dialects_dbs_or_servers([target_table_data, source_table_data], attributes_to_join_on, target_attributes_to_select, [source_attribute_to_insert], cast_direction, False, add_table_names_to_column_names)
     # Wenn die Summe der Anzahl der Tupel im Ergebnis und der nicht zuzuordnenden Tupel nicht der Gesamtanzahl der Tupel der Zieltabelle entspricht, kann keine eindeutige Zuordnung der neuen Werte erfolgen. 
-    if len(joined_result) + unmatched_rows[0] != target_table_data.total_row_count:
+    # Hierfür wird die exakte Tupelanzahl benötigt, deren Zählung ggf. abgewartet bzw. nachgeholt wird.
+    if len(joined_result) + unmatched_rows[0] != ensure_exact_row_count(target_table_data):
         # Daher wird der Prozess abgebrochen und eine Fehlermeldung ausgegeben.
         raise MergeError('Mindestens einem Tupel der Zieltabelle konnte mehr als ein Tupel aus der Quelltabelle zugeordnet werden. Bitte wählen Sie Join-Attribute mit eindeutigen Werten.')
     
@@ -947,37 +985,42 @@ def execute_merge_and_add_constraints(target_table_meta_data:TableMetaData, sour
     Datenbankoperationen auftreten."""
 
     target_engine = target_table_meta_data.engine
-    ### Ausführung der zuvor bei der Simulation erstellten Anweisung für das Einfügen und Füllen des zu übertragenden Attributes ###
-    ## In MariaDB muss die Anweisung zum Einfügen des neuen Attributs separat ausgeführt werden. ##
-    if target_engine.dialect.name == 'mariadb':
-        # Wenn die übergebene Anweisung also zwei durch Semikolon getrennte Anweisungen enthält, ...
-        if ';' in query:
-            # .. werden diese voneinander getrennt ...
-            separate_queries = query.split(';')
-            # ... und die erste (d. h. das Einfügen des neuen Attributes) wird ausgeführt.
-            try:
-                execute_sql_query(target_engine, text(separate_queries[0]), raise_exceptions = True, commit = True)
-            # Hierbei werden auftretende Fehler ausgegeben.
-            except Exception as error:
-                raise error
-            # Bei Erfolg wird hingegen die Anweisung zum Einfügen der neuen Werte in die Variable query geschrieben, damit sie nachfolgend
-            # wie in PostgreSQL ausgeführt werden kann.
-            else:
-                query = separate_queries[1]
-    # Ausführung der (ggf. zuvor abgetrennten) UPDATE-Anweisung
+    # Da die folgenden Anweisungen das Schema der Zieltabelle verändern (neues Attribut, Constraints), wird ihr Eintrag im Metadaten-Cache
+    # anschließend in jedem Fall - auch bei teilweise fehlgeschlagener Ausführung - entfernt.
     try:
-        execute_sql_query(target_engine, text(query), params = params, raise_exceptions = True, commit = True)
-    # Weitergabe auftretender Fehler
-    except Exception as error:
-        raise error
-    else:
+        ### Ausführung der zuvor bei der Simulation erstellten Anweisung für das Einfügen und Füllen des zu übertragenden Attributes ###
+        ## In MariaDB muss die Anweisung zum Einfügen des neuen Attributs separat ausgeführt werden. ##
+        if target_engine.dialect.name == 'mariadb':
+            # Wenn die übergebene Anweisung also zwei durch Semikolon getrennte Anweisungen enthält, ...
+            if ';' in query:
+                # .. werden diese voneinander getrennt ...
+                separate_queries = query.split(';')
+                # ... und die erste (d. h. das Einfügen des neuen Attributes) wird ausgeführt.
+                try:
+                    execute_sql_query(target_engine, text(separate_queries[0]), raise_exceptions = True, commit = True)
+                # Hierbei werden auftretende Fehler ausgegeben.
+                except Exception as error:
+                    raise error
+                # Bei Erfolg wird hingegen die Anweisung zum Einfügen der neuen Werte in die Variable query geschrieben, damit sie nachfolgend
+                # wie in PostgreSQL ausgeführt werden kann.
+                else:
+                    query = separate_queries[1]
+        # Ausführung der (ggf. zuvor abgetrennten) UPDATE-Anweisung
         try:
-            # Übertragen von UNIQUE- und CHECK-Constraints aus der Quelltabelle, falls vorhanden und möglich
-            # Ausgabe der entsprechenden Meldung zur Anzeige in der App
-            return add_constraints_to_new_attribute(target_table_meta_data, source_table_meta_data, target_attribute_name, source_attribute_name)
+            execute_sql_query(target_engine, text(query), params = params, raise_exceptions = True, commit = True)
         # Weitergabe auftretender Fehler
         except Exception as error:
             raise error
+        else:
+            try:
+                # Übertragen von UNIQUE- und CHECK-Constraints aus der Quelltabelle, falls vorhanden und möglich
+                # Ausgabe der entsprechenden Meldung zur Anzeige in der App
+                return add_constraints_to_new_attribute(target_table_meta_data, source_table_meta_data, target_attribute_name, source_attribute_name)
+            # Weitergabe auftretender Fehler
+            except Exception as error:
+                raise error
+    finally:
+        invalidate_meta_data_cache(target_engine, target_table_meta_data.table_name)
 
 
 def add_constraints_to_new_attribute(target_table_meta_data:TableMetaData, source_table_meta_data:TableMetaData, target_attribute_name:str, source_attribute_name:str):
@@ -1001,88 +1044,91 @@ def add_constraints_to_new_attribute(target_table_meta_data:TableMetaData, sourc
     escaped_target_attribute = convert_string_if_contains_capitals_or_spaces(target_attribute_name, target_engine.dialect.name)
     data_type_info = source_table_meta_data.data_type_info[source_attribute_name]
     message = ''
-    ### Hinzufügen der NOT-NULL-Constraint, falls das ursprüngliche Attribut eine solche aufweist ###
-    if not data_type_info['is_nullable']:
-        # Überprüfung, ob das Attribut NULL-Werte enthält (MariaDB würde dann beim Hinzufügen der Constraint Werte erzwingen, die nicht NULL sind, und
-        # nur eine Warnung ausgeben)
-        null_count = execute_sql_query(target_engine, text(f'SELECT COUNT(*) FROM {target_table_name} WHERE {escaped_target_attribute} IS NULL')).fetchone()[0]
-        # Falls NULL-Werte vorhanden sind, kann keine NOT-NULL-Constraint hinzugefügt werden, daher wird dies der ausgegebenen Meldung angehängt.
-        if null_count > 0:
-            message = f'Dem Attribut {target_attribute_name} kann keine NOT-NULL-Constraint hinzugefügt werden, da darin NULL-Werte enthalten sind.'
-        else:
-            query = None
-            # Für MariaDB müssen beim Hinzufügen einer NOT-NULL-Constraint alle Attributinformationen wie der Standardwert angegeben werden,
-            # damit diese erhalten bleiben.
-            if target_engine.dialect.name == 'mariadb':
-                data_type = get_full_column_definition_for_mariadb(target_table_meta_data, target_attribute_name)
-                if data_type is not None:
-                    query = f'ALTER TABLE {target_table_name} MODIFY {data_type} NOT NULL'
-            # In PostgreSQL wird das Attribut hingegen nur 'auf NOT NULL gesetzt'.                    
-            elif target_engine.dialect.name == 'postgresql':
-                query = f'ALTER TABLE {target_table_name} ALTER COLUMN {escaped_target_attribute} SET NOT NULL'
-            else:
-                raise DialectError(f'Der SQL-Dialekt {target_engine.dialect.name} wird nicht unterstützt.')
-            try:
-                # Ausführen der Abfrage
-                execute_sql_query(source_engine, text(query), raise_exceptions = True, commit = True)
-            # Treten hierbei Fehler auf, kann keine Constraint hinzugefügt werden.
-            except Exception as error:
-                message = f'Aufgrund eines Fehlers konnte die NOT-NULL-Constraint nicht hinzugefügt werden. {str(error)}'
-            # Anderenfalls wird die Ausgabenachricht zu einer Erfolgsmeldung.
+    # Alle Anweisungen für die Zieltabelle nutzen eine gemeinsame Verbindung und Transaktion. Jede Constraint wird (in PostgreSQL) in einem eigenen
+    # Savepoint hinzugefügt, damit ein Fehlschlag die übrigen Änderungen nicht verhindert.
+    with unit_of_work(target_engine, commit = True, use_savepoints = True):
+        ### Hinzufügen der NOT-NULL-Constraint, falls das ursprüngliche Attribut eine solche aufweist ###
+        if not data_type_info['is_nullable']:
+            # Überprüfung, ob das Attribut NULL-Werte enthält (MariaDB würde dann beim Hinzufügen der Constraint Werte erzwingen, die nicht NULL sind, und
+            # nur eine Warnung ausgeben)
+            null_count = execute_sql_query(target_engine, text(f'SELECT COUNT(*) FROM {target_table_name} WHERE {escaped_target_attribute} IS NULL')).fetchone()[0]
+            # Falls NULL-Werte vorhanden sind, kann keine NOT-NULL-Constraint hinzugefügt werden, daher wird dies der ausgegebenen Meldung angehängt.
+            if null_count > 0:
+                message = f'Dem Attribut {target_attribute_name} kann keine NOT-NULL-Constraint hinzugefügt werden, da darin NULL-Werte enthalten sind.'
             else:
-                message = 'Die NOT-NULL-Constraint konnte erfolgreich hinzugefügt werden.'
+                query = None
+                # Für MariaDB müssen beim Hinzufügen einer NOT-NULL-Constraint alle Attributinformationen wie der Standardwert angegeben werden,
+                # damit diese erhalten bleiben.
+                if target_engine.dialect.name == 'mariadb':
+                    data_type = get_full_column_definition_for_mariadb(target_table_meta_data, target_attribute_name)
+                    if data_type is not None:
+                        query = f'ALTER TABLE {target_table_name} MODIFY {data_type} NOT NULL'
+                # In PostgreSQL wird das Attribut hingegen nur 'auf NOT NULL gesetzt'.                    
+                elif target_engine.dialect.name == 'postgresql':
+                    query = f'ALTER TABLE {target_table_name} ALTER COLUMN {escaped_target_attribute} SET NOT NULL'
+                else:
+                    raise DialectError(f'Der SQL-Dialekt {target_engine.dialect.name} wird nicht unterstützt.')
+                try:
+                    # Ausführen der Abfrage
+                    execute_sql_query(target_engine, text(query), raise_exceptions = True, commit = True)
+                # Treten hierbei Fehler auf, kann keine Constraint hinzugefügt werden.
+                except Exception as error:
+                    message = f'Aufgrund eines Fehlers konnte die NOT-NULL-Constraint nicht hinzugefügt werden. {str(error)}'
+                # Anderenfalls wird die Ausgabenachricht zu einer Erfolgsmeldung.
+                else:
+                    message = 'Die NOT-NULL-Constraint konnte erfolgreich hinzugefügt werden.'
 
-    ### CHECK-Constraints ###
-    if source_engine.dialect.name == 'mariadb':
-        # Abfrage von https://dataedo.com/kb/query/mariadb/list-table-check-constraints, abgewandelt
-        constraint_query = f"SELECT CHECK_CLAUSE, CONSTRAINT_NAME FROM information_schema.check_constraints WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = '{source_table_name}' AND CHECK_CLAUSE LIKE '%\"{source_attribute_name}\"%'"
-    elif source_engine.dialect.name == 'postgresql':
-        escaped_source_attribute = convert_string_if_contains_capitals_or_spaces(source_attribute_name, source_engine.dialect.name)
-        # Abfrage von https://dba.stackexchange.com/questions/214863/how-to-list-all-constraints-of-a-table-in-postgresql User David V McKay, abgewandelt
-        constraint_query = f"SELECT pg_catalog.pg_get_constraintdef(r.oid, true) as condef, conname FROM pg_catalog.pg_constraint r WHERE r.conrelid in ('{source_table_name}'::regclass) AND pg_catalog.pg_get_constraintdef(r.oid, true) LIKE 'CHECK (%{escaped_source_attribute}'"
-    else:
-        raise DialectError(f'Der SQL-Dialekt {source_engine.dialect.name} wird nicht unterstützt.')
-    constraint_result = convert_result_to_list_of_lists(execute_sql_query(source_engine, text(constraint_query)))
-    # Wenn das abgefragte Attribut mindestens eine CHECK-Constraint aufweist, werden diese nacheinander abgearbeitet.
-    if len(constraint_result) > 0:
-        success_counter = 0
-        for row in constraint_result:
-            # Da der Name des Zielattributs von jenem des Quellattributes abweichen kann, werden die Vorkommen des Quellattributes im Ausdruck
-            # für die Constraint-Erstellung und in ihrer Bezeichnung durch den Namen des Zielattributes ersetzt.
-            constraint_string = str(row[0]).replace(source_attribute_name, target_attribute_name)
-            constraint_name = str(row[1]).replace(source_attribute_name, target_attribute_name)
-            # In MariaDB wird bei der Constraint-Abfrage nur der Inhalt der Klammern hinter CHECK ausgegeben, nicht der volle Ausdruck.
-            if not constraint_string.lower().startswith('check'):
-                # Daher wird hier CHECK(...) hinzugefügt, um den Ausdruck zum Einfügen der Constraint in die Zieltabelle verwenden zu können.
-                constraint_string = f'CHECK ({constraint_string})'
-            ### Erstellen und Ausführen der Anweisung für das Hinzufügen der aktuellen CHECK-Constraint
-            add_constraint_query = text(f'ALTER TABLE {target_table_name} ADD CONSTRAINT {constraint_name} {constraint_string}')
-            try:
-                execute_sql_query(target_engine, add_constraint_query, raise_exceptions = True, commit = True)
-            # Fehlermeldungen werden der später ausgegebenen Nachricht angehängt.
-            except Exception as error:
-                message = f'{message} Die Bedingung {constraint_string} konnte aufgrund eines Fehlers nicht hinzugefügt werden: {str(error)}.'
-            # Treten keine Fehler auf, wird der Erfolgszähler um eins erhöht.
-            else:
-                success_counter += 1
-        # Entspricht der Wert des Zählers nach Abschluss der Schleife der Anzahl der CHECK-Constraints für das Attribut, wurden alle CHECK-Constraints
-        # hinzugefügt, sodass dies in der App angezeigt werden kann.
-        if success_counter == len(constraint_result):
-            message = f'{message} Alle {success_counter} CHECK-Constraints konnten erfolgreich hinzugefügt werden.'
-        # Anderenfalls wird angegeben, wie viele Constraints hinzugefügt wurden.
-        elif success_counter != 0:
-            message = f'{message} {success_counter} von {len(constraint_result)} CHECK-Constraints konnten erfolgreich hinzugefügt werden.'
-    # Wurden keine CHECK-Constraints für das Attribut gefunden ...
-    else:
-        # ... und darf das Quellattribut NULL-Werte annehmen, bestehen keine Constraints des Quellattributs, die mit dieser Funktion hinzugefügt werden können.
-        if data_type_info['is_nullable']:
-            # Daher wird eine entsprechende Meldung ausgegeben.
-            return f'Für das Attribut {source_attribute_name} bestehen in der Quelltabelle keine NOT-NULL- oder CHECK-Constraints.'
-        # Darf das Attribut keine NULL-Werte annehmen, besteht hingegen eine NOT-NULL-Constraint, aber keine CHECK-Constraint.
+        ### CHECK-Constraints ###
+        if source_engine.dialect.name == 'mariadb':
+            # Abfrage von https://dataedo.com/kb/query/mariadb/list-table-check-constraints, abgewandelt
+            constraint_query = f"SELECT CHECK_CLAUSE, CONSTRAINT_NAME FROM information_schema.check_constraints WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = '{source_table_name}' AND CHECK_CLAUSE LIKE '%\"{source_attribute_name}\"%'"
+        elif source_engine.dialect.name == 'postgresql':
+            escaped_source_attribute = convert_string_if_contains_capitals_or_spaces(source_attribute_name, source_engine.dialect.name)
+            # Abfrage von https://dba.stackexchange.com/questions/214863/how-to-list-all-constraints-of-a-table-in-postgresql User David V McKay, abgewandelt
+            constraint_query = f"SELECT pg_catalog.pg_get_constraintdef(r.oid, true) as condef, conname FROM pg_catalog.pg_constraint r WHERE r.conrelid in ('{source_table_name}'::regclass) AND pg_catalog.pg_get_constraintdef(r.oid, true) LIKE 'CHECK (%{escaped_source_attribute}'"
+        else:
+            raise DialectError(f'Der SQL-Dialekt {source_engine.dialect.name} wird nicht unterstützt.')
+        constraint_result = convert_result_to_list_of_lists(execute_sql_query(source_engine, text(constraint_query)))
+        # Wenn das abgefragte Attribut mindestens eine CHECK-Constraint aufweist, werden diese nacheinander abgearbeitet.
+        if len(constraint_result) > 0:
+            success_counter = 0
+            for row in constraint_result:
+                # Da der Name des Zielattributs von jenem des Quellattributes abweichen kann, werden die Vorkommen des Quellattributes im Ausdruck
+                # für die Constraint-Erstellung und in ihrer Bezeichnung durch den Namen des Zielattributes ersetzt.
+                constraint_string = str(row[0]).replace(source_attribute_name, target_attribute_name)
+                constraint_name = str(row[1]).replace(source_attribute_name, target_attribute_name)
+                # In MariaDB wird bei der Constraint-Abfrage nur der Inhalt der Klammern hinter CHECK ausgegeben, nicht der volle Ausdruck.
+                if not constraint_string.lower().startswith('check'):
+                    # Daher wird hier CHECK(...) hinzugefügt, um den Ausdruck zum Einfügen der Constraint in die Zieltabelle verwenden zu können.
+                    constraint_string = f'CHECK ({constraint_string})'
+                ### Erstellen und Ausführen der Anweisung für das Hinzufügen der aktuellen CHECK-Constraint
+                add_constraint_query = text(f'ALTER TABLE {target_table_name} ADD CONSTRAINT {constraint_name} {constraint_string}')
+                try:
+                    execute_sql_query(target_engine, add_constraint_query, raise_exceptions = True, commit = True)
+                # Fehlermeldungen werden der später ausgegebenen Nachricht angehängt.
+                except Exception as error:
+                    message = f'{message} Die Bedingung {constraint_string} konnte aufgrund eines Fehlers nicht hinzugefügt werden: {str(error)}.'
+                # Treten keine Fehler auf, wird der Erfolgszähler um eins erhöht.
+                else:
+                    success_counter += 1
+            # Entspricht der Wert des Zählers nach Abschluss der Schleife der Anzahl der CHECK-Constraints für das Attribut, wurden alle CHECK-Constraints
+            # hinzugefügt, sodass dies in der App angezeigt werden kann.
+            if success_counter == len(constraint_result):
+                message = f'{message} Alle {success_counter} CHECK-Constraints konnten erfolgreich hinzugefügt werden.'
+            # Anderenfalls wird angegeben, wie viele Constraints hinzugefügt wurden.
+            elif success_counter != 0:
+                message = f'{message} {success_counter} von {len(constraint_result)} CHECK-Constraints konnten erfolgreich hinzugefügt werden.'
+        # Wurden keine CHECK-Constraints für das Attribut gefunden ...
         else:
-            # Daher wird das Fehlen von CHECK-Constraints in der Meldung erwähnt.
-            message = f'{message} Für das Attribut {source_attribute_name} bestehen in der Quelltabelle keine CHECK-Constraints.'
-    return message
+            # ... und darf das Quellattribut NULL-Werte annehmen, bestehen keine Constraints des Quellattributs, die mit dieser Funktion hinzugefügt werden können.
+            if data_type_info['is_nullable']:
+                # Daher wird eine entsprechende Meldung ausgegeben.
+                return f'Für das Attribut {source_attribute_name} bestehen in der Quelltabelle keine NOT-NULL- oder CHECK-Constraints.'
+            # Darf das Attribut keine NULL-Werte annehmen, besteht hingegen eine NOT-NULL-Constraint, aber keine CHECK-Constraint.
+            else:
+                # Daher wird das Fehlen von CHECK-Constraints in der Meldung erwähnt.
+                message = f'{message} Für das Attribut {source_attribute_name} bestehen in der Quelltabelle keine CHECK-Constraints.'
+        return message
 
 
 def get_full_column_definition_for_mariadb(table_meta_data:TableMetaData, attribute_name:str):
@@ -0,0 +1,57 @@
+import datetime
+from decimal import Decimal
+import pytest
+from model.ResultClasses import ColumnarResult
+
+
+### Festlegen der Fixtures, um sie in den Testfunktionen nutzen zu können, ohne sie mehrfach anzulegen ###
+# Attributnamen des Beispielergebnisses
+@pytest.fixture
+def column_names() -> list[str]:
+    return ['Matrikelnummer', 'Vorname', 'zugelassen', 'Punktzahl', 'Note', 'Pruefungsdatum']
+
+# Tupel des Beispielergebnisses mit NULL-Werten, sich wiederholenden Strings und Datentypen ohne Array-Entsprechung
+@pytest.fixture
+def rows() -> list[list]:
+    return [[1432209, 'Hendrik', True, 87.5, Decimal('1.0'), datetime.date(2024, 7, 15)],
+            [1503456, 'Jessica', False, None, None, None],
+            [2000675, 'Hendrik', None, 42.0, Decimal('4.0'), datetime.date(2024, 7, 15)]]
+
+
+# Test der Speicherung und der Ausgabe als Liste von Listen
+def test_columnar_result(column_names: list[str], rows: list[list]) -> None:
+    result = ColumnarResult.from_rows(column_names, rows)
+    assert len(result) == 3
+    assert result.keys() == column_names
+    # Die Umwandlung in eine Liste von Listen ergibt die ursprünglichen Tupel, ...
+    assert result.tolist() == rows
+    assert result == rows
+    # ... ebenso wie die Iteration über das Ergebnis.
+    assert [row for row in result] == rows
+    # Zugriff auf einzelne Tupel, Slices und Attribute
+    assert result[1] == rows[1]
+    assert result[-1] == rows[2]
+    assert result[0:2] == rows[0:2]
+    assert result.column('Vorname') == ['Hendrik', 'Jessica', 'Hendrik']
+    assert result.column(3) == [87.5, None, 42.0]
+    with pytest.raises(IndexError):
+        result[3]
+    # Strings werden je Spalte nur einmal gespeichert.
+    assert result._dictionaries[1] == ['Hendrik', 'Jessica']
+
+# Test der Umwandlung einer typisierten Spalte, wenn ein Wert nicht zur bisherigen Speicherart passt
+def test_columnar_result_mixed_column() -> None:
+    rows = [[None, 1], [None, 2], ['n. b.', 2 ** 64], [3, None]]
+    result = ColumnarResult.from_rows(['Note', 'Wert'], rows)
+    assert result.tolist() == rows
+    # Tupel können auch ohne bekannte Attributnamen angehängt werden.
+    result = ColumnarResult()
+    for row in rows:
+        result.append(row)
+    assert result == rows
+    assert result.keys() == []
+
+# Test der Ausgabe als JSON
+def test_columnar_result_to_json(column_names: list[str], rows: list[list]) -> None:
+    result = ColumnarResult.from_rows(column_names, rows)
+    assert result.to_json() == '[[1432209, "Hendrik", true, 87.5, "1.0", "2024-07-15"], [1503456, "Jessica", false, null, null, null], [2000675, "Hendrik", null, 42.0, "4.0", "2024-07-15"]]'
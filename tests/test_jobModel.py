@@ -0,0 +1,85 @@
+import threading
+import pytest
+from model.jobModel import cancel_job, get_job, report_job_progress, submit_job
+
+
+# Warten auf das Ende eines Auftrags
+def wait_for_job(job_id: str) -> dict:
+    for _ in range(500):
+        job = get_job(job_id)
+        if job['state'] in ('done', 'failed', 'cancelled'):
+            return job
+        threading.Event().wait(0.01)
+    pytest.fail('Der Auftrag wurde nicht beendet.')
+
+
+# Test der Ausführung eines Auftrags mit Fortschrittsmeldungen
+def test_submit_job() -> None:
+    def count(limit: int, progress = None) -> int:
+        for _ in range(limit):
+            progress()
+        return limit
+    job_id = submit_job('count', count, args = (3,), owner = 'test')
+    job = wait_for_job(job_id)
+    assert job['state'] == 'done'
+    assert job['result'] == 3
+    assert job['progress'] == 3
+    assert 'future' not in job
+    # Aufträge anderer Benutzer werden nicht ausgegeben.
+    assert get_job(job_id, 'anderer') is None
+    assert get_job('unbekannt') is None
+    # Abgeschlossene Aufträge können nicht mehr abgebrochen werden.
+    assert not cancel_job(job_id)
+
+# Test der Speicherung der Fehlermeldung eines fehlgeschlagenen Auftrags
+def test_failed_job() -> None:
+    def fail():
+        raise ValueError('Fehler beim Ersetzen')
+    job = wait_for_job(submit_job('fail', fail))
+    assert job['state'] == 'failed'
+    assert job['error'] == 'Fehler beim Ersetzen'
+    assert job['result'] is None
+
+# Test des Abbruchs eines laufenden Auftrags bei dessen nächster Fortschrittsmeldung
+def test_cancel_job() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    def wait(progress = None):
+        progress()
+        started.set()
+        release.wait(5)
+        progress()
+        return 'nicht abgebrochen'
+    job_id = submit_job('wait', wait, owner = 'test')
+    assert started.wait(5)
+    # Nur der Besitzer kann den Auftrag abbrechen.
+    assert not cancel_job(job_id, 'anderer')
+    assert cancel_job(job_id, 'test')
+    release.set()
+    job = wait_for_job(job_id)
+    assert job['state'] == 'cancelled'
+    assert job['progress'] == 2
+    assert job['result'] is None
+    assert job['error'].startswith('Der Vorgang wurde abgebrochen.')
+    # Fortschrittsmeldungen zu unbekannten Aufträgen werden ignoriert.
+    report_job_progress('unbekannt')
+
+# Test der Übergabe von Stand und Gesamtzahl der Schritte sowie der Kennzeichnung nicht abbrechbarer Aufträge
+def test_job_progress_values_and_cancellable() -> None:
+    def count(progress = None) -> None:
+        progress(2, 4)
+    job = wait_for_job(submit_job('count', count))
+    assert job['cancellable']
+    assert (job['progress'], job['total']) == (2, 4)
+    started = threading.Event()
+    release = threading.Event()
+    def wait() -> None:
+        started.set()
+        release.wait(5)
+    job_id = submit_job('wait', wait, owner = 'test')
+    assert started.wait(5)
+    # Laufende Aufträge ohne Fortschrittsmeldungen können nicht abgebrochen werden.
+    assert not get_job(job_id)['cancellable']
+    assert not cancel_job(job_id, 'test')
+    release.set()
+    assert wait_for_job(job_id)['state'] == 'done'
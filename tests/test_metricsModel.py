@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import create_engine, text
+from model.metricsModel import calculate_percentile, fingerprint_statement, get_query_metrics, register_query_metrics, reset_query_metrics
+
+
+# Test der Erstellung von Anweisungsmustern ohne konkrete Werte
+def test_fingerprint_statement() -> None:
+    assert fingerprint_statement("SELECT * FROM \"Studierende\" WHERE Vorname = 'Hendrik'   AND Punktzahl > 42.5") == 'SELECT * FROM "Studierende" WHERE Vorname = ? AND Punktzahl > ?'
+    # Zahlen in Namen und Platzhalter bleiben erhalten.
+    assert fingerprint_statement('SELECT * FROM Vorlesung_Datenbanken_SS2023 WHERE Matrikelnummer = :value_0 LIMIT 10') == 'SELECT * FROM Vorlesung_Datenbanken_SS2023 WHERE Matrikelnummer = :value_0 LIMIT ?'
+
+# Test der Perzentilberechnung
+def test_calculate_percentile() -> None:
+    values = [float(value) for value in range(1, 101)]
+    assert calculate_percentile(values, 50) == 50.0
+    assert calculate_percentile(values, 95) == 95.0
+    assert calculate_percentile(values, 99) == 99.0
+    assert calculate_percentile([3.0], 99) == 3.0
+    assert calculate_percentile([], 50) is None
+
+# Test der Erfassung über die Event-Hooks einer Engine (mit SQLite, da hierfür keine Datenbankverbindung zu MariaDB oder PostgreSQL nötig ist)
+def test_register_query_metrics() -> None:
+    engine = create_engine('sqlite://')
+    register_query_metrics(engine)
+    # Eine zweite Registrierung führt nicht zur doppelten Erfassung.
+    register_query_metrics(engine)
+    reset_query_metrics()
+    with engine.connect() as connection:
+        for value in (1, 2, 3):
+            connection.execute(text(f'SELECT {value}'))
+    metrics = get_query_metrics()
+    assert len(metrics) == 1
+    assert metrics[0]['statement'] == 'SELECT ?'
+    assert metrics[0]['count'] == 3
+    assert metrics[0]['function'] == 'unbekannt'
+    assert metrics[0]['p50_ms'] <= metrics[0]['p99_ms']
+    reset_query_metrics()
+    assert get_query_metrics() == []
@@ -5,7 +5,7 @@ from sqlalchemy import Engine, create_engine, text
 from ControllerClasses import TableMetaData
 from model.SQLDatabaseError import DialectError
 from model.databaseModel import convert_result_to_list_of_lists, convert_string_if_contains_capitals_or_spaces, execute_sql_query, get_data_type_meta_data, get_primary_key_from_engine, get_row_count_from_engine
-from model.twoTablesModel import add_constraints_to_new_attribute, build_query_to_add_column, check_arguments_for_joining, check_basic_data_type_compatibility, force_cast_and_match, get_full_column_definition_for_mariadb, join_tables_of_different_dialects_dbs_or_servers, join_tables_of_same_dialect_on_same_server, list_attributes_to_select, simulate_merge_and_build_query
+from model.twoTablesModel import add_constraints_to_new_attribute, build_query_to_add_column, check_arguments_for_joining, check_basic_data_type_compatibility, force_cast_and_match, get_full_column_definition_for_mariadb, iterate_rows_of_batches, join_tables_of_different_dialects_dbs_or_servers, join_tables_of_same_dialect_on_same_server, list_attributes_to_select, simulate_merge_and_build_query
 import urllib.parse
 # Anpassung der PATH-Variable, damit die Umgebungsvariablen aus environmentVariables.py eingelesen werden können
 sys.path.append('tests')
@@ -188,6 +188,12 @@ def test_join_tables_of_different_dialects(pg_table_meta_data_2: TableMetaData,
     # Sicherstellung, dass das Abfrageergebnis die erwartete Form hat
     assert table_result == [[0, False, 1869972], [15, False, 1912967], [200, True, 1938205], [25, False, 1972793], [120, False, 2021596], [100, False, 2076750], [54, False, 2120434], [75, False, 2192140], [200, True, 2256812], [210, True, 2261095], [168, False, 2262911], [150, False, 2302766], [210, True, 2320350], [175, True, 2453099], [63, False, 2454294], [97, False, 2507172], [167, True, 2510983], [233, True, 2643692], [75, False, 2695599], [75, False, 2703748], [85, False, 2752103], [0, False, 2814068], [200, True, 2834378], [100, False, 2838526], [132, False, 2885172], [128, False, 2929136], [80, False, 2985690], [65, False, 3078691], [142, False, 3609446], [200, True, 3763593], [175, True, 5181568]]
 
+# Test der Einzelausgabe blockweise gelesener Tupel mit Kennzeichnung des letzten Tupels
+def test_iterate_rows_of_batches() -> None:
+    assert list(iterate_rows_of_batches([[[1], [2]], [], [[3]]])) == [([1], False), ([2], False), ([3], True)]
+    # Ohne Tupel wird nichts ausgegeben.
+    assert list(iterate_rows_of_batches([[], []])) == []
+
 # Test der Funktion zum Erzwingen von Typkonversionen bei Joins zwischen verschiedenen Dialekten bzw. Tabellen, die nicht in einer gemeinsamen 
 # Abfrage miteinander verbunden werden können
 def test_force_cast_and_match() -> None:
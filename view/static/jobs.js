@@ -0,0 +1,62 @@
+// Zeitabstand in Millisekunden zwischen zwei Abfragen des Auftragszustands
+const jobPollInterval = 1000;
+
+// Funktion für die regelmäßige Abfrage des Zustands eines Hintergrundauftrags über die unter jobUrl erreichbare Route. Der Fortschritt wird im
+// Element mit der ID infoId angezeigt; nach dem Ende des Auftrags erfolgt eine Weiterleitung zu resultUrl, wo das Ergebnis angezeigt wird.
+// Für Aufträge, die nicht abgebrochen werden können, sind cancelUrl null und kein Abbrechen-Button vorhanden.
+function pollJob(jobUrl, cancelUrl, resultUrl, infoId, cancelButtonId) {
+    const info = document.getElementById(infoId);
+    const cancelButton = document.getElementById(cancelButtonId);
+
+    function poll() {
+        fetch(jobUrl)
+            .then(response => response.json())
+            .then(job => {
+                if ('error' in job && !('state' in job)) {
+                    info.textContent = job.error;
+                    return;
+                }
+                // Abgeschlossene Aufträge (auch fehlgeschlagene und abgebrochene) werden auf der Ergebnisseite ausgewertet.
+                if (['done', 'failed', 'cancelled'].includes(job.state)) {
+                    window.location.href = resultUrl;
+                    return;
+                }
+                if (job.state === 'pending') {
+                    info.textContent = 'Der Vorgang wartet auf seine Ausführung ...';
+                } else if (job.total !== null) {
+                    // Die Gesamtzahl kann geschätzt sein, sodass der Anteil auf 100 % begrenzt wird.
+                    const percentage = Math.min(Math.round(job.progress / job.total * 100), 100);
+                    info.textContent = `Fortschritt: ${job.progress} von ${job.total} (${percentage} %)`;
+                } else if (job.progress > 0) {
+                    info.textContent = `Fortschritt: ${job.progress} Abschnitte gespeichert`;
+                } else {
+                    info.textContent = 'Der Vorgang läuft ...';
+                }
+                setTimeout(poll, jobPollInterval);
+            })
+            .catch(() => {
+                // Bei Verbindungsfehlern wird die Abfrage später wiederholt.
+                info.textContent = 'Der Zustand des Vorgangs konnte nicht abgefragt werden.';
+                setTimeout(poll, jobPollInterval);
+            });
+    }
+
+    // Bei Klick auf den Abbrechen-Button wird der Abbruch des Auftrags angefordert; bereits gespeicherte Abschnitte bleiben erhalten.
+    if (cancelUrl !== null && cancelButton !== null) {
+        cancelButton.addEventListener('click', function () {
+            if (!confirm('Sind Sie sicher, dass Sie den Vorgang abbrechen wollen? Bereits gespeicherte Änderungen bleiben erhalten.')) {
+                return;
+            }
+            cancelButton.disabled = true;
+            fetch(cancelUrl, { method: 'POST' })
+                .then(response => response.json())
+                .then(result => {
+                    if (!result.cancel_requested) {
+                        info.textContent = 'Der Vorgang kann nicht mehr abgebrochen werden.';
+                    }
+                });
+        });
+    }
+
+    poll();
+}
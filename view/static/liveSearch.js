@@ -0,0 +1,63 @@
+// Wartezeit in Millisekunden nach der letzten Eingabe, bevor die Suche ausgeführt wird
+const liveSearchDelay = 300;
+
+// Funktion für die Suche während der Eingabe: Nach jeder Eingabepause werden die Treffer über die unter liveSearchUrl erreichbare Route bezogen
+// und anstelle der bisherigen Tabelle angezeigt. Noch laufende Anfragen für ältere Eingaben werden dabei abgebrochen.
+function startLiveSearch(inputId, columnSelectId, liveSearchUrl, fullTableUrl, columnList, tableId, infoId) {
+    const input = document.getElementById(inputId);
+    const columnSelect = document.getElementById(columnSelectId);
+    const info = document.getElementById(infoId);
+    let timer = null;
+    let controller = null;
+
+    function search() {
+        // Abbruch einer noch laufenden Anfrage für eine ältere Eingabe
+        if (controller !== null) {
+            controller.abort();
+        }
+        const matchCount = document.getElementById('match-count');
+        if (matchCount !== null) {
+            matchCount.remove();
+        }
+        // Vor jeder Neuanzeige wird die bisherige Tabelle entfernt.
+        document.getElementById(tableId).innerHTML = '';
+        // Ist der Suchstring leer, wird die volle Tabelle seitenweise angezeigt.
+        if (input.value === '') {
+            info.textContent = '';
+            showServerTable(columnList, fullTableUrl, tableId);
+            return;
+        }
+        controller = new AbortController();
+        const url = `${liveSearchUrl}?search=${encodeURIComponent(input.value)}&column=${encodeURIComponent(columnSelect.value)}`;
+        fetch(url, { signal: controller.signal })
+            .then(response => response.json())
+            .then(result => {
+                if ('error' in result) {
+                    info.textContent = result.error;
+                    return;
+                }
+                // Bei gekürztem Ergebnis wird auf die vollständige Suche über den Button hingewiesen.
+                if (result.complete) {
+                    info.textContent = `${result.rows.length} Treffer`;
+                } else {
+                    info.textContent = `Mehr als ${result.rows.length} Treffer. Für die Anzeige aller Treffer bitte auf 'Suchen' klicken.`;
+                }
+                showTable(columnList, result.rows, tableId);
+            })
+            .catch(error => {
+                // Abgebrochene Anfragen werden ignoriert.
+                if (error.name !== 'AbortError') {
+                    info.textContent = 'Beim Einlesen der Daten ist ein Fehler aufgetreten.';
+                }
+            });
+    }
+
+    // Die Suche wird erst nach einer Eingabepause ausgeführt, damit nicht jeder Tastendruck eine Anfrage auslöst.
+    function scheduleSearch() {
+        clearTimeout(timer);
+        timer = setTimeout(search, liveSearchDelay);
+    }
+
+    input.addEventListener('input', scheduleSearch);
+    columnSelect.addEventListener('change', scheduleSearch);
+}
@@ -25,4 +25,79 @@ function showTable(columnList, data, tableId) {
             error: 'Beim Einlesen der Daten ist ein Fehler aufgetreten.',
         }
     }).render(document.getElementById(tableId));
+}
+
+// Funktion zur Anzeige der Grid.js-Tabellen im Server-Modus: Die Tupel werden seitenweise von der unter dataUrl erreichbaren Route bezogen 
+// (Keyset-Paginierung über den Primärschlüssel, serverseitige Sortierung), statt die vollständige Tabelle in die Seite einzubetten.
+function showServerTable(columnList, dataUrl, tableId) {
+    // Schlüssel des letzten Tupels je bereits geladener Seite, getrennt nach Sortierung; ...
+    const lastKeys = {};
+    // ... die aktuelle Sortierung als URL-Parameter und die zuletzt angefragte Seite
+    let sortParams = '';
+    let requestedPage = 0;
+    new gridjs.Grid({
+        columns: columnList,
+        search: false,
+        server: {
+            url: dataUrl,
+            then: result => {
+                // Speichern des Schlüssels für die Abfrage der Folgeseite
+                if (!(sortParams in lastKeys)) {
+                    lastKeys[sortParams] = {};
+                }
+                lastKeys[sortParams][requestedPage] = result.last_key;
+                return result.rows;
+            },
+            total: result => result.total
+        },
+        sort: {
+            multiColumn: false,
+            server: {
+                url: (prev, columns) => {
+                    sortParams = '';
+                    if (columns.length > 0) {
+                        const direction = columns[0].direction === 1 ? 'asc' : 'desc';
+                        sortParams = `sort=${columns[0].index}&order=${direction}`;
+                        return `${prev}${prev.includes('?') ? '&' : '?'}${sortParams}`;
+                    }
+                    return prev;
+                }
+            }
+        },
+        pagination: {
+            limit: 10,
+            server: {
+                url: (prev, page, limit) => {
+                    requestedPage = page;
+                    const separator = prev.includes('?') ? '&' : '?';
+                    const previousKeys = lastKeys[sortParams] || {};
+                    // Ist der Schlüssel des letzten Tupels der vorigen Seite bekannt, wird per Keyset weitergeblättert (der Offset wird dabei 
+                    // nur für die Berechnung der Gesamtzahl bei noch nicht abgeschlossener Trefferzählung mitgegeben), ...
+                    if (page > 0 && previousKeys[page - 1] != null) {
+                        return `${prev}${separator}limit=${limit}&offset=${page * limit}&last=${encodeURIComponent(JSON.stringify(previousKeys[page - 1]))}`;
+                    }
+                    // ... anderenfalls (erste Seite, Sprung auf entfernte Seiten, NULL-Werte im Sortierattribut) über OFFSET.
+                    return `${prev}${separator}limit=${limit}&offset=${page * limit}`;
+                }
+            }
+        },
+        language: {
+            'search': {
+                'placeholder': '🔍 Suche...'
+            },
+            'pagination': {
+                'previous': 'Vorige',
+                'next': 'Nächste',
+                navigate: (page, pages) => `Seite ${page} von ${pages}`,
+                page: (page) => `Seite ${page}`,
+                'showing': 'Zeige',
+                of: 'von',
+                to: 'bis',
+                'results': () => 'Einträgen'
+            },
+            loading: 'Lade...',
+            noRecordsFound: 'Keine passenden Einträge gefunden',
+            error: 'Beim Einlesen der Daten ist ein Fehler aufgetreten.',
+        }
+    }).render(document.getElementById(tableId));
 }
\ No newline at end of file